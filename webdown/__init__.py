@@ -105,7 +105,12 @@ from webdown import cli
 
 # Import key classes and functions for easy access
 from webdown.config import DocumentOptions, OutputFormat, WebdownConfig, WebdownError
-from webdown.converter import convert_file, convert_url, html_to_markdown
+from webdown.converter import (
+    convert_file,
+    convert_url,
+    convert_urls,
+    html_to_markdown,
+)
 from webdown.crawler import CrawlerConfig, crawl, crawl_from_sitemap
 from webdown.error_utils import ErrorCode
 from webdown.html_parser import fetch_url, read_html_file
@@ -122,6 +127,7 @@ __all__ = [
     "WebdownError",
     # Single-page conversion
     "convert_url",
+    "convert_urls",
     "convert_file",
     "fetch_url",
     "read_html_file",
@@ -65,8 +65,8 @@ The CLI offers various options to customize the conversion:
 * `-V, --version`: Show version information and exit
 * `-h, --help`: Show help message and exit
 
-Note: For large web pages (over 10MB), webdown automatically uses streaming mode
-to optimize memory usage.
+Note: Web pages are converted as they download, so memory usage stays low even
+for very large pages.
 
 
 ## Claude XML Options
@@ -107,7 +107,7 @@ Options for generating Claude XML format, optimized for use with Claude AI:
    webdown -u https://example.com -s "#content" -o output.md
    ```
 
-6. Process a large webpage with progress bar (streaming is automatic for large pages):
+6. Process a large webpage with progress bar:
    ```bash
    webdown -u https://example.com -p
    ```
@@ -400,7 +400,7 @@ def _add_crawl_subcommand(
         type=float,
         default=1.0,
         metavar="SECONDS",
-        help="Delay between requests in seconds (default: 1.0)",
+        help="Delay between requests to the same host in seconds (default: 1.0)",
     )
     crawl_group.add_argument(
         "--same-domain",
@@ -419,6 +419,18 @@ def _add_crawl_subcommand(
         metavar="N",
         help="Maximum number of pages to crawl (0 for unlimited)",
     )
+    crawl_group.add_argument(
+        "--max-concurrent",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Maximum number of pages fetched at the same time (default: 1)",
+    )
+    crawl_group.add_argument(
+        "--checkpoint",
+        metavar="FILE",
+        help="Record completed pages in FILE and skip them when resuming",
+    )
     crawl_group.add_argument(
         "-q",
         "--quiet",
@@ -595,6 +607,8 @@ def _execute_crawl(parsed_args: argparse.Namespace) -> int:
         conversion_config=conversion_config,
         verbose=not parsed_args.quiet,
         max_pages=parsed_args.max_pages,
+        max_concurrent=parsed_args.max_concurrent,
+        checkpoint_path=parsed_args.checkpoint,
     )
 
     # Execute crawl
@@ -11,11 +11,15 @@ The conversion process involves multiple steps:
 Key functions:
 - convert_url: Convert web content to Markdown or XML
 - convert_file: Convert local HTML file to Markdown or XML
+- convert_urls: Convert several web pages concurrently
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable
+
 from webdown.config import DocumentOptions, OutputFormat, WebdownConfig, WebdownError
-from webdown.html_parser import _check_streaming_needed, fetch_url, read_html_file
-from webdown.markdown_converter import html_to_markdown
+from webdown.html_parser import fetch_url, fetch_url_chunks, read_html_file
+from webdown.markdown_converter import html_chunks_to_markdown, html_to_markdown
 from webdown.validation import validate_css_selector, validate_url
 from webdown.xml_converter import markdown_to_claude_xml
 
@@ -31,6 +35,7 @@ __all__ = [
     "html_to_markdown",
     "markdown_to_claude_xml",
     "convert_url",
+    "convert_urls",
     "convert_file",
 ]
 
@@ -136,7 +141,8 @@ def convert_url(url_or_config: str | WebdownConfig) -> str:
     If a URL string is provided, it will be used to create a WebdownConfig object
     with default settings (Markdown output).
 
-    For large web pages (over 10MB), streaming mode is automatically used.
+    The page is converted as it downloads, so large pages are never held in
+    memory in full.
 
     Args:
         url_or_config: URL of the web page or a WebdownConfig object
@@ -174,14 +180,10 @@ def convert_url(url_or_config: str | WebdownConfig) -> str:
     assert url is not None
 
     try:
-        # Perform streaming check for large documents
-        _check_streaming_needed(url)
-
-        # Fetch the HTML content (URL already validated)
-        html = fetch_url(url, show_progress=config.show_progress)
-
-        # Convert HTML to Markdown
-        markdown = html_to_markdown(html, config)
+        # The page is converted as it downloads from a single GET request, so
+        # the full HTML is never held in memory and no size probe is needed
+        chunks = fetch_url_chunks(url, show_progress=config.show_progress)
+        markdown = html_chunks_to_markdown(chunks, config)
 
         # Convert to requested output format
         if config.format == OutputFormat.CLAUDE_XML:
@@ -203,6 +205,37 @@ def convert_url(url_or_config: str | WebdownConfig) -> str:
         )
 
 
+def convert_urls(
+    urls_or_configs: Iterable[str | WebdownConfig], max_workers: int = 8
+) -> list[str]:
+    """Convert several web pages concurrently.
+
+    Each page is converted exactly as by convert_url. Fetching is dominated
+    by network latency, so the pages are processed on a thread pool and
+    their round trips overlap instead of adding up.
+
+    Args:
+        urls_or_configs: URLs or WebdownConfig objects, one per page
+        max_workers: Maximum number of pages converted at the same time
+
+    Returns:
+        Converted content for each page, in the same order as the input
+
+    Raises:
+        WebdownError: If any URL is invalid or cannot be fetched. The error
+                     for the earliest failing page in input order is raised.
+
+    Examples:
+        # Convert a documentation set to Markdown
+        pages = convert_urls([
+            "https://example.com/docs/intro",
+            "https://example.com/docs/usage",
+        ])
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(convert_url, urls_or_configs))
+
+
 def convert_file(file_path_or_config: str | WebdownConfig) -> str:
     """Convert a local HTML file to the specified output format.
 
@@ -5,21 +5,35 @@ users to crawl multiple pages from a website and convert them to Markdown
 or Claude XML format.
 """
 
+import threading
 import time
 from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import partial
+from typing import Callable
+
+import requests
+from requests.adapters import DEFAULT_POOLSIZE, HTTPAdapter
+from urllib3.response import BaseHTTPResponse
+from urllib3.util.retry import Retry
 
 from webdown.config import OutputFormat, WebdownConfig, WebdownError
-from webdown.converter import convert_url
+from webdown.error_utils import ErrorCode
+from webdown.html_parser import fetch_url
 from webdown.link_extractor import (
     ScopeType,
-    extract_links,
+    cached_urlparse,
+    extract_and_filter_links,
     filter_links_by_scope,
     normalize_url,
     parse_sitemap,
 )
+from webdown.markdown_converter import make_converter
 from webdown.output_manager import (
+    BackgroundWriter,
+    CrawlCheckpoint,
     CrawledPage,
     CrawlResult,
     get_relative_path,
@@ -27,7 +41,7 @@ from webdown.output_manager import (
     write_manifest,
     write_output_file,
 )
-from webdown.xml_converter import extract_markdown_title
+from webdown.xml_converter import extract_markdown_title, markdown_to_claude_xml
 
 
 @dataclass
@@ -38,12 +52,18 @@ class CrawlerConfig:
         seed_urls: List of URLs to start crawling from.
         output_dir: Directory to save converted files.
         max_depth: Maximum link depth from seed URLs (default: 3).
-        delay_seconds: Delay between requests in seconds (default: 1.0).
+        delay_seconds: Minimum delay between requests to the same host in
+            seconds (default: 1.0).
         scope: Type of scope filtering to apply (default: SAME_SUBDOMAIN).
         path_prefix: Optional path prefix for PATH_PREFIX scope.
         conversion_config: Configuration for page conversion.
         verbose: Whether to print progress messages.
         max_pages: Maximum number of pages to crawl (0 for unlimited).
+        max_concurrent: Maximum number of pages fetched at the same time
+            (default: 1).
+        checkpoint_path: Optional path of a checkpoint file recording
+            completed pages. Rerunning a crawl with the same settings and
+            checkpoint skips the pages it lists instead of fetching them again.
     """
 
     seed_urls: list[str]
@@ -55,14 +75,101 @@ class CrawlerConfig:
     conversion_config: WebdownConfig = field(default_factory=WebdownConfig)
     verbose: bool = True
     max_pages: int = 0
+    max_concurrent: int = 1
+    checkpoint_path: str | None = None
+
+
+# Longest wait honored from a Retry-After header, and longest backoff
+_MAX_RETRY_WAIT = 30.0
+
+
+class _BoundedRetry(Retry):
+    """Retry policy that caps the wait requested by a Retry-After header.
+
+    urllib3 sleeps for whatever Retry-After asks, so a single 429 or 503
+    response could otherwise stall a fetching thread indefinitely.
+    """
+
+    def get_retry_after(self, response: BaseHTTPResponse) -> float | None:
+        """Return the Retry-After wait in seconds, capped at _MAX_RETRY_WAIT."""
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, _MAX_RETRY_WAIT)
+
+
+# Retries for transient server errors, with exponential backoff between
+# attempts; a Retry-After header on 429/503 responses takes precedence.
+# Both waits are capped at _MAX_RETRY_WAIT seconds
+_RETRY = _BoundedRetry(
+    total=5,
+    backoff_factor=0.5,
+    backoff_max=_MAX_RETRY_WAIT,
+    status_forcelist=(429, 500, 502, 503, 504),
+    raise_on_status=False,
+)
+
+
+class _HostThrottle:
+    """Space requests to the same host by the crawl delay.
+
+    Requests to different hosts are not delayed by each other, so a crawl
+    spanning several hosts is not slowed to the pace of a single host.
+    Safe to use from several fetching threads.
+    """
+
+    def __init__(self, delay_seconds: float) -> None:
+        """Initialize the throttle.
+
+        Args:
+            delay_seconds: Minimum time between request starts per host.
+        """
+        self._delay = delay_seconds
+        self._lock = threading.Lock()
+        self._next_start: dict[str, float] = {}
+
+    def wait(self, url: str) -> None:
+        """Block until a request to the URL's host may start.
+
+        Args:
+            url: The URL about to be requested.
+        """
+        if self._delay <= 0:
+            return
+
+        host = cached_urlparse(url).netloc
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_start.get(host, now))
+            self._next_start[host] = start + self._delay
+        if start > now:
+            time.sleep(start - now)
+
+
+@dataclass
+class _CrawlContext:
+    """Per-crawl helpers shared by every page conversion.
+
+    Attributes:
+        convert_page: Function fetching a URL and returning its HTML and its
+            conversion to the configured output format.
+        writer: Background writer for output files, or None to write
+            synchronously.
+        checkpoint: Checkpoint that successful pages are recorded in once
+            their output file has been written, or None.
+    """
+
+    convert_page: Callable[[str], tuple[str, str]]
+    writer: BackgroundWriter | None = None
+    checkpoint: CrawlCheckpoint | None = None
 
 
 def crawl(config: CrawlerConfig) -> CrawlResult:
     """Execute a crawl operation starting from seed URLs.
 
     Uses breadth-first search to discover and convert pages within the
-    configured scope. Respects rate limiting with configurable delays
-    between requests.
+    configured scope. Respects rate limiting with a configurable delay
+    between requests to the same host.
 
     Args:
         config: Configuration for the crawl operation.
@@ -71,61 +178,206 @@ def crawl(config: CrawlerConfig) -> CrawlResult:
         CrawlResult containing metadata for all crawled pages.
 
     Raises:
-        WebdownError: If the output directory cannot be created or accessed.
+        WebdownError: If the conversion options are invalid, or if the output
+            directory cannot be created or accessed.
     """
-    result = CrawlResult(
-        start_time=datetime.now(),
-        seed_urls=config.seed_urls.copy(),
-        max_depth=config.max_depth,
-        output_format=config.conversion_config.format.name.lower(),
-    )
+    with _make_session(config) as session:
+        convert_page = _make_page_converter(config, session)
+        result = CrawlResult(
+            start_time=datetime.now(),
+            seed_urls=config.seed_urls.copy(),
+            max_depth=config.max_depth,
+            output_format=config.conversion_config.format.name.lower(),
+        )
+
+        visited: set[int] = set()
+        queue: deque[tuple[str, int]] = deque()
+
+        for seed_url in config.seed_urls:
+            if _mark_visited(normalize_url(seed_url), visited):
+                queue.append((seed_url, 0))
+
+        pages_crawled = 0
+
+        # The checkpoint is entered first so it is still open while the writer
+        # flushes its last writes, which record their pages in it
+        with (
+            CrawlCheckpoint(config.checkpoint_path) as checkpoint,
+            BackgroundWriter() as writer,
+            ThreadPoolExecutor(max_workers=max(1, config.max_concurrent)) as pool,
+        ):
+            context = _CrawlContext(convert_page, writer, checkpoint)
+            throttle = _HostThrottle(config.delay_seconds)
+
+            def visit(item: tuple[str, int]) -> tuple[CrawledPage, dict[str, str]]:
+                url, depth = item
+                throttle.wait(url)
+                links: dict[str, str] = {}
+                page = _crawl_single_page(
+                    url,
+                    depth,
+                    config,
+                    result,
+                    context,
+                    links=links if depth < config.max_depth else None,
+                )
+                return page, links
+
+            while queue:
+                if config.max_pages > 0 and pages_crawled >= config.max_pages:
+                    if config.verbose:
+                        print(f"Reached maximum page limit ({config.max_pages})")
+                    break
+
+                batch = _next_batch(queue, config, pages_crawled)
+                pending = [
+                    item for item in batch if checkpoint.restore(item[0]) is None
+                ]
+                fetched = pool.map(visit, pending)
+
+                # Pages of a batch are fetched concurrently, but their results
+                # are recorded in queue order, so the crawl order is the same as
+                # a sequential breadth-first crawl
+                for url, depth in batch:
+                    restored = checkpoint.restore(url)
+                    if restored is None:
+                        page, links = next(fetched)
+                    else:
+                        page = restored[0]
+                        links = {normalize_url(link): link for link in restored[1]}
+
+                    result.pages.append(page)
+                    pages_crawled += 1
+
+                    if config.verbose:
+                        status_char = "+" if page.status == "success" else "!"
+                        print(f"[{status_char}] {url}")
+
+                    for normalized, link in links.items():
+                        if _mark_visited(normalized, visited):
+                            queue.append((link, depth + 1))
+
+    _record_write_failures(result, writer.failures, config.output_dir)
+    result.end_time = datetime.now()
 
-    visited: set[str] = set()
-    queue: deque[tuple[str, int]] = deque()
+    manifest_path = write_manifest(result, config.output_dir)
+    if config.verbose:
+        print(f"\nCrawl complete: {result.successful_count} pages saved")
+        print(f"Manifest written to: {manifest_path}")
 
-    for seed_url in config.seed_urls:
-        normalized = normalize_url(seed_url)
-        if normalized not in visited:
-            queue.append((seed_url, 0))
-            visited.add(normalized)
+    return result
 
-    pages_crawled = 0
 
-    while queue:
-        if config.max_pages > 0 and pages_crawled >= config.max_pages:
-            if config.verbose:
-                print(f"Reached maximum page limit ({config.max_pages})")
-            break
+def _next_batch(
+    queue: deque[tuple[str, int]], config: CrawlerConfig, pages_crawled: int
+) -> list[tuple[str, int]]:
+    """Take the next pages to crawl concurrently from the queue.
 
+    Args:
+        queue: Pending (url, depth) pairs in breadth-first order.
+        config: The crawler configuration.
+        pages_crawled: Number of pages crawled so far.
+
+    Returns:
+        Up to config.max_concurrent (url, depth) pairs within the depth and
+        page limits. Entries deeper than max_depth are dropped.
+    """
+    size = max(1, config.max_concurrent)
+    if config.max_pages > 0:
+        size = min(size, config.max_pages - pages_crawled)
+
+    batch: list[tuple[str, int]] = []
+    while queue and len(batch) < size:
         url, depth = queue.popleft()
+        if depth <= config.max_depth:
+            batch.append((url, depth))
+    return batch
 
-        if depth > config.max_depth:
-            continue
 
-        page = _crawl_single_page(url, depth, config, result)
-        result.pages.append(page)
-        pages_crawled += 1
+def _mark_visited(normalized_url: str, visited: set[int]) -> bool:
+    """Record a URL as visited, returning whether it was new.
 
-        if config.verbose:
-            status_char = "+" if page.status == "success" else "!"
-            print(f"[{status_char}] {url}")
+    Only the hash of the normalized URL is stored, so memory per entry stays
+    constant regardless of URL length. A 64-bit hash collision would cause a
+    page to be skipped, which is negligible for any realistic crawl size.
 
-        if page.status == "success" and depth < config.max_depth:
-            new_links = _discover_links(url, page, config, visited)
-            for link in new_links:
-                queue.append((link, depth + 1))
+    Args:
+        normalized_url: The URL to record, as returned by normalize_url.
+        visited: Set of hashes of already-visited normalized URLs.
 
-        if queue and config.delay_seconds > 0:
-            time.sleep(config.delay_seconds)
+    Returns:
+        True if the URL had not been visited before, False otherwise.
+    """
+    key = hash(normalized_url)
+    if key in visited:
+        return False
+    visited.add(key)
+    return True
 
-    result.end_time = datetime.now()
 
-    manifest_path = write_manifest(result, config.output_dir)
-    if config.verbose:
-        print(f"\nCrawl complete: {result.successful_count} pages saved")
-        print(f"Manifest written to: {manifest_path}")
+def _make_session(config: CrawlerConfig) -> requests.Session:
+    """Create the HTTP session shared by every fetch of a crawl.
 
-    return result
+    The connection pool per host is made large enough for all concurrent
+    fetches, so connections are kept alive instead of being discarded when
+    more pages are in flight than the default pool holds. Transient server
+    errors are retried with exponential backoff.
+
+    Args:
+        config: The crawler configuration.
+
+    Returns:
+        A new session.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_maxsize=max(DEFAULT_POOLSIZE, config.max_concurrent),
+        max_retries=_RETRY,
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def _make_page_converter(
+    config: CrawlerConfig, session: requests.Session | None = None
+) -> Callable[[str], tuple[str, str]]:
+    """Build the function that fetches and converts pages for a crawl.
+
+    The conversion options are validated and specialized once, instead of
+    building and validating a new configuration for every page.
+
+    Args:
+        config: The crawler configuration.
+        session: Session shared by every fetch of the crawl, so connections
+            to the same host are kept alive. If None, each fetch makes a
+            one-off request.
+
+    Returns:
+        Function fetching a URL and returning its HTML and converted content.
+
+    Raises:
+        WebdownError: If the conversion options are invalid.
+    """
+    conversion_config = config.conversion_config
+    try:
+        to_markdown = make_converter(conversion_config)
+    except ValueError as e:
+        raise WebdownError(str(e), code=ErrorCode.CSS_SELECTOR_INVALID) from e
+
+    output_format = conversion_config.format
+    include_metadata = conversion_config.document_options.include_metadata
+
+    def convert_page(url: str) -> tuple[str, str]:
+        html = fetch_url(url, show_progress=False, session=session)
+        markdown = to_markdown(html)
+        if output_format == OutputFormat.CLAUDE_XML:
+            return html, markdown_to_claude_xml(
+                markdown, source_url=url, include_metadata=include_metadata
+            )
+        return html, markdown
+
+    return convert_page
 
 
 def _crawl_single_page(
@@ -133,6 +385,8 @@ def _crawl_single_page(
     depth: int,
     config: CrawlerConfig,
     result: CrawlResult,
+    context: _CrawlContext | None = None,
+    links: dict[str, str] | None = None,
 ) -> CrawledPage:
     """Crawl and convert a single page.
 
@@ -141,6 +395,11 @@ def _crawl_single_page(
         depth: The current crawl depth.
         config: The crawler configuration.
         result: The crawl result to update.
+        context: Shared per-crawl helpers. If None, a converter is built for
+            this page and the output file is written synchronously.
+        links: If given and the page is crawled successfully, filled with
+            the page's in-scope links (see _find_link_candidates), taken
+            from the same download as the converted content.
 
     Returns:
         CrawledPage with the crawl metadata.
@@ -151,17 +410,10 @@ def _crawl_single_page(
     relative_path = get_relative_path(output_path, config.output_dir)
 
     try:
-        page_config = WebdownConfig(
-            url=url,
-            css_selector=config.conversion_config.css_selector,
-            include_links=config.conversion_config.include_links,
-            include_images=config.conversion_config.include_images,
-            format=config.conversion_config.format,
-            document_options=config.conversion_config.document_options,
-            show_progress=False,
-        )
+        if context is None:
+            context = _CrawlContext(_make_page_converter(config))
 
-        content = convert_url(page_config)
+        html, content = context.convert_page(url)
 
         title = None
         if config.conversion_config.format == OutputFormat.MARKDOWN:
@@ -169,9 +421,10 @@ def _crawl_single_page(
         elif config.conversion_config.format == OutputFormat.CLAUDE_XML:
             title = _extract_xml_title(content)
 
-        write_output_file(output_path, content)
+        if links is not None:
+            links.update(_find_link_candidates(url, html, config))
 
-        return CrawledPage(
+        page = CrawledPage(
             url=url,
             output_path=relative_path,
             title=title,
@@ -180,6 +433,23 @@ def _crawl_single_page(
             status="success",
         )
 
+        # The page is only checkpointed once its file is on disk, so a failed
+        # or interrupted write is retried when the crawl is resumed
+        on_written = None
+        if context.checkpoint is not None:
+            on_written = partial(
+                context.checkpoint.record, page, list((links or {}).values())
+            )
+
+        if context.writer is not None:
+            context.writer.submit(output_path, content, on_written)
+        else:
+            write_output_file(output_path, content)
+            if on_written is not None:
+                on_written()
+
+        return page
+
     except WebdownError as e:
         return CrawledPage(
             url=url,
@@ -202,48 +472,58 @@ def _crawl_single_page(
         )
 
 
-def _discover_links(
+def _record_write_failures(
+    result: CrawlResult,
+    failures: dict[str, str],
+    output_dir: str,
+) -> None:
+    """Mark pages whose background write failed as errors.
+
+    Args:
+        result: The crawl result containing the pages to update.
+        failures: Mapping of output file path to write error message.
+        output_dir: The output directory the paths are relative to.
+    """
+    if not failures:
+        return
+
+    errors = {
+        get_relative_path(path, output_dir): message
+        for path, message in failures.items()
+    }
+    for page in result.pages:
+        if page.status == "success" and page.output_path in errors:
+            page.status = "error"
+            page.error_message = f"Failed to write output: {errors[page.output_path]}"
+
+
+def _find_link_candidates(
     url: str,
-    page: CrawledPage,
+    html: str,
     config: CrawlerConfig,
-    visited: set[str],
-) -> list[str]:
-    """Discover new links from a crawled page.
+) -> dict[str, str]:
+    """Find in-scope links on a crawled page.
 
     Args:
         url: The URL that was crawled.
-        page: The crawled page metadata.
+        html: The HTML content of the page.
         config: The crawler configuration.
-        visited: Set of already-visited normalized URLs.
 
     Returns:
-        List of new URLs to crawl.
+        Mapping of normalized URL to original URL for each in-scope link,
+        in page order. Empty if the links cannot be extracted.
     """
+    seed_url = config.seed_urls[0] if config.seed_urls else url
     try:
-        from webdown.html_parser import fetch_url
-
-        html = fetch_url(url, show_progress=False)
+        return extract_and_filter_links(
+            html,
+            url,
+            seed_url,
+            config.scope,
+            config.path_prefix,
+        )
     except Exception:
-        return []
-
-    all_links = extract_links(html, url)
-
-    seed_url = config.seed_urls[0] if config.seed_urls else url
-    filtered_links = filter_links_by_scope(
-        all_links,
-        seed_url,
-        config.scope,
-        config.path_prefix,
-    )
-
-    new_links = []
-    for link in filtered_links:
-        normalized = normalize_url(link)
-        if normalized not in visited:
-            visited.add(normalized)
-            new_links.append(link)
-
-    return new_links
+        return {}
 
 
 def _extract_xml_title(content: str) -> str | None:
@@ -255,10 +535,17 @@ def _extract_xml_title(content: str) -> str | None:
     Returns:
         The title if found, None otherwise.
     """
-    import re
-
-    match = re.search(r"<title>([^<]+)</title>", content)
-    return match.group(1) if match else None
+    # Same match as re.search(r"<title>([^<]+)</title>"), found with plain
+    # substring searches: take the first <title> whose text is non-empty and
+    # runs up to a closing </title>
+    start = content.find("<title>")
+    while start >= 0:
+        start += len("<title>")
+        end = content.find("<", start)
+        if end > start and content.startswith("</title>", end):
+            return content[start:end]
+        start = content.find("<title>", start)
+    return None
 
 
 def crawl_from_sitemap(
@@ -278,53 +565,78 @@ def crawl_from_sitemap(
         CrawlResult containing metadata for all crawled pages.
 
     Raises:
-        WebdownError: If the sitemap cannot be fetched or parsed.
+        WebdownError: If the conversion options are invalid, or if the sitemap
+            cannot be fetched or parsed.
     """
-    result = CrawlResult(
-        start_time=datetime.now(),
-        seed_urls=[sitemap_url],
-        max_depth=0,
-        output_format=config.conversion_config.format.name.lower(),
-    )
-
-    if config.verbose:
-        print(f"Parsing sitemap: {sitemap_url}")
-
-    urls = parse_sitemap(sitemap_url)
-
-    if config.verbose:
-        print(f"Found {len(urls)} URLs in sitemap")
-
-    if config.scope != ScopeType.SAME_DOMAIN:
-        seed_url = config.seed_urls[0] if config.seed_urls else sitemap_url
-        urls = filter_links_by_scope(
-            urls,
-            seed_url,
-            config.scope,
-            config.path_prefix,
+    with _make_session(config) as session:
+        convert_page = _make_page_converter(config, session)
+        result = CrawlResult(
+            start_time=datetime.now(),
+            seed_urls=[sitemap_url],
+            max_depth=0,
+            output_format=config.conversion_config.format.name.lower(),
         )
+
         if config.verbose:
-            print(f"After scope filtering: {len(urls)} URLs")
+            print(f"Parsing sitemap: {sitemap_url}")
 
-    pages_crawled = 0
+        urls = parse_sitemap(sitemap_url)
 
-    for url in urls:
-        if config.max_pages > 0 and pages_crawled >= config.max_pages:
+        if config.verbose:
+            print(f"Found {len(urls)} URLs in sitemap")
+
+        if config.scope != ScopeType.SAME_DOMAIN:
+            seed_url = config.seed_urls[0] if config.seed_urls else sitemap_url
+            urls = filter_links_by_scope(
+                urls,
+                seed_url,
+                config.scope,
+                config.path_prefix,
+            )
             if config.verbose:
+                print(f"After scope filtering: {len(urls)} URLs")
+
+        limit = len(urls)
+        if config.max_pages > 0:
+            limit = min(limit, config.max_pages)
+        batch_size = max(1, config.max_concurrent)
+
+        # The checkpoint is entered first so it is still open while the writer
+        # flushes its last writes, which record their pages in it
+        with (
+            CrawlCheckpoint(config.checkpoint_path) as checkpoint,
+            BackgroundWriter() as writer,
+            ThreadPoolExecutor(max_workers=batch_size) as pool,
+        ):
+            context = _CrawlContext(convert_page, writer, checkpoint)
+            throttle = _HostThrottle(config.delay_seconds)
+
+            def visit(url: str) -> CrawledPage:
+                throttle.wait(url)
+                return _crawl_single_page(url, 0, config, result, context)
+
+            for start in range(0, limit, batch_size):
+                batch = urls[start : min(start + batch_size, limit)]
+                pending = [url for url in batch if checkpoint.restore(url) is None]
+                fetched = pool.map(visit, pending)
+
+                for url in batch:
+                    restored = checkpoint.restore(url)
+                    if restored is None:
+                        page = next(fetched)
+                    else:
+                        page = restored[0]
+
+                    result.pages.append(page)
+
+                    if config.verbose:
+                        status_char = "+" if page.status == "success" else "!"
+                        print(f"[{status_char}] {url}")
+
+            if limit < len(urls) and config.verbose:
                 print(f"Reached maximum page limit ({config.max_pages})")
-            break
-
-        page = _crawl_single_page(url, 0, config, result)
-        result.pages.append(page)
-        pages_crawled += 1
-
-        if config.verbose:
-            status_char = "+" if page.status == "success" else "!"
-            print(f"[{status_char}] {url}")
-
-        if pages_crawled < len(urls) and config.delay_seconds > 0:
-            time.sleep(config.delay_seconds)
 
+    _record_write_failures(result, writer.failures, config.output_dir)
     result.end_time = datetime.now()
 
     manifest_path = write_manifest(result, config.output_dir)
@@ -25,6 +25,8 @@ class ErrorCode:
     NETWORK_CONNECTION = "NETWORK_CONNECTION"
     HTTP_ERROR = "HTTP_ERROR"
     REQUEST_ERROR = "REQUEST_ERROR"
+    RESPONSE_TOO_LARGE = "RESPONSE_TOO_LARGE"
+    REQUEST_CANCELLED = "REQUEST_CANCELLED"
 
     # File-related errors
     FILE_NOT_FOUND = "FILE_NOT_FOUND"
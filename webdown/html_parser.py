@@ -12,18 +12,69 @@ read_html_file() for reading HTML from local files,
 and extract_content_with_css() for selecting specific parts of HTML.
 """
 
+import codecs
 import io
 import os
-from typing import Optional
+import threading
+import time
+from typing import Iterator, Optional
 
 import requests
 from bs4 import BeautifulSoup
+from bs4.formatter import HTMLFormatter
 from tqdm import tqdm
 
 from webdown.config import WebdownError
 from webdown.error_utils import ErrorCode, handle_request_exception
 from webdown.validation import validate_url
 
+# Bytes read per chunk when streaming large responses
+_STREAM_CHUNK_SIZE = 64 * 1024
+
+# Downloaded bytes and seconds accumulated before the progress bar is updated
+_PROGRESS_UPDATE_BYTES = 64 * 1024
+_PROGRESS_UPDATE_INTERVAL = 1 / 30
+
+
+class _BatchedProgress:
+    """Accumulate downloaded bytes and forward them to a progress bar in batches.
+
+    Each tqdm update takes a lock and may redraw the bar, so updating once per
+    small chunk costs a noticeable share of CPU on fast connections.
+    """
+
+    def __init__(self, progress_bar: tqdm) -> None:
+        """Initialize the batcher.
+
+        Args:
+            progress_bar: Progress bar receiving the batched updates
+        """
+        self._progress_bar = progress_bar
+        self._pending = 0
+        self._last_update = time.monotonic()
+
+    def add(self, n_bytes: int) -> None:
+        """Record downloaded bytes, updating the bar if a batch is complete.
+
+        Args:
+            n_bytes: Number of bytes just downloaded
+        """
+        self._pending += n_bytes
+        now = time.monotonic()
+        if (
+            self._pending >= _PROGRESS_UPDATE_BYTES
+            or now - self._last_update >= _PROGRESS_UPDATE_INTERVAL
+        ):
+            self._progress_bar.update(self._pending)
+            self._pending = 0
+            self._last_update = now
+
+    def flush(self) -> None:
+        """Forward any bytes not yet reported to the progress bar."""
+        if self._pending:
+            self._progress_bar.update(self._pending)
+            self._pending = 0
+
 
 def is_valid_url(url: str) -> bool:
     """Check if a URL is valid.
@@ -76,8 +127,40 @@ def _create_progress_bar(url: str, total_size: int, show_progress: bool) -> tqdm
     )
 
 
+def _check_download(
+    url: str,
+    received: int,
+    max_bytes: Optional[int],
+    cancel: Optional[threading.Event],
+) -> None:
+    """Stop a download that was cancelled or grew past its size limit.
+
+    Args:
+        url: URL being downloaded
+        received: Number of bytes received (or announced) so far
+        max_bytes: Maximum allowed response size in bytes, or None for no limit
+        cancel: Event that is set to abort the download, if any
+
+    Raises:
+        WebdownError: If the download was cancelled or exceeds max_bytes
+    """
+    if cancel is not None and cancel.is_set():
+        raise WebdownError(
+            f"Download of {url} was cancelled", code=ErrorCode.REQUEST_CANCELLED
+        )
+    if max_bytes is not None and received > max_bytes:
+        raise WebdownError(
+            f"Response from {url} exceeds the limit of {max_bytes} bytes",
+            code=ErrorCode.RESPONSE_TOO_LARGE,
+        )
+
+
 def _process_response_chunks(
-    response: requests.Response, progress_bar: tqdm, chunk_size: int
+    response: requests.Response,
+    progress_bar: tqdm,
+    chunk_size: int,
+    max_bytes: Optional[int] = None,
+    cancel: Optional[threading.Event] = None,
 ) -> str:
     """Process response chunks and update progress bar.
 
@@ -85,12 +168,22 @@ def _process_response_chunks(
         response: The HTTP response object
         progress_bar: Progress bar to update
         chunk_size: Size of chunks to read in bytes
+        max_bytes: Maximum allowed response size in bytes, or None for no limit
+        cancel: Event that aborts the download when set, checked between chunks
 
     Returns:
         Complete response content as string
+
+    Raises:
+        WebdownError: If the download is cancelled or exceeds max_bytes
     """
     # Create a buffer to store the content
     content = io.StringIO()
+    progress = _BatchedProgress(progress_bar)
+    received = 0
+    # An incremental decoder keeps multi-byte characters that straddle a
+    # chunk boundary intact
+    decoder = _text_decoder(_declared_charset(response))
 
     # Process chunks consistently, handling both str and bytes
     for chunk in response.iter_content(chunk_size=chunk_size):
@@ -99,43 +192,66 @@ def _process_response_chunks(
             chunk_len = (
                 len(chunk) if isinstance(chunk, bytes) else len(chunk.encode("utf-8"))
             )
+            received += chunk_len
+            _check_download(response.url, received, max_bytes, cancel)
             # Decode bytes for StringIO if needed
-            text_chunk = (
-                chunk.decode("utf-8", errors="replace")
-                if isinstance(chunk, bytes)
-                else chunk
-            )
+            text_chunk = decoder.decode(chunk) if isinstance(chunk, bytes) else chunk
 
             # Update progress with correct size
-            progress_bar.update(chunk_len)
+            progress.add(chunk_len)
             # Store in string buffer
             content.write(text_chunk)
 
+    content.write(decoder.decode(b"", final=True))
+    progress.flush()
     return content.getvalue()
 
 
+def _get_content_length(response: requests.Response) -> Optional[int]:
+    """Read the Content-Length header of a response.
+
+    Args:
+        response: HTTP response object
+
+    Returns:
+        Content length in bytes, or None if missing or not a valid number
+    """
+    content_length = response.headers.get("content-length")
+    if content_length is None or not content_length.isdigit():
+        return None
+    return int(content_length)
+
+
 def _handle_small_response(
-    response: requests.Response, show_progress: bool
+    response: requests.Response, show_progress: bool, content_length: Optional[int]
 ) -> Optional[str]:
     """Handle small responses without streaming for better performance.
 
     Args:
         response: HTTP response object
         show_progress: Whether progress bar is requested
+        content_length: Content length from the response headers, if known
 
     Returns:
         Response text for small content, None otherwise
     """
     # Skip streaming for non-progress requests with small content
-    if not show_progress and "content-length" in response.headers:
-        content_length = int(response.headers.get("content-length", 0))
+    if not show_progress and content_length is not None:
         if content_length < 1024 * 1024:  # 1MB
+            # Without a declared charset requests would decode as ISO-8859-1
+            response.encoding = _declared_charset(response) or "utf-8"
             return response.text
     return None
 
 
 def fetch_url_with_progress(
-    url: str, show_progress: bool = False, chunk_size: int = 1024, timeout: int = 10
+    url: str,
+    show_progress: bool = False,
+    chunk_size: int = 1024,
+    timeout: int = 10,
+    session: Optional[requests.Session] = None,
+    max_bytes: Optional[int] = None,
+    cancel: Optional[threading.Event] = None,
 ) -> str:
     """Fetch content from URL with streaming and optional progress bar.
 
@@ -144,30 +260,49 @@ def fetch_url_with_progress(
         show_progress: Whether to display a progress bar during download
         chunk_size: Size of chunks to read in bytes
         timeout: Request timeout in seconds
+        session: Session to send the request with, so connections are reused
+            across fetches. If None, a one-off request is made.
+        max_bytes: Maximum allowed response size in bytes, or None for no limit
+        cancel: Event that aborts the download when set, checked between chunks
 
     Returns:
         Content as string
 
     Raises:
-        WebdownError: If content cannot be fetched
+        WebdownError: If content cannot be fetched, the download is cancelled,
+            or the response exceeds max_bytes
     """
     # Note: URL validation is now centralized in _get_normalized_config
     # We assume URL is already validated when this function is called
 
     try:
         # Make a GET request with stream=True for both cases
-        response = requests.get(url, timeout=timeout, stream=True)
-        response.raise_for_status()
-
-        # Try to handle small responses without streaming for performance
-        small_response = _handle_small_response(response, show_progress)
-        if small_response is not None:
-            return small_response
-
-        # For larger responses or when progress is requested, use streaming
-        total_size = int(response.headers.get("content-length", 0))
-        with _create_progress_bar(url, total_size, show_progress) as progress_bar:
-            return _process_response_chunks(response, progress_bar, chunk_size)
+        get = session.get if session is not None else requests.get
+        response = get(url, timeout=timeout, stream=True)
+        try:
+            response.raise_for_status()
+
+            content_length = _get_content_length(response)
+            # Reject announced oversized bodies before reading any of them
+            _check_download(url, content_length or 0, max_bytes, cancel)
+
+            # Try to handle small responses without streaming for performance
+            small_response = _handle_small_response(
+                response, show_progress, content_length
+            )
+            if small_response is not None:
+                return small_response
+
+            # For larger responses or when progress is requested, use streaming
+            total_size = content_length or 0
+            with _create_progress_bar(url, total_size, show_progress) as progress_bar:
+                return _process_response_chunks(
+                    response, progress_bar, chunk_size, max_bytes, cancel
+                )
+        finally:
+            # Release the connection back to the pool even if the body is
+            # rejected before it is read
+            response.close()
 
     except (
         requests.exceptions.Timeout,
@@ -181,7 +316,13 @@ def fetch_url_with_progress(
         raise RuntimeError("This should never be reached")  # pragma: no cover
 
 
-def fetch_url(url: str, show_progress: bool = False) -> str:
+def fetch_url(
+    url: str,
+    show_progress: bool = False,
+    session: Optional[requests.Session] = None,
+    max_bytes: Optional[int] = None,
+    cancel: Optional[threading.Event] = None,
+) -> str:
     """Fetch HTML content from URL with optional progress bar.
 
     This is a simplified wrapper around fetch_url_with_progress with default parameters.
@@ -189,12 +330,18 @@ def fetch_url(url: str, show_progress: bool = False) -> str:
     Args:
         url: URL to fetch
         show_progress: Whether to display a progress bar during download
+        session: Session to reuse connections from when fetching many pages
+            from the same hosts. If None, a one-off request is made.
+        max_bytes: Maximum allowed response size in bytes, or None for no limit
+        cancel: Event that aborts the download when set, e.g. from another
+            thread
 
     Returns:
         HTML content as string
 
     Raises:
-        WebdownError: If URL is invalid or content cannot be fetched
+        WebdownError: If URL is invalid, content cannot be fetched, the
+            download is cancelled, or the response exceeds max_bytes
     """
     # Validate URL for backward compatibility with tests
     # In normal usage, URL is already validated by _get_normalized_config
@@ -203,7 +350,172 @@ def fetch_url(url: str, show_progress: bool = False) -> str:
     except ValueError as e:
         raise WebdownError(str(e), code=ErrorCode.URL_INVALID)
 
-    return fetch_url_with_progress(url, show_progress, chunk_size=1024, timeout=10)
+    return fetch_url_with_progress(
+        url,
+        show_progress,
+        chunk_size=_STREAM_CHUNK_SIZE,
+        timeout=10,
+        session=session,
+        max_bytes=max_bytes,
+        cancel=cancel,
+    )
+
+
+def fetch_url_chunks(
+    url: str,
+    show_progress: bool = False,
+    chunk_size: int = _STREAM_CHUNK_SIZE,
+    timeout: int = 10,
+    max_bytes: Optional[int] = None,
+    cancel: Optional[threading.Event] = None,
+) -> Iterator[str]:
+    """Fetch HTML content from URL as a stream of decoded text chunks.
+
+    Unlike fetch_url, the response body is never assembled into a single
+    string, so callers that process the content incrementally keep only one
+    chunk in memory at a time. The URL is validated immediately; the request
+    is made when iteration starts.
+
+    Args:
+        url: URL to fetch
+        show_progress: Whether to display a progress bar during download
+        chunk_size: Size of chunks to read in bytes
+        timeout: Request timeout in seconds
+        max_bytes: Maximum allowed response size in bytes, or None for no limit
+        cancel: Event that aborts the download when set, checked between chunks
+
+    Returns:
+        Iterator over the decoded content
+
+    Raises:
+        WebdownError: If URL is invalid, content cannot be fetched, the
+            download is cancelled, or the response exceeds max_bytes
+    """
+    try:
+        validate_url(url)
+    except ValueError as e:
+        raise WebdownError(str(e), code=ErrorCode.URL_INVALID)
+
+    return _iter_response_text(
+        url, show_progress, chunk_size, timeout, max_bytes, cancel
+    )
+
+
+def _iter_response_text(
+    url: str,
+    show_progress: bool,
+    chunk_size: int,
+    timeout: int,
+    max_bytes: Optional[int] = None,
+    cancel: Optional[threading.Event] = None,
+) -> Iterator[str]:
+    """Stream a URL's body as text, decoding chunks incrementally.
+
+    Args:
+        url: URL to fetch (assumed to be already validated)
+        show_progress: Whether to display a progress bar during download
+        chunk_size: Size of chunks to read in bytes
+        timeout: Request timeout in seconds
+        max_bytes: Maximum allowed response size in bytes, or None for no limit
+        cancel: Event that aborts the download when set, checked between chunks
+
+    Yields:
+        Decoded pieces of the response body
+
+    Raises:
+        WebdownError: If content cannot be fetched, the download is
+            cancelled, or the response exceeds max_bytes
+    """
+    try:
+        response = requests.get(url, timeout=timeout, stream=True)
+        try:
+            response.raise_for_status()
+
+            # An incremental decoder keeps multi-byte characters that straddle
+            # a chunk boundary intact
+            decoder = _text_decoder(_declared_charset(response))
+            total_size = _get_content_length(response) or 0
+            _check_download(url, total_size, max_bytes, cancel)
+            with _create_progress_bar(url, total_size, show_progress) as progress_bar:
+                progress = _BatchedProgress(progress_bar)
+                received = 0
+                for chunk in response.iter_content(chunk_size=chunk_size):
+                    received += len(chunk)
+                    _check_download(url, received, max_bytes, cancel)
+                    progress.add(len(chunk))
+                    text = decoder.decode(chunk)
+                    if text:
+                        yield text
+                progress.flush()
+                text = decoder.decode(b"", final=True)
+                if text:
+                    yield text
+        finally:
+            response.close()
+
+    except requests.exceptions.RequestException as e:
+        # This function raises a WebdownError with appropriate message
+        handle_request_exception(e, url)
+
+
+def _declared_charset(response: requests.Response) -> Optional[str]:
+    """Read the charset declared in a response's Content-Type header.
+
+    response.encoding is not used because requests reports ISO-8859-1 for
+    any text/* response without a charset, which garbles UTF-8 pages.
+
+    Args:
+        response: HTTP response object
+
+    Returns:
+        The declared charset, or None if the header does not declare one
+    """
+    content_type = response.headers.get("content-type", "")
+    for param in content_type.split(";")[1:]:
+        key, _, value = param.partition("=")
+        if key.strip().lower() == "charset":
+            return value.strip().strip("\"'") or None
+    return None
+
+
+def _text_decoder(encoding: Optional[str]) -> codecs.IncrementalDecoder:
+    """Create an incremental decoder for a response encoding.
+
+    Args:
+        encoding: Charset declared for the response, if any
+
+    Returns:
+        Decoder for the encoding, falling back to UTF-8 when it is missing
+        or unknown. Undecodable bytes are replaced.
+    """
+    try:
+        return codecs.getincrementaldecoder(encoding or "utf-8")(errors="replace")
+    except LookupError:
+        return codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+
+def _escape_html_text(text: str) -> str:
+    """Escape text the way BeautifulSoup's "minimal" formatter does.
+
+    Args:
+        text: Text or attribute value to escape
+
+    Returns:
+        Text with &, < and > replaced by entities
+    """
+    # Plain str.replace is cheaper than the regex substitution bs4 uses, and
+    # most strings contain none of these characters
+    if "&" in text:
+        text = text.replace("&", "&amp;")
+    if "<" in text:
+        text = text.replace("<", "&lt;")
+    if ">" in text:
+        text = text.replace(">", "&gt;")
+    return text
+
+
+# Serializes selected elements exactly like str(element)
+_SELECTION_FORMATTER = HTMLFormatter(entity_substitution=_escape_html_text)
 
 
 def extract_content_with_css(html: str, css_selector: str) -> str:
@@ -229,7 +541,9 @@ def extract_content_with_css(html: str, css_selector: str) -> str:
         soup = BeautifulSoup(html, "html.parser")
         selected = soup.select(css_selector)
         if selected:
-            return "".join(str(element) for element in selected)
+            return "".join(
+                element.decode(formatter=_SELECTION_FORMATTER) for element in selected
+            )
         else:
             # Warning - no elements matched
             warnings.warn(f"CSS selector '{css_selector}' did not match any elements")
@@ -279,26 +593,3 @@ def read_html_file(file_path: str) -> str:
         raise WebdownError(
             f"Error reading file {file_path}: {str(e)}", code=ErrorCode.IO_ERROR
         )
-
-
-def _check_streaming_needed(url: str) -> bool:
-    """Check if streaming is needed based on content size.
-
-    Args:
-        url: URL to check (assumed to be already validated)
-
-    Returns:
-        True if streaming should be used, False otherwise
-    """
-    # Fixed streaming threshold at 10MB
-    STREAM_THRESHOLD = 10 * 1024 * 1024
-
-    try:
-        # Use HEAD request to check content length without full download
-        head_response = requests.head(url, timeout=5)
-        content_length = int(head_response.headers.get("content-length", "0"))
-        return content_length > STREAM_THRESHOLD
-    except (requests.RequestException, ValueError):
-        # If HEAD request fails or content-length is invalid,
-        # default to False (non-streaming) as a safe fallback
-        return False
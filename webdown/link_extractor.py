@@ -6,15 +6,85 @@ parsing sitemap.xml files.
 """
 
 import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from enum import Enum, auto
-from urllib.parse import urljoin, urlparse, urlunparse
+from functools import lru_cache
+from html.parser import HTMLParser
+from typing import Iterator, cast
+from urllib.parse import ParseResult, urljoin, urlparse, urlunparse
 
 import requests
-from bs4 import BeautifulSoup
 
 from webdown.config import WebdownError
 from webdown.error_utils import ErrorCode
 
+# Element tags used by the sitemap protocol
+_SITEMAP_NS = "{http://www.sitemaps.org/schemas/sitemap/0.9}"
+_SM_LOC = f"{_SITEMAP_NS}loc"
+_SM_SITEMAP = f"{_SITEMAP_NS}sitemap"
+_SM_URL = f"{_SITEMAP_NS}url"
+
+# Bytes read from the network per sitemap parser feed
+_SITEMAP_CHUNK_SIZE = 64 * 1024
+
+# Maximum number of child sitemaps fetched concurrently from a sitemap index
+_SITEMAP_FETCH_WORKERS = 8
+
+# Schemes the crawler can fetch
+_WEB_SCHEMES = ("http", "https")
+_WEB_URL_PREFIXES = ("http://", "https://")
+
+# Hrefs that can never resolve to a crawlable page, rejected before any parsing
+_SKIPPED_HREF_PREFIXES = ("#", "javascript:", "mailto:", "tel:", "data:")
+
+# First characters of the skipped prefixes; most hrefs start with "/" or "h"
+# and are cleared by this set lookup without running startswith()
+_SKIPPED_HREF_FIRST_CHARS = frozenset(prefix[0] for prefix in _SKIPPED_HREF_PREFIXES)
+
+
+@lru_cache(maxsize=8192)
+def cached_urlparse(url: str) -> ParseResult:
+    """Parse a URL, memoizing the result.
+
+    During a crawl the same seed and discovered URLs are parsed repeatedly by
+    extraction, normalization, scope filtering and path mapping. ParseResult
+    is immutable, so sharing cached instances is safe.
+
+    Args:
+        url: The URL to parse.
+
+    Returns:
+        The parsed URL.
+    """
+    return urlparse(url)
+
+
+class _AnchorHrefParser(HTMLParser):
+    """Collect the href of every <a> tag without building a document tree.
+
+    Link extraction only needs anchor attributes, so this streams through the
+    HTML with the stdlib tokenizer instead of constructing a BeautifulSoup tree.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the parser with an empty href list."""
+        super().__init__()
+        self.hrefs: list[str] = []
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        """Record the href of anchor tags.
+
+        Args:
+            tag: The lowercased tag name.
+            attrs: The tag's (name, value) attribute pairs.
+        """
+        if tag == "a":
+            # Like BeautifulSoup, the last duplicate attribute wins
+            href = dict(attrs).get("href")
+            if href is not None:
+                self.hrefs.append(href)
+
 
 class ScopeType(Enum):
     """Enumeration of crawl scope types."""
@@ -37,28 +107,69 @@ def extract_links(html: str, base_url: str) -> list[str]:
     Returns:
         A list of absolute URLs found in the HTML.
     """
-    soup = BeautifulSoup(html, "html.parser")
-    links: list[str] = []
+    parser = _AnchorHrefParser()
+    parser.feed(html)
+    parser.close()
+
+    # A relative href (no ":") always inherits the base URL's scheme, so only
+    # hrefs that may carry their own scheme need to be parsed after joining
+    base_is_web = cached_urlparse(base_url).scheme in _WEB_SCHEMES
+
+    return [
+        absolute_url
+        for href in parser.hrefs
+        if href
+        and not (
+            href[0] in _SKIPPED_HREF_FIRST_CHARS
+            and href.startswith(_SKIPPED_HREF_PREFIXES)
+        )
+        and (base_is_web or ":" in href)
+        for absolute_url in (urljoin(base_url, href),)
+        if ":" not in href or cached_urlparse(absolute_url).scheme in _WEB_SCHEMES
+    ]
+
+
+def extract_and_filter_links(
+    html: str,
+    base_url: str,
+    seed_url: str,
+    scope: ScopeType,
+    path_prefix: str | None = None,
+) -> dict[str, str]:
+    """Extract in-scope links from HTML, deduplicated by normalized URL.
 
-    for anchor in soup.find_all("a", href=True):
-        href = anchor.get("href", "")
-        if not isinstance(href, str):
-            continue
-        if not href or href.startswith(("#", "javascript:", "mailto:", "tel:")):
-            continue
+    Combines extract_links, filter_links_by_scope and normalize_url so each
+    link is normalized exactly once and repeated links are dropped before
+    any further processing.
 
-        absolute_url = urljoin(base_url, href)
-        parsed = urlparse(absolute_url)
+    Args:
+        html: The HTML content to extract links from.
+        base_url: The base URL for resolving relative links.
+        seed_url: The original seed URL used to determine scope.
+        scope: The type of scope filtering to apply.
+        path_prefix: Optional path prefix for PATH_PREFIX scope.
 
-        if parsed.scheme in ("http", "https"):
-            links.append(absolute_url)
+    Returns:
+        Mapping of normalized URL to the first in-scope link with that
+        normalized form, in document order.
+    """
+    links = filter_links_by_scope(
+        extract_links(html, base_url), seed_url, scope, path_prefix
+    )
 
-    return links
+    unique: dict[str, str] = {}
+    for link in links:
+        unique.setdefault(normalize_url(link), link)
+    return unique
 
 
+@lru_cache(maxsize=8192)
 def normalize_url(url: str) -> str:
     """Normalize a URL for deduplication.
 
+    Results are memoized, since navigation and footer links repeat on
+    nearly every page of a crawl.
+
     Normalization includes:
     - Lowercasing the scheme and domain
     - Removing fragments (#anchor)
@@ -71,23 +182,76 @@ def normalize_url(url: str) -> str:
     Returns:
         The normalized URL string.
     """
-    parsed = urlparse(url)
+    if url.startswith(_WEB_URL_PREFIXES) and _is_simple_url(url):
+        return _normalize_simple_url(url)
+
+    parsed = cached_urlparse(url)
 
     scheme = parsed.scheme.lower()
     netloc = parsed.netloc.lower()
-    path = parsed.path
-
-    if path != "/" and path.endswith("/"):
-        path = path.rstrip("/")
-
-    if not path:
-        path = "/"
+    path = _normalize_path(parsed.path)
 
     normalized = urlunparse((scheme, netloc, path, parsed.params, parsed.query, ""))
 
     return normalized
 
 
+def _is_simple_url(url: str) -> bool:
+    """Check whether a URL can be normalized without urlparse.
+
+    URLs with non-ASCII or control characters, path parameters (;) or IPv6
+    hosts ([) need urlparse's full handling.
+
+    Args:
+        url: The URL to check.
+
+    Returns:
+        True if the URL is safe for _normalize_simple_url.
+    """
+    return url.isascii() and url.isprintable() and ";" not in url and "[" not in url
+
+
+def _normalize_simple_url(url: str) -> str:
+    """Normalize a lowercase http(s) URL by slicing instead of parsing.
+
+    Produces the same result as the urlparse/urlunparse path in normalize_url,
+    without building intermediate ParseResult tuples.
+
+    Args:
+        url: An http:// or https:// URL accepted by _is_simple_url.
+
+    Returns:
+        The normalized URL string.
+    """
+    scheme, _, rest = url.partition("://")
+    rest = rest.split("#", 1)[0]
+    rest, _, query = rest.partition("?")
+
+    path_start = rest.find("/")
+    if path_start < 0:
+        netloc, path = rest, ""
+    else:
+        netloc, path = rest[:path_start], rest[path_start:]
+
+    normalized = f"{scheme}://{netloc.lower()}{_normalize_path(path)}"
+    return f"{normalized}?{query}" if query else normalized
+
+
+def _normalize_path(path: str) -> str:
+    """Strip trailing slashes from a URL path, using "/" for an empty path.
+
+    Args:
+        path: The URL path.
+
+    Returns:
+        The normalized path.
+    """
+    if path != "/" and path.endswith("/"):
+        path = path.rstrip("/")
+
+    return path or "/"
+
+
 def filter_links_by_scope(
     links: list[str],
     seed_url: str,
@@ -105,41 +269,61 @@ def filter_links_by_scope(
     Returns:
         Filtered list of URLs that match the scope criteria.
     """
-    seed_parsed = urlparse(seed_url)
-    filtered: list[str] = []
-
-    for link in links:
-        link_parsed = urlparse(link)
-
-        if scope == ScopeType.SAME_DOMAIN:
-            seed_domain = _get_base_domain(seed_parsed.netloc)
-            link_domain = _get_base_domain(link_parsed.netloc)
-            if seed_domain == link_domain:
-                filtered.append(link)
-
-        elif scope == ScopeType.SAME_SUBDOMAIN:
-            if seed_parsed.netloc.lower() == link_parsed.netloc.lower():
-                filtered.append(link)
-
-        elif scope == ScopeType.PATH_PREFIX:
-            if seed_parsed.netloc.lower() != link_parsed.netloc.lower():
-                continue
-
-            prefix = path_prefix if path_prefix else seed_parsed.path
-            if not prefix.endswith("/"):
-                prefix = prefix.rsplit("/", 1)[0] + "/"
-
-            if link_parsed.path.startswith(prefix) or link_parsed.path == prefix.rstrip(
-                "/"
-            ):
-                filtered.append(link)
-
-    return filtered
-
-
+    seed_parsed = cached_urlparse(seed_url)
+
+    # Seed-derived values are computed once, then each scope is a single pass
+    if scope == ScopeType.SAME_DOMAIN:
+        seed_domain = _get_base_domain(seed_parsed.netloc)
+        return [
+            link
+            for link in links
+            if _get_base_domain(cached_urlparse(link).netloc) == seed_domain
+        ]
+
+    seed_netloc = seed_parsed.netloc.lower()
+
+    if scope == ScopeType.SAME_SUBDOMAIN:
+        return [
+            link
+            for link in links
+            if cached_urlparse(link).netloc.lower() == seed_netloc
+        ]
+
+    if scope == ScopeType.PATH_PREFIX:
+        prefix = path_prefix if path_prefix else seed_parsed.path
+        if not prefix.endswith("/"):
+            prefix = prefix.rsplit("/", 1)[0] + "/"
+        prefix_root = prefix.rstrip("/")
+
+        # A link that literally starts with the seed origin plus the prefix is
+        # in scope without parsing; anything else gets the full comparison
+        full_prefix = ""
+        if prefix.startswith("/") and "?" not in prefix and "#" not in prefix:
+            full_prefix = f"{seed_parsed.scheme.lower()}://{seed_netloc}{prefix}"
+
+        return [
+            link
+            for link in links
+            if (full_prefix and link.startswith(full_prefix))
+            or (
+                (link_parsed := cached_urlparse(link)).netloc.lower() == seed_netloc
+                and (
+                    link_parsed.path.startswith(prefix)
+                    or link_parsed.path == prefix_root
+                )
+            )
+        ]
+
+    return []
+
+
+@lru_cache(maxsize=2048)
 def _get_base_domain(netloc: str) -> str:
     """Extract the base domain from a netloc (e.g., example.com from sub.example.com).
 
+    Results are memoized: a crawl checks tens of thousands of links against
+    only a handful of distinct hosts.
+
     Args:
         netloc: The network location (domain) string.
 
@@ -157,11 +341,101 @@ def _get_base_domain(netloc: str) -> str:
     return ".".join(parts[-2:])
 
 
+@dataclass
+class _SitemapLocs:
+    """<loc> values collected from a sitemap, grouped by where they appeared.
+
+    Attributes:
+        sitemap_refs: Child sitemap URLs from a namespaced sitemap index.
+        urls: Page URLs from namespaced <url> entries.
+        plain_urls: Page URLs from <url> entries without a namespace.
+        other_urls: Any other un-namespaced <loc> values that look like URLs.
+    """
+
+    sitemap_refs: list[str] = field(default_factory=list)
+    urls: list[str] = field(default_factory=list)
+    plain_urls: list[str] = field(default_factory=list)
+    other_urls: list[str] = field(default_factory=list)
+
+
+def _iter_xml_events(
+    response: requests.Response,
+) -> Iterator[tuple[str, ET.Element]]:
+    """Parse XML incrementally from a streaming response.
+
+    Args:
+        response: A streaming HTTP response containing XML.
+
+    Yields:
+        (event, element) pairs for "start" and "end" events.
+
+    Raises:
+        ET.ParseError: If the XML is malformed.
+        requests.RequestException: If reading the response fails.
+    """
+    parser: ET.XMLPullParser[ET.Element] = ET.XMLPullParser(events=("start", "end"))
+    for chunk in response.iter_content(chunk_size=_SITEMAP_CHUNK_SIZE):
+        parser.feed(chunk)
+        yield from cast(Iterator[tuple[str, ET.Element]], parser.read_events())
+    parser.close()
+    yield from cast(Iterator[tuple[str, ET.Element]], parser.read_events())
+
+
+def _stream_sitemap_locs(response: requests.Response) -> _SitemapLocs:
+    """Collect <loc> values from a sitemap response in a single streaming pass.
+
+    The XML is parsed as it arrives, and each top-level entry is discarded
+    once processed, so memory stays bounded for large sitemaps.
+
+    Args:
+        response: A streaming HTTP response containing sitemap XML.
+
+    Returns:
+        The collected <loc> values.
+
+    Raises:
+        ET.ParseError: If the XML is malformed.
+        requests.RequestException: If reading the response fails.
+    """
+    locs = _SitemapLocs()
+    # Currently open elements, root first
+    open_elems: list[ET.Element] = []
+
+    for event, elem in _iter_xml_events(response):
+        if event == "start":
+            open_elems.append(elem)
+            continue
+
+        open_elems.pop()
+        depth = len(open_elems)
+        parent = open_elems[-1].tag if depth > 1 else None
+        text = elem.text.strip() if elem.text else ""
+
+        if elem.tag == _SM_LOC and text:
+            if parent == _SM_SITEMAP:
+                locs.sitemap_refs.append(text)
+            elif parent == _SM_URL:
+                locs.urls.append(text)
+        elif elem.tag == "loc" and text and depth > 0:
+            if parent == "url":
+                locs.plain_urls.append(text)
+            if text.startswith("http"):
+                locs.other_urls.append(text)
+
+        # Drop fully processed top-level entries to keep memory bounded
+        if depth == 1:
+            open_elems[0].clear()
+
+    return locs
+
+
 def parse_sitemap(sitemap_url: str, timeout: int = 30) -> list[str]:
     """Parse a sitemap.xml file and return the list of URLs.
 
     Supports standard sitemap.xml format with <url><loc> elements.
-    Also handles sitemap index files that reference other sitemaps.
+    Also handles sitemap index files that reference other sitemaps, which
+    are fetched concurrently. The sitemap is parsed incrementally while it
+    downloads.
 
     Args:
         sitemap_url: URL of the sitemap.xml file.
@@ -174,45 +448,34 @@ def parse_sitemap(sitemap_url: str, timeout: int = 30) -> list[str]:
         WebdownError: If the sitemap cannot be fetched or parsed.
     """
     try:
-        response = requests.get(sitemap_url, timeout=timeout)
-        response.raise_for_status()
+        with requests.get(sitemap_url, timeout=timeout, stream=True) as response:
+            response.raise_for_status()
+            locs = _stream_sitemap_locs(response)
     except requests.RequestException as e:
         raise WebdownError(
             f"Failed to fetch sitemap: {e}",
             ErrorCode.SITEMAP_PARSE_ERROR,
         ) from e
-
-    try:
-        root = ET.fromstring(response.content)
     except ET.ParseError as e:
         raise WebdownError(
             f"Failed to parse sitemap XML: {e}",
             ErrorCode.SITEMAP_PARSE_ERROR,
         ) from e
 
-    ns = {"sm": "http://www.sitemaps.org/schemas/sitemap/0.9"}
-    urls: list[str] = []
-
-    sitemap_refs = root.findall(".//sm:sitemap/sm:loc", ns)
-    if sitemap_refs:
-        for sitemap_ref in sitemap_refs:
-            if sitemap_ref.text:
-                child_urls = parse_sitemap(sitemap_ref.text, timeout)
-                urls.extend(child_urls)
-    else:
-        for loc in root.findall(".//sm:url/sm:loc", ns):
-            if loc.text:
-                urls.append(loc.text.strip())
+    if locs.sitemap_refs:
+        # Child sitemaps are independent downloads, so fetch them concurrently.
+        # map() keeps the index order and re-raises the first failure.
+        workers = min(_SITEMAP_FETCH_WORKERS, len(locs.sitemap_refs))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            child_results = executor.map(
+                lambda ref: parse_sitemap(ref, timeout), locs.sitemap_refs
+            )
+            return [url for child_urls in child_results for url in child_urls]
 
-        if not urls:
-            for loc in root.findall(".//url/loc"):
-                if loc.text:
-                    urls.append(loc.text.strip())
-            for loc in root.findall(".//loc"):
-                if loc.text and loc.text.strip().startswith("http"):
-                    urls.append(loc.text.strip())
+    if locs.urls:
+        return locs.urls
 
-    return urls
+    return locs.plain_urls + locs.other_urls
 
 
 def is_same_domain(url1: str, url2: str) -> bool:
@@ -225,8 +488,8 @@ def is_same_domain(url1: str, url2: str) -> bool:
     Returns:
         True if both URLs have the same base domain.
     """
-    parsed1 = urlparse(url1)
-    parsed2 = urlparse(url2)
+    parsed1 = cached_urlparse(url1)
+    parsed2 = cached_urlparse(url2)
     return _get_base_domain(parsed1.netloc) == _get_base_domain(parsed2.netloc)
 
 
@@ -240,23 +503,31 @@ def get_url_depth(url: str, base_url: str) -> int:
     Returns:
         The number of path segments deeper than the base URL.
     """
-    url_parsed = urlparse(url)
-    base_parsed = urlparse(base_url)
-
-    url_path = url_parsed.path.strip("/")
-    base_path = base_parsed.path.strip("/")
-
-    url_parts = [p for p in url_path.split("/") if p]
-    base_parts = [p for p in base_path.split("/") if p]
-
-    if not base_parts:
-        return len(url_parts)
+    url_parts = _path_segments(cached_urlparse(url).path)
+    base_parts = _path_segments(cached_urlparse(base_url).path)
 
     common = 0
-    for i, part in enumerate(base_parts):
-        if i < len(url_parts) and url_parts[i] == part:
-            common += 1
-        else:
+    for url_part, base_part in zip(url_parts, base_parts):
+        if url_part != base_part:
             break
+        common += 1
 
     return len(url_parts) - common
+
+
+def _path_segments(path: str) -> list[str]:
+    """Split a URL path into its non-empty segments.
+
+    Args:
+        path: The URL path to split.
+
+    Returns:
+        The path segments, without empty ones.
+    """
+    path = path.strip("/")
+    if not path:
+        return []
+    # Empty segments remain only where slashes are doubled
+    if "//" not in path:
+        return path.split("/")
+    return [p for p in path.split("/") if p]
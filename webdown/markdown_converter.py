@@ -12,7 +12,7 @@ helper functions for each conversion step.
 """
 
 import re
-from typing import List, Tuple
+from typing import Callable, Iterable, List, Tuple
 
 import html2text
 
@@ -20,6 +20,21 @@ from webdown.config import WebdownConfig, WebdownError
 from webdown.html_parser import extract_content_with_css
 from webdown.validation import validate_css_selector
 
+# Patterns and tables used by clean_markdown
+_INVISIBLE_CHARS_RE = re.compile(r"[\u200B\u200C\u200D\uFEFF]")
+_BLANK_LINES_RE = re.compile(r"\n{3,}")
+
+# Patterns used for table of contents generation
+_CODE_BLOCK_RE = re.compile(r"```.*?\n.*?```", re.DOTALL)
+_HEADING_RE = re.compile(r"^(#{1,6})\s+(.+)$", re.MULTILINE)
+_SLUG_STRIP_RE = re.compile(r"[^\w\-]")
+
+# Deletes every ASCII character that _SLUG_STRIP_RE would remove, so ASCII
+# titles can be slugified with str.translate instead of the regex engine
+_ASCII_SLUG_TABLE = str.maketrans(
+    "", "", "".join(c for c in map(chr, range(128)) if _SLUG_STRIP_RE.match(c))
+)
+
 
 def _find_code_blocks(markdown: str) -> List[Tuple[int, int]]:
     """Find code blocks in markdown to avoid treating code as headings.
@@ -30,27 +45,8 @@ def _find_code_blocks(markdown: str) -> List[Tuple[int, int]]:
     Returns:
         List of (start, end) positions of code blocks
     """
-    code_blocks = []
     # Find all code blocks (fenced with ```)
-    fenced_matches = list(re.finditer(r"```.*?\n.*?```", markdown, re.DOTALL))
-    for match in fenced_matches:
-        code_blocks.append((match.start(), match.end()))
-    return code_blocks
-
-
-def _is_position_in_code_block(
-    position: int, code_blocks: List[Tuple[int, int]]
-) -> bool:
-    """Check if a given position is inside a code block.
-
-    Args:
-        position: The position to check
-        code_blocks: List of (start, end) positions of code blocks
-
-    Returns:
-        True if position is within a code block, False otherwise
-    """
-    return any(start <= position <= end for start, end in code_blocks)
+    return [match.span() for match in _CODE_BLOCK_RE.finditer(markdown)]
 
 
 def _extract_headings(
@@ -66,11 +62,17 @@ def _extract_headings(
         List of (heading_markers, heading_title) tuples
     """
     headings = []
-    heading_matches = re.finditer(r"^(#{1,6})\s+(.+)$", markdown, re.MULTILINE)
+    # Both headings and code blocks are in document order, so a single cursor
+    # over code_blocks replaces a full scan per heading
+    block_index = 0
+
+    for match in _HEADING_RE.finditer(markdown):
+        position = match.start()
+        while block_index < len(code_blocks) and code_blocks[block_index][1] < position:
+            block_index += 1
 
-    for match in heading_matches:
         # Skip headings that are inside code blocks
-        if _is_position_in_code_block(match.start(), code_blocks):
+        if block_index < len(code_blocks) and code_blocks[block_index][0] <= position:
             continue
 
         # If not in code block, extract and add heading
@@ -94,7 +96,10 @@ def _create_toc_link(title: str, used_links: dict[str, int]) -> str:
     # 3. Remove special characters
     link = title.lower().replace(" ", "-")
     # Remove non-alphanumeric chars except hyphens
-    link = re.sub(r"[^\w\-]", "", link)
+    if link.isascii():
+        link = link.translate(_ASCII_SLUG_TABLE)
+    else:
+        link = _SLUG_STRIP_RE.sub("", link)
 
     # Handle duplicate links by adding a suffix
     if link in used_links:
@@ -134,7 +139,11 @@ def generate_table_of_contents(markdown: str) -> str:
         link = _create_toc_link(title, used_links)
         toc.append(f"{indent}- [{title}](#{link})")
 
-    return "\n".join(toc) + "\n\n" + markdown
+    # Join the document in the same pass, so the (possibly large) body is
+    # copied once instead of once per concatenation
+    toc.append("")
+    toc.append(markdown)
+    return "\n".join(toc)
 
 
 def clean_markdown(markdown: str, compact_output: bool = False) -> str:
@@ -147,13 +156,15 @@ def clean_markdown(markdown: str, compact_output: bool = False) -> str:
     Returns:
         Cleaned Markdown content
     """
-    # Remove zero-width spaces and other invisible characters
-    markdown = re.sub(r"[\u200B\u200C\u200D\uFEFF]", "", markdown)
+    # Remove zero-width spaces and other invisible characters. They are all
+    # non-ASCII, so pure ASCII text (a constant-time check) can skip the scan
+    if not markdown.isascii():
+        markdown = _INVISIBLE_CHARS_RE.sub("", markdown)
 
     # Post-process to remove excessive blank lines if requested
     if compact_output:
         # Replace 3 or more consecutive newlines with just 2
-        markdown = re.sub(r"\n{3,}", "\n\n", markdown)
+        markdown = _BLANK_LINES_RE.sub("\n\n", markdown)
 
     return markdown
 
@@ -186,6 +197,10 @@ def _configure_html2text(config: WebdownConfig) -> html2text.HTML2Text:
     Returns:
         Configured HTML2Text instance
     """
+    # A fresh instance is required per conversion: HTML2Text keeps parser
+    # state (e.g. an unclosed <style> or <pre>) across handle() calls, so a
+    # cached instance would leak one page's state into the next. Construction
+    # itself costs only a few microseconds.
     h = html2text.HTML2Text()
 
     # Set core options
@@ -252,22 +267,106 @@ def html_to_markdown(
 
         Content with link
     """
+    return make_converter(config)(html)
+
+
+def make_converter(config: WebdownConfig) -> Callable[[str], str]:
+    """Create an HTML to Markdown converter specialized for a configuration.
+
+    Validation and option lookups happen once here, so converting many
+    documents with the same settings (e.g. during a crawl) only pays for
+    the conversion itself on each call.
+
+    Args:
+        config: Configuration options for the conversion
+
+    Returns:
+        Function converting HTML content to Markdown
+
+    Raises:
+        WebdownError: If any configuration values are invalid
+    """
     # Validate all configuration parameters
     _validate_config(config)
 
-    # Extract specific content by CSS selector if provided
+    css_selector = config.css_selector
+    compact_output = config.document_options.compact_output
+    include_toc = config.document_options.include_toc
+
+    def convert(html: str) -> str:
+        # Extract specific content by CSS selector if provided
+        if css_selector:
+            html = extract_content_with_css(html, css_selector)
+
+        # Configure and run html2text
+        markdown = _configure_html2text(config).handle(html)
+
+        return _finish_markdown(markdown, compact_output, include_toc)
+
+    return convert
+
+
+def html_chunks_to_markdown(chunks: Iterable[str], config: WebdownConfig) -> str:
+    """Convert HTML delivered as a sequence of text chunks to Markdown.
+
+    The chunks are fed to html2text as they arrive, so the complete HTML
+    document never has to be held in memory. A CSS selector needs the whole
+    document, so in that case the chunks are joined and converted at once.
+
+    Args:
+        chunks: Consecutive pieces of the HTML document
+        config: Configuration options for the conversion
+
+    Returns:
+        Converted Markdown content, identical to html_to_markdown's output
+        for the joined chunks
+
+    Raises:
+        WebdownError: If any configuration values are invalid
+    """
     if config.css_selector:
-        html = extract_content_with_css(html, config.css_selector)
+        return html_to_markdown("".join(chunks), config)
+
+    _validate_config(config)
+
+    h = _configure_html2text(config)
+    pending = ""
+    for chunk in chunks:
+        pending += chunk
+        # Only feed up to the last tag start: html2text formats a run of text
+        # split across feed() calls (e.g. inside <b>) differently from the
+        # same run fed whole
+        cut = pending.rfind("<")
+        if cut > 0:
+            h.feed(pending[:cut])
+            pending = pending[cut:]
+    h.feed(pending)
+    h.feed("")
+    markdown = h.optwrap(h.finish())
+
+    return _finish_markdown(
+        markdown,
+        config.document_options.compact_output,
+        config.document_options.include_toc,
+    )
+
+
+def _finish_markdown(markdown: str, compact_output: bool, include_toc: bool) -> str:
+    """Apply the post-processing steps to html2text output.
 
-    # Configure and run html2text
-    converter = _configure_html2text(config)
-    markdown = converter.handle(html)
+    Args:
+        markdown: Markdown produced by html2text
+        compact_output: Whether to remove excessive blank lines
+        include_toc: Whether to prepend a table of contents
 
+    Returns:
+        Final Markdown content
+    """
     # Clean up the markdown
-    markdown = clean_markdown(markdown, config.document_options.compact_output)
+    markdown = clean_markdown(markdown, compact_output)
 
     # Add table of contents if requested
-    if config.document_options.include_toc:
+    if include_toc:
         markdown = generate_table_of_contents(markdown)
 
     return str(markdown)
@@ -1,18 +1,38 @@
 """Output file management for the crawler.
 
 This module handles converting URLs to file paths, managing the output
-directory structure, and writing the crawl manifest (index.json).
+directory structure, writing the crawl manifest (index.json) and keeping
+the checkpoint used to resume an interrupted crawl.
 """
 
+import contextlib
 import json
 import os
-import re
-from dataclasses import asdict, dataclass, field
+import queue
+import threading
+from collections import Counter
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from urllib.parse import urlparse
+from typing import IO, Callable
 
 from webdown.config import OutputFormat
+from webdown.link_extractor import cached_urlparse
+
+_SEP = os.sep
+
+# Directories already created by ensure_output_directory, so files written
+# to the same directory only pay for a stat call instead of a mkdir
+_ensured_dirs: set[str] = set()
+
+# Manifests listing more pages than this are written without indentation
+_COMPACT_MANIFEST_THRESHOLD = 500
+
+# Replaces characters that are invalid in file names on common filesystems,
+# including the ASCII control characters (a NUL byte cannot be opened at all)
+_SANITIZE_TABLE = str.maketrans(
+    {c: "_" for c in '<>:"|?*' + "".join(map(chr, range(32))) + "\x7f"}
+)
 
 
 @dataclass
@@ -58,20 +78,32 @@ class CrawlResult:
     max_depth: int = 3
     output_format: str = "markdown"
 
+    def status_counts(self) -> Counter[str]:
+        """Count pages by status in a single pass.
+
+        Each count property makes its own pass over pages, so callers that
+        need more than one count should call this once instead.
+
+        Returns:
+            Counter mapping each status ("success", "error", "skipped")
+            to its number of pages.
+        """
+        return Counter(p.status for p in self.pages)
+
     @property
     def successful_count(self) -> int:
         """Return the number of successfully crawled pages."""
-        return sum(1 for p in self.pages if p.status == "success")
+        return self.status_counts()["success"]
 
     @property
     def error_count(self) -> int:
         """Return the number of pages that failed to crawl."""
-        return sum(1 for p in self.pages if p.status == "error")
+        return self.status_counts()["error"]
 
     @property
     def skipped_count(self) -> int:
         """Return the number of skipped pages."""
-        return sum(1 for p in self.pages if p.status == "skipped")
+        return self.status_counts()["skipped"]
 
 
 def url_to_filepath(
@@ -94,7 +126,7 @@ def url_to_filepath(
     Returns:
         The full file path for the converted content.
     """
-    parsed = urlparse(url)
+    parsed = cached_urlparse(url)
     domain = parsed.netloc.lower()
 
     if ":" in domain:
@@ -108,16 +140,24 @@ def url_to_filepath(
 
     path = path.lstrip("/")
 
-    if path.endswith(".html") or path.endswith(".htm"):
-        path = re.sub(r"\.html?$", "", path)
+    if path.endswith(".html"):
+        path = path[:-5]
+    elif path.endswith(".htm"):
+        path = path[:-4]
 
     path = _sanitize_path(path)
 
     extension = ".xml" if output_format == OutputFormat.CLAUDE_XML else ".md"
 
-    full_path = os.path.join(output_dir, domain, path + extension)
-
-    return full_path
+    # Both components are known to be relative here, so plain concatenation
+    # gives the same result as os.path.join without its per-argument checks.
+    # An empty output_dir or domain would produce a stray separator, so those
+    # rare cases still go through os.path.join.
+    if not output_dir or not domain:
+        return os.path.join(output_dir, domain, path + extension)
+    if output_dir.endswith(_SEP):
+        return f"{output_dir}{domain}{_SEP}{path}{extension}"
+    return f"{output_dir}{_SEP}{domain}{_SEP}{path}{extension}"
 
 
 def _sanitize_path(path: str) -> str:
@@ -129,7 +169,7 @@ def _sanitize_path(path: str) -> str:
     Returns:
         A sanitized path safe for filesystem use.
     """
-    path = re.sub(r'[<>:"|?*]', "_", path)
+    path = path.translate(_SANITIZE_TABLE)
 
     parts = path.split("/")
     sanitized_parts = []
@@ -159,29 +199,208 @@ def get_relative_path(full_path: str, output_dir: str) -> str:
 def ensure_output_directory(filepath: str) -> None:
     """Ensure the directory for a file path exists.
 
+    A directory created earlier in the process is checked again before it is
+    trusted, so one removed in the meantime is created anew.
+
     Args:
         filepath: The file path whose directory should be created.
     """
     directory = os.path.dirname(filepath)
-    if directory:
-        Path(directory).mkdir(parents=True, exist_ok=True)
+    if not directory:
+        return
+    if directory in _ensured_dirs and os.path.isdir(directory):
+        return
+    Path(directory).mkdir(parents=True, exist_ok=True)
+    _ensured_dirs.add(directory)
 
 
 def write_output_file(filepath: str, content: str) -> None:
     """Write content to a file, creating directories as needed.
 
+    The content is written to a temporary file in the same directory and
+    then renamed over filepath, so an interrupted write never leaves a
+    truncated file behind.
+
     Args:
         filepath: The path to write to.
         content: The content to write.
     """
     ensure_output_directory(filepath)
-    with open(filepath, "w", encoding="utf-8") as f:
-        f.write(content)
+    directory, name = os.path.split(filepath)
+    # Unique per process and thread, and on the same filesystem as filepath
+    # so the final rename is atomic
+    temp_path = os.path.join(
+        directory, f".{name}.{os.getpid()}.{threading.get_ident()}.tmp"
+    )
+    f = open(temp_path, "w", encoding="utf-8")
+    try:
+        with f:
+            f.write(content)
+        os.replace(temp_path, filepath)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(temp_path)
+        raise
+
+
+class BackgroundWriter:
+    """Write output files on a dedicated background thread.
+
+    Lets the crawler start fetching the next page while the previous one is
+    still being written to disk. Files are written in submission order by a
+    single thread; errors from a write or its callback are collected rather
+    than raised, so one bad item cannot stop the thread. Work that must only
+    happen once a file is on disk can be passed to submit() as a callback,
+    which runs on the writer thread after a successful write.
+
+    Attributes:
+        failures: Mapping of file path to error message for failed writes.
+    """
+
+    def __init__(self, max_pending: int = 128) -> None:
+        """Start the writer thread.
+
+        Args:
+            max_pending: Maximum number of queued writes before submit() blocks.
+        """
+        self.failures: dict[str, str] = {}
+        self._queue: queue.Queue[tuple[str, str, Callable[[], None] | None] | None] = (
+            queue.Queue(max_pending)
+        )
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def __enter__(self) -> "BackgroundWriter":
+        """Return the writer for use as a context manager."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Flush pending writes when leaving the context."""
+        self.close()
+
+    def submit(
+        self,
+        filepath: str,
+        content: str,
+        on_written: Callable[[], None] | None = None,
+    ) -> None:
+        """Queue content to be written to a file.
+
+        Args:
+            filepath: The path to write to.
+            content: The content to write.
+            on_written: Called on the writer thread once the file has been
+                written successfully. Not called if the write fails.
+        """
+        self._queue.put((filepath, content, on_written))
+
+    def close(self) -> None:
+        """Wait for all queued writes to finish and stop the writer thread."""
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+
+    def _run(self) -> None:
+        """Write queued files until the stop sentinel is received."""
+        while (item := self._queue.get()) is not None:
+            filepath, content, on_written = item
+            try:
+                write_output_file(filepath, content)
+                if on_written is not None:
+                    on_written()
+            except Exception as e:
+                # Keep draining the queue so submit() and close() never hang
+                self.failures[filepath] = str(e)
+
+
+class CrawlCheckpoint:
+    """Record completed pages so an interrupted crawl can be resumed.
+
+    The checkpoint is a JSON Lines file with one entry per successfully
+    crawled page: its manifest entry and the in-scope links found on it.
+    Entries are appended once a page's output file has been written, so a
+    crawl restarted with the same settings can replay them instead of
+    fetching those pages again.
+    A final line truncated by an interruption is ignored, as are lines that
+    are not checkpoint entries.
+    """
+
+    def __init__(self, path: str | None) -> None:
+        """Load the entries of an existing checkpoint and open it for appending.
+
+        Args:
+            path: Path of the checkpoint file, or None to disable
+                checkpointing.
+        """
+        self._completed: dict[str, tuple[CrawledPage, list[str]]] = {}
+        self._file: IO[str] | None = None
+        if path is None:
+            return
+
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    # Skip truncated lines and entries this class did not
+                    # write; JSONDecodeError and bad dates are ValueErrors
+                    try:
+                        entry = json.loads(line)
+                        page = _page_from_dict(entry["page"])
+                        links = list(entry["links"])
+                    except (ValueError, KeyError, TypeError):
+                        continue
+                    self._completed[page.url] = (page, links)
+
+        ensure_output_directory(path)
+        # Line buffered, so every completed page reaches the file right away
+        self._file = open(path, "a", encoding="utf-8", buffering=1)
+
+    def __enter__(self) -> "CrawlCheckpoint":
+        """Return the checkpoint for use as a context manager."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Close the checkpoint file when leaving the context."""
+        self.close()
+
+    def restore(self, url: str) -> tuple[CrawledPage, list[str]] | None:
+        """Look up a page completed by an earlier run.
+
+        Args:
+            url: The URL of the page.
+
+        Returns:
+            The recorded page and its links, or None if the page has not
+            been completed.
+        """
+        return self._completed.get(url)
+
+    def record(self, page: CrawledPage, links: list[str]) -> None:
+        """Append a completed page to the checkpoint.
+
+        Call this only after the page's output file has been written.
+
+        Args:
+            page: The successfully crawled page.
+            links: The in-scope links found on the page.
+        """
+        if self._file is not None:
+            entry = {"page": _page_to_dict(page), "links": links}
+            self._file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+    def close(self) -> None:
+        """Close the checkpoint file."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
 
 
 def write_manifest(result: CrawlResult, output_dir: str) -> str:
     """Write the crawl manifest (index.json) to the output directory.
 
+    The manifest is indented for readability unless it lists more than
+    _COMPACT_MANIFEST_THRESHOLD pages, in which case it is written in
+    compact form.
+
     Args:
         result: The crawl result containing all page metadata.
         output_dir: The output directory to write the manifest to.
@@ -189,6 +408,7 @@ def write_manifest(result: CrawlResult, output_dir: str) -> str:
     Returns:
         The path to the written manifest file.
     """
+    counts = result.status_counts()
     manifest = {
         "version": "1.0",
         "crawl_info": {
@@ -196,9 +416,9 @@ def write_manifest(result: CrawlResult, output_dir: str) -> str:
             "start_time": result.start_time.isoformat(),
             "end_time": result.end_time.isoformat(),
             "total_pages": len(result.pages),
-            "successful": result.successful_count,
-            "errors": result.error_count,
-            "skipped": result.skipped_count,
+            "successful": counts["success"],
+            "errors": counts["error"],
+            "skipped": counts["skipped"],
             "max_depth": result.max_depth,
             "output_format": result.output_format,
         },
@@ -208,8 +428,16 @@ def write_manifest(result: CrawlResult, output_dir: str) -> str:
     manifest_path = os.path.join(output_dir, "index.json")
     ensure_output_directory(manifest_path)
 
+    # Large manifests are written compactly: indentation roughly doubles
+    # encoding time and adds about half again to the file size. Encoding to
+    # a string first lets json use its C encoder and issue a single write.
+    if len(result.pages) > _COMPACT_MANIFEST_THRESHOLD:
+        data = json.dumps(manifest, separators=(",", ":"), ensure_ascii=False)
+    else:
+        data = json.dumps(manifest, indent=2, ensure_ascii=False)
+
     with open(manifest_path, "w", encoding="utf-8") as f:
-        json.dump(manifest, f, indent=2, ensure_ascii=False)
+        f.write(data)
 
     return manifest_path
 
@@ -223,6 +451,34 @@ def _page_to_dict(page: CrawledPage) -> dict:
     Returns:
         A dictionary representation of the page.
     """
-    d = asdict(page)
-    d["crawled_at"] = page.crawled_at.isoformat()
-    return d
+    # Built explicitly: asdict() recurses into and deep-copies every field,
+    # which is far slower for the flat, immutable values stored here
+    return {
+        "url": page.url,
+        "output_path": page.output_path,
+        "title": page.title,
+        "crawled_at": page.crawled_at.isoformat(),
+        "depth": page.depth,
+        "status": page.status,
+        "error_message": page.error_message,
+    }
+
+
+def _page_from_dict(data: dict) -> CrawledPage:
+    """Rebuild a CrawledPage from its JSON representation.
+
+    Args:
+        data: A dictionary as returned by _page_to_dict.
+
+    Returns:
+        The page.
+    """
+    return CrawledPage(
+        url=data["url"],
+        output_path=data["output_path"],
+        title=data["title"],
+        crawled_at=datetime.fromisoformat(data["crawled_at"]),
+        depth=data["depth"],
+        status=data["status"],
+        error_message=data["error_message"],
+    )
@@ -1,8 +1,19 @@
 """Configuration for pytest."""
 
+import argparse
 from typing import Any
 
+import pytest
+
+from webdown.cli import create_argument_parser
+
 
 def pytest_configure(config: Any) -> None:
     """Configure pytest with integration marker."""
     config.addinivalue_line("markers", "integration: mark tests as integration tests")
+
+
+@pytest.fixture(scope="session")
+def arg_parser() -> argparse.ArgumentParser:
+    """Build the CLI argument parser once for the whole test session."""
+    return create_argument_parser()
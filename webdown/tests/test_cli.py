@@ -1,9 +1,10 @@
 """Tests for command-line interface."""
 
 import argparse
-import io
-import sys
-from unittest.mock import MagicMock, patch
+import runpy
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 
@@ -12,7 +13,6 @@ import webdown.cli  # noqa: F401
 from webdown.cli import (
     _convert_to_selected_format,
     auto_fix_url,
-    create_argument_parser,
     main,
     parse_args,
     write_output,
@@ -23,17 +23,15 @@ from webdown.config import WebdownError
 class TestCreateArgumentParser:
     """Tests for create_argument_parser function."""
 
-    def test_parser_configuration(self) -> None:
+    def test_parser_configuration(self, arg_parser: argparse.ArgumentParser) -> None:
         """Test the configuration of the argument parser."""
-        parser = create_argument_parser()
-
         # Test basic structure
-        assert parser.description is not None
-        assert parser.epilog is not None
+        assert arg_parser.description is not None
+        assert arg_parser.epilog is not None
 
         # Check argument groups
         arg_groups = [
-            group.title for group in parser._action_groups[2:]
+            group.title for group in arg_parser._action_groups[2:]
         ]  # Skip positional and optional
         assert "Input/Output Options" in arg_groups
         assert "Content Selection" in arg_groups
@@ -41,22 +39,50 @@ class TestCreateArgumentParser:
         assert "Output Format Options" in arg_groups
         assert "Meta Options" in arg_groups
 
-        # Verify key arguments exist
-        args = parser.parse_args(["-u", "https://example.com"])
-        assert hasattr(args, "url")
-        assert hasattr(args, "file")  # New file option
-        assert hasattr(args, "output")
-        assert hasattr(args, "progress")
-        assert hasattr(args, "css")
-        assert hasattr(args, "toc")
-        assert hasattr(args, "compact")
-        assert hasattr(args, "width")
-        assert hasattr(args, "claude_xml")
+    @pytest.mark.parametrize(
+        "attr",
+        [
+            "url",
+            "file",
+            "output",
+            "progress",
+            "css",
+            "toc",
+            "compact",
+            "width",
+            "claude_xml",
+        ],
+    )
+    def test_has_attribute(
+        self, arg_parser: argparse.ArgumentParser, attr: str
+    ) -> None:
+        """Test that parsed arguments expose each key option."""
+        args = arg_parser.parse_args(["-u", "https://example.com"])
+        assert hasattr(args, attr)
 
 
 class TestParseArgs:
     """Tests for parse_args function."""
 
+    @pytest.mark.parametrize(
+        "attr,short,long_",
+        [
+            ("toc", "-t", "--toc"),
+            ("no_links", "-L", "--no-links"),
+            ("no_images", "-I", "--no-images"),
+            ("progress", "-p", "--progress"),
+            ("compact", "-c", "--compact"),
+        ],
+    )
+    def test_boolean_flag(
+        self, arg_parser: argparse.ArgumentParser, attr: str, short: str, long_: str
+    ) -> None:
+        """Test boolean flags default to False and are set by either form."""
+        for source in (["-u", "https://example.com"], ["-f", "page.html"]):
+            assert getattr(arg_parser.parse_args(source), attr) is False
+            assert getattr(arg_parser.parse_args(source + [short]), attr) is True
+            assert getattr(arg_parser.parse_args(source + [long_]), attr) is True
+
     def test_source_arguments_mutual_exclusivity(self) -> None:
         """Test that URL and file arguments are mutually exclusive."""
         # We need to use a mock parser here to avoid sys.exit
@@ -74,272 +100,198 @@ class TestParseArgs:
         with pytest.raises(SystemExit):
             parser.parse_args(["-u", "https://example.com", "-f", "file.html"])
 
-    def test_url_argument(self) -> None:
+    def test_url_argument(self, arg_parser: argparse.ArgumentParser) -> None:
         """Test parsing URL argument."""
         args = parse_args(["-u", "https://example.com"])
         assert args.url == "https://example.com"
 
         # Long option
-        args = parse_args(["--url", "https://example.com"])
+        args = arg_parser.parse_args(["--url", "https://example.com"])
         assert args.url == "https://example.com"
 
-    def test_file_argument(self) -> None:
+    def test_file_argument(self, arg_parser: argparse.ArgumentParser) -> None:
         """Test parsing file argument."""
-        args = parse_args(["-f", "page.html"])
+        args = arg_parser.parse_args(["-f", "page.html"])
         assert args.file == "page.html"
 
         # Long option
-        args = parse_args(["--file", "page.html"])
+        args = arg_parser.parse_args(["--file", "page.html"])
         assert args.file == "page.html"
 
-    def test_output_option(self) -> None:
+    def test_output_option(self, arg_parser: argparse.ArgumentParser) -> None:
         """Test parsing output option."""
         # Short option with URL
-        args = parse_args(["-u", "https://example.com", "-o", "output.md"])
+        args = arg_parser.parse_args(["-u", "https://example.com", "-o", "output.md"])
         assert args.output == "output.md"
 
         # Long option with URL
-        args = parse_args(["-u", "https://example.com", "--output", "output.md"])
+        args = arg_parser.parse_args(
+            ["-u", "https://example.com", "--output", "output.md"]
+        )
         assert args.output == "output.md"
 
         # With file source
-        args = parse_args(["-f", "page.html", "-o", "output.md"])
+        args = arg_parser.parse_args(["-f", "page.html", "-o", "output.md"])
         assert args.output == "output.md"
 
-    def test_toc_flag(self) -> None:
-        """Test parsing table of contents flag."""
-        # Default with URL
-        args = parse_args(["-u", "https://example.com"])
-        assert args.toc is False
-
-        # Short option with URL
-        args = parse_args(["-u", "https://example.com", "-t"])
-        assert args.toc is True
-
-        # Long option with URL
-        args = parse_args(["-u", "https://example.com", "--toc"])
-        assert args.toc is True
-
-        # With file source
-        args = parse_args(["-f", "page.html", "-t"])
-        assert args.toc is True
-
-    def test_no_links_flag(self) -> None:
-        """Test parsing no-links flag."""
-        # Default with URL
-        args = parse_args(["-u", "https://example.com"])
-        assert args.no_links is False
-
-        # With file source
-        args = parse_args(["-f", "page.html"])
-        assert args.no_links is False
-
-        # Short option
-        args = parse_args(["-u", "https://example.com", "-L"])
-        assert args.no_links is True
-
-        # Long option
-        args = parse_args(["-u", "https://example.com", "--no-links"])
-        assert args.no_links is True
-
-    def test_no_images_flag(self) -> None:
-        """Test parsing no-images flag."""
-        # Default with URL
-        args = parse_args(["-u", "https://example.com"])
-        assert args.no_images is False
-
-        # Default with file
-        args = parse_args(["-f", "page.html"])
-        assert args.no_images is False
-
-        # Short option with URL
-        args = parse_args(["-u", "https://example.com", "-I"])
-        assert args.no_images is True
-
-        # Long option with URL
-        args = parse_args(["-u", "https://example.com", "--no-images"])
-        assert args.no_images is True
-
-        # With file source
-        args = parse_args(["-f", "page.html", "-I"])
-        assert args.no_images is True
-
-    def test_css_option(self) -> None:
+    def test_css_option(self, arg_parser: argparse.ArgumentParser) -> None:
         """Test parsing CSS selector option."""
         # Short option with URL
-        args = parse_args(["-u", "https://example.com", "-s", "main"])
+        args = arg_parser.parse_args(["-u", "https://example.com", "-s", "main"])
         assert args.css == "main"
 
         # Long option with URL
-        args = parse_args(["-u", "https://example.com", "--css", "article"])
+        args = arg_parser.parse_args(["-u", "https://example.com", "--css", "article"])
         assert args.css == "article"
 
         # With file source
-        args = parse_args(["-f", "page.html", "-s", "main"])
+        args = arg_parser.parse_args(["-f", "page.html", "-s", "main"])
         assert args.css == "main"
 
-    def test_compact_option(self) -> None:
-        """Test parsing compact option."""
-        # Default with URL
-        args = parse_args(["-u", "https://example.com"])
-        assert args.compact is False
-
-        # Default with file
-        args = parse_args(["-f", "page.html"])
-        assert args.compact is False
-
-        # With long compact flag and URL
-        args = parse_args(["-u", "https://example.com", "--compact"])
-        assert args.compact is True
-
-        # With short compact flag and URL
-        args = parse_args(["-u", "https://example.com", "-c"])
-        assert args.compact is True
-
-        # With file source
-        args = parse_args(["-f", "page.html", "-c"])
-        assert args.compact is True
-
-    def test_width_option(self) -> None:
+    def test_width_option(self, arg_parser: argparse.ArgumentParser) -> None:
         """Test parsing width option."""
         # Default with URL
-        args = parse_args(["-u", "https://example.com"])
+        args = arg_parser.parse_args(["-u", "https://example.com"])
         assert args.width == 0
 
         # Default with file
-        args = parse_args(["-f", "page.html"])
+        args = arg_parser.parse_args(["-f", "page.html"])
         assert args.width == 0
 
         # With long width flag and URL
-        args = parse_args(["-u", "https://example.com", "--width", "80"])
+        args = arg_parser.parse_args(["-u", "https://example.com", "--width", "80"])
         assert args.width == 80
 
         # With short width flag and URL
-        args = parse_args(["-u", "https://example.com", "-w", "72"])
+        args = arg_parser.parse_args(["-u", "https://example.com", "-w", "72"])
         assert args.width == 72
 
         # With file source
-        args = parse_args(["-f", "page.html", "-w", "80"])
+        args = arg_parser.parse_args(["-f", "page.html", "-w", "80"])
         assert args.width == 80
 
-    def test_progress_option(self) -> None:
-        """Test parsing progress option."""
-        # Default with URL
-        args = parse_args(["-u", "https://example.com"])
-        assert args.progress is False
-
-        # Default with file
-        args = parse_args(["-f", "page.html"])
-        assert args.progress is False
-
-        # With long progress flag and URL
-        args = parse_args(["-u", "https://example.com", "--progress"])
-        assert args.progress is True
-
-        # With short progress flag and URL
-        args = parse_args(["-u", "https://example.com", "-p"])
-        assert args.progress is True
-
-        # With file source (though it only affects URL downloads)
-        args = parse_args(["-f", "page.html", "-p"])
-        assert args.progress is True
-
-    def test_claude_xml_options(self) -> None:
+    @pytest.mark.parametrize(
+        "argv,claude_xml,metadata,add_date",
+        [
+            (["-u", "https://example.com"], False, True, True),
+            (["-f", "page.html"], False, True, True),
+            (["-u", "https://example.com", "--claude-xml"], True, True, True),
+            (
+                ["-u", "https://example.com", "--claude-xml", "--no-metadata"],
+                True,
+                False,
+                True,
+            ),
+            (
+                ["-u", "https://example.com", "--claude-xml", "--no-date"],
+                True,
+                True,
+                False,
+            ),
+            (
+                [
+                    "-u",
+                    "https://example.com",
+                    "--claude-xml",
+                    "--no-metadata",
+                    "--no-date",
+                ],
+                True,
+                False,
+                False,
+            ),
+            (["-f", "page.html", "--claude-xml"], True, True, True),
+        ],
+    )
+    def test_claude_xml_options(
+        self,
+        arg_parser: argparse.ArgumentParser,
+        argv: list[str],
+        claude_xml: bool,
+        metadata: bool,
+        add_date: bool,
+    ) -> None:
         """Test parsing Claude XML options."""
-        # Default values with URL
-        args = parse_args(["-u", "https://example.com"])
-        assert args.claude_xml is False
-        assert args.metadata is True
-        assert args.add_date is True
-
-        # Default values with file
-        args = parse_args(["-f", "page.html"])
-        assert args.claude_xml is False
-        assert args.metadata is True
-        assert args.add_date is True
-
-        # With claude_xml flag and URL
-        args = parse_args(["-u", "https://example.com", "--claude-xml"])
-        assert args.claude_xml is True
-
-        # With no-metadata flag and URL
-        args = parse_args(
-            ["-u", "https://example.com", "--claude-xml", "--no-metadata"]
-        )
-        assert args.claude_xml is True
-        assert args.metadata is False
-
-        # With no-date flag and URL
-        args = parse_args(["-u", "https://example.com", "--claude-xml", "--no-date"])
-        assert args.claude_xml is True
-        assert args.add_date is False
-
-        # Test combined options with URL
-        args = parse_args(
-            ["-u", "https://example.com", "--claude-xml", "--no-metadata", "--no-date"]
+        args = arg_parser.parse_args(argv)
+        assert (args.claude_xml, args.metadata, args.add_date) == (
+            claude_xml,
+            metadata,
+            add_date,
         )
-        assert args.claude_xml is True
-        assert args.metadata is False
-        assert args.add_date is False
-
-        # With file source
-        args = parse_args(["-f", "page.html", "--claude-xml"])
-        assert args.claude_xml is True
 
-    def test_version_flag(self) -> None:
-        """Test version flag is recognized."""
-        # Testing that the flag is recognized correctly
+    def test_version_flag(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """Test the version flag prints the package version and exits."""
         from webdown import __version__
 
-        # Create a parser with version action
-        parser = argparse.ArgumentParser()
-        parser.add_argument(
-            "--version", action="version", version=f"test {__version__}"
-        )
+        with pytest.raises(SystemExit) as excinfo:
+            main(["--version"])
 
-        # Test it raises SystemExit
-        with pytest.raises(SystemExit):
-            parser.parse_args(["--version"])
+        assert excinfo.value.code == 0
+        assert __version__ in capsys.readouterr().out
 
 
 class TestAutoFixUrl:
     """Tests for auto_fix_url function."""
 
-    def test_already_has_scheme(self) -> None:
+    @pytest.mark.parametrize(
+        "url",
+        [
+            pytest.param("http://example.com", id="http"),
+            pytest.param("https://example.com", id="https"),
+            pytest.param("ftp://example.com", id="ftp"),
+        ],
+    )
+    def test_already_has_scheme(self, url: str) -> None:
         """Test that URLs with scheme are left unchanged."""
-        # Test with http:// scheme
-        url = "http://example.com"
-        assert auto_fix_url(url) == url
-
-        # Test with https:// scheme
-        url = "https://example.com"
-        assert auto_fix_url(url) == url
-
-        # Test with other scheme
-        url = "ftp://example.com"
         assert auto_fix_url(url) == url
 
-    def test_missing_scheme(self) -> None:
+    def test_missing_scheme(self, capsys: pytest.CaptureFixture[str]) -> None:
         """Test that domain-like URLs without scheme get https:// added."""
-        with patch("sys.stderr", new=io.StringIO()) as fake_stderr:
-            fixed_url = auto_fix_url("example.com")
-            assert fixed_url == "https://example.com"
-            assert "Added https://" in fake_stderr.getvalue()
-
-    def test_not_a_url(self) -> None:
+        fixed_url = auto_fix_url("example.com")
+        assert fixed_url == "https://example.com"
+        assert "Added https://" in capsys.readouterr().err
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            pytest.param("not a url", id="text"),
+            pytest.param("", id="empty"),
+            pytest.param(None, id="none"),
+        ],
+    )
+    def test_not_a_url(self, value: str | None) -> None:
         """Test that strings that don't look like URLs are left unchanged."""
-        assert auto_fix_url("not a url") == "not a url"
-        assert auto_fix_url("") == ""
-        assert auto_fix_url(None) is None  # type: ignore
+        assert auto_fix_url(value) == value  # type: ignore[arg-type]
 
 
 class TestConvertToSelectedFormat:
     """Tests for _convert_to_selected_format function."""
 
+    @pytest.fixture
+    def base_args(self) -> dict[str, Any]:
+        """Return parsed CLI arguments with every option at its default."""
+        return {
+            "url": None,
+            "file": None,
+            "toc": False,
+            "no_links": False,
+            "no_images": False,
+            "css": None,
+            "compact": False,
+            "width": 0,
+            "progress": False,
+            "claude_xml": False,
+            "metadata": True,
+            "output": None,
+        }
+
     @patch("webdown.cli.convert_url")
     @patch("webdown.cli.auto_fix_url")
     def test_url_markdown_conversion(
-        self, mock_auto_fix: MagicMock, mock_convert: MagicMock
+        self,
+        mock_auto_fix: MagicMock,
+        mock_convert: MagicMock,
+        base_args: dict[str, Any],
     ) -> None:
         """Test _convert_to_selected_format for URL to Markdown conversion."""
         # Setup mocks
@@ -348,18 +300,15 @@ class TestConvertToSelectedFormat:
 
         # Create args
         args = argparse.Namespace(
-            url="example.com",
-            file=None,  # No file path
-            toc=True,
-            no_links=False,
-            no_images=False,
-            css=None,
-            compact=True,
-            width=80,
-            progress=True,
-            claude_xml=False,
-            metadata=True,
-            output="output.md",
+            **{
+                **base_args,
+                "url": "example.com",
+                "toc": True,
+                "compact": True,
+                "width": 80,
+                "progress": True,
+                "output": "output.md",
+            }
         )
 
         # Call function
@@ -384,23 +333,10 @@ class TestConvertToSelectedFormat:
         assert config.document_options.compact_output is True
         assert config.document_options.body_width == 80
 
-    def test_no_source_provided(self) -> None:
+    def test_no_source_provided(self, base_args: dict[str, Any]) -> None:
         """Test the error case when neither URL nor file is provided."""
         # Create args with both url and file set to None
-        args = argparse.Namespace(
-            url=None,
-            file=None,
-            toc=False,
-            no_links=False,
-            no_images=False,
-            css=None,
-            compact=False,
-            width=0,
-            progress=False,
-            claude_xml=False,
-            metadata=True,
-            output=None,
-        )
+        args = argparse.Namespace(**base_args)
 
         # Function should raise ValueError when both URL and file are None
         with pytest.raises(ValueError) as excinfo:
@@ -410,25 +346,23 @@ class TestConvertToSelectedFormat:
         assert "Either URL or file path must be provided" in str(excinfo.value)
 
     @patch("webdown.cli.convert_file")
-    def test_file_markdown_conversion(self, mock_convert: MagicMock) -> None:
+    def test_file_markdown_conversion(
+        self, mock_convert: MagicMock, base_args: dict[str, Any]
+    ) -> None:
         """Test _convert_to_selected_format for file to Markdown conversion."""
         # Setup mock
         mock_convert.return_value = "# Markdown Content from File"
 
         # Create args
         args = argparse.Namespace(
-            url=None,  # No URL
-            file="page.html",
-            toc=True,
-            no_links=False,
-            no_images=False,
-            css=None,
-            compact=True,
-            width=80,
-            progress=False,  # Progress doesn't affect file conversion
-            claude_xml=False,
-            metadata=True,
-            output="output.md",
+            **{
+                **base_args,
+                "file": "page.html",
+                "toc": True,
+                "compact": True,
+                "width": 80,
+                "output": "output.md",
+            }
         )
 
         # Call function
@@ -450,7 +384,9 @@ class TestConvertToSelectedFormat:
         assert config.document_options.body_width == 80
 
     @patch("webdown.cli.convert_file")
-    def test_file_claude_xml_conversion(self, mock_convert: MagicMock) -> None:
+    def test_file_claude_xml_conversion(
+        self, mock_convert: MagicMock, base_args: dict[str, Any]
+    ) -> None:
         """Test _convert_to_selected_format for file to Claude XML conversion."""
         # Setup mock
         mock_convert.return_value = (
@@ -459,18 +395,16 @@ class TestConvertToSelectedFormat:
 
         # Create args
         args = argparse.Namespace(
-            url=None,  # No URL
-            file="page.html",
-            toc=False,
-            no_links=True,
-            no_images=True,
-            css="main",
-            compact=False,
-            width=0,
-            progress=False,
-            claude_xml=True,
-            metadata=False,  # No metadata
-            output="output.xml",
+            **{
+                **base_args,
+                "file": "page.html",
+                "no_links": True,
+                "no_images": True,
+                "css": "main",
+                "claude_xml": True,
+                "metadata": False,
+                "output": "output.xml",
+            }
         )
 
         # Call function
@@ -496,7 +430,10 @@ class TestConvertToSelectedFormat:
     @patch("webdown.cli.convert_url")
     @patch("webdown.cli.auto_fix_url")
     def test_url_claude_xml_conversion(
-        self, mock_auto_fix: MagicMock, mock_convert: MagicMock
+        self,
+        mock_auto_fix: MagicMock,
+        mock_convert: MagicMock,
+        base_args: dict[str, Any],
     ) -> None:
         """Test _convert_to_selected_format for URL to Claude XML conversion."""
         # Setup mocks
@@ -507,18 +444,14 @@ class TestConvertToSelectedFormat:
 
         # Create args
         args = argparse.Namespace(
-            url="https://example.com",  # Already has scheme
-            file=None,  # No file path
-            toc=False,
-            no_links=True,
-            no_images=True,
-            css="main",
-            compact=False,
-            width=0,
-            progress=False,
-            claude_xml=True,
-            metadata=True,
-            output=None,  # stdout
+            **{
+                **base_args,
+                "url": "https://example.com",
+                "no_links": True,
+                "no_images": True,
+                "css": "main",
+                "claude_xml": True,
+            }
         )
 
         # Call function
@@ -543,100 +476,109 @@ class TestConvertToSelectedFormat:
 class TestWriteOutput:
     """Tests for write_output function."""
 
-    def test_write_to_stdout(self) -> None:
-        """Test writing output to stdout."""
-        content = "Test content"
-
-        # Capture stdout
-        with patch("sys.stdout", new=io.StringIO()) as fake_stdout:
-            write_output(content, None)
-            assert fake_stdout.getvalue() == "Test content\n"
+    @pytest.mark.parametrize("content", ["Content", "Content\n", "Content\n\n\n"])
+    def test_write_to_stdout(
+        self, content: str, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test stdout output ends with exactly one trailing newline."""
+        write_output(content, None)
+        assert capsys.readouterr().out == "Content\n"
 
-    def test_write_to_file(self) -> None:
+    def test_write_to_file(self, tmp_path: Path) -> None:
         """Test writing output to a file."""
-        content = "Test content"
-
-        # Mock file operations
-        with patch("builtins.open", new_callable=MagicMock) as mock_open:
-            mock_file = MagicMock()
-            mock_open.return_value.__enter__.return_value = mock_file
+        output = tmp_path / "output.md"
 
-            write_output(content, "output.md")
+        write_output("Test content", str(output))
 
-            # Verify file was opened correctly
-            mock_open.assert_called_once_with("output.md", "w", encoding="utf-8")
-            mock_file.write.assert_called_once_with("Test content\n")
-
-    def test_trailing_newline_handling(self) -> None:
-        """Test handling of trailing newlines."""
-        # Without trailing newline
-        with patch("sys.stdout", new=io.StringIO()) as fake_stdout:
-            write_output("Content", None)
-            assert fake_stdout.getvalue() == "Content\n"
-
-        # With one trailing newline
-        with patch("sys.stdout", new=io.StringIO()) as fake_stdout:
-            write_output("Content\n", None)
-            assert fake_stdout.getvalue() == "Content\n"
-
-        # With multiple trailing newlines
-        with patch("sys.stdout", new=io.StringIO()) as fake_stdout:
-            write_output("Content\n\n\n", None)
-            assert fake_stdout.getvalue() == "Content\n"
+        assert output.read_text(encoding="utf-8") == "Test content\n"
 
 
 class TestMain:
     """Tests for main function."""
 
+    @pytest.mark.parametrize(
+        "argv,expected_args,converted",
+        [
+            (
+                ["-u", "https://example.com"],
+                {"url": "https://example.com", "file": None},
+                ("# Markdown Content", None),
+            ),
+            (
+                ["-f", "page.html"],
+                {"url": None, "file": "page.html"},
+                ("# Markdown Content from File", None),
+            ),
+            (
+                ["-u", "https://example.com", "-o", "output.md"],
+                {"url": "https://example.com", "file": None, "output": "output.md"},
+                ("# Markdown Content", "output.md"),
+            ),
+            (
+                ["-f", "page.html", "-o", "output.md"],
+                {"url": None, "file": "page.html", "output": "output.md"},
+                ("# Markdown Content from File", "output.md"),
+            ),
+            (
+                ["-u", "https://example.com", "--claude-xml"],
+                {"url": "https://example.com", "claude_xml": True},
+                ("<claude_documentation>content</claude_documentation>", None),
+            ),
+            (
+                ["-u", "https://example.com", "--claude-xml", "-o", "output.xml"],
+                {
+                    "url": "https://example.com",
+                    "claude_xml": True,
+                    "output": "output.xml",
+                },
+                ("<claude_documentation>content</claude_documentation>", "output.xml"),
+            ),
+            (
+                ["-f", "page.html", "--claude-xml"],
+                {"url": None, "file": "page.html", "claude_xml": True},
+                ("<claude_documentation>file content</claude_documentation>", None),
+            ),
+        ],
+        ids=[
+            "url-stdout",
+            "file-stdout",
+            "url-file",
+            "file-file",
+            "xml-stdout",
+            "xml-file",
+            "xml-from-file",
+        ],
+    )
     @patch("webdown.cli._convert_to_selected_format")
     @patch("webdown.cli.write_output")
-    def test_convert_url_to_stdout(
-        self, mock_write: MagicMock, mock_convert: MagicMock
-    ) -> None:
-        """Test converting URL to stdout."""
-        # Setup mocks
-        mock_convert.return_value = ("# Markdown Content", None)
-
-        # Call main function with URL
-        exit_code = main(["-u", "https://example.com"])
-        assert exit_code == 0
-
-        # Verify the function was called with correct args
-        assert mock_convert.call_count == 1
-        args = mock_convert.call_args[0][0]
-        assert args.url == "https://example.com"
-        assert args.file is None
-
-        # Verify write_output was called with correct content and None for stdout
-        mock_write.assert_called_once_with("# Markdown Content", None)
-
-    @patch("webdown.cli._convert_to_selected_format")
-    @patch("webdown.cli.write_output")
-    def test_convert_file_to_stdout(
-        self, mock_write: MagicMock, mock_convert: MagicMock
+    def test_convert(
+        self,
+        mock_write: MagicMock,
+        mock_convert: MagicMock,
+        argv: list[str],
+        expected_args: dict[str, Any],
+        converted: tuple[str, str | None],
     ) -> None:
-        """Test converting file to stdout."""
-        # Setup mocks
-        mock_convert.return_value = ("# Markdown Content from File", None)
+        """Test main passes parsed args to the converter and writes its output."""
+        mock_convert.return_value = converted
 
-        # Call main function with file
-        exit_code = main(["-f", "page.html"])
+        exit_code = main(argv)
         assert exit_code == 0
 
-        # Verify the function was called with correct args
-        assert mock_convert.call_count == 1
+        # Verify the parsed arguments reached the converter
+        mock_convert.assert_called_once()
         args = mock_convert.call_args[0][0]
-        assert args.url is None
-        assert args.file == "page.html"
+        for name, value in expected_args.items():
+            assert getattr(args, name) == value
 
-        # Verify write_output was called with correct content and None for stdout
-        mock_write.assert_called_once_with("# Markdown Content from File", None)
+        # Verify write_output received the converted content and output path
+        mock_write.assert_called_once_with(*converted)
 
     @patch("webdown.cli.parse_args")
     def test_main_with_no_args(self, mock_parse_args: MagicMock) -> None:
         """Test the main function handles missing source args properly."""
         # Mock the first call to parse_args to return args with no sources
-        mock_args = MagicMock()
+        mock_args = Mock()
         mock_args.url = None
         mock_args.file = None
 
@@ -659,180 +601,34 @@ class TestMain:
         assert mock_parse_args.call_args_list[0][0][0] == []
         assert mock_parse_args.call_args_list[1][0][0] == ["-h"]
 
-    @patch("webdown.cli._convert_to_selected_format")
-    @patch("webdown.cli.write_output")
-    def test_convert_url_to_file(
-        self, mock_write: MagicMock, mock_convert: MagicMock
-    ) -> None:
-        """Test converting URL to file."""
-        # Setup mocks
-        mock_convert.return_value = ("# Markdown Content", "output.md")
-
-        # Call main function
-        exit_code = main(["-u", "https://example.com", "-o", "output.md"])
-        assert exit_code == 0
-
-        # Verify function was called with correct args
-        assert mock_convert.call_count == 1
-        args = mock_convert.call_args[0][0]
-        assert args.url == "https://example.com"
-        assert args.file is None
-        assert args.output == "output.md"
-
-        # Verify write_output was called with correct content and output path
-        mock_write.assert_called_once_with("# Markdown Content", "output.md")
-
-    @patch("webdown.cli._convert_to_selected_format")
-    @patch("webdown.cli.write_output")
-    def test_convert_file_to_file(
-        self, mock_write: MagicMock, mock_convert: MagicMock
-    ) -> None:
-        """Test converting file to file."""
-        # Setup mocks
-        mock_convert.return_value = ("# Markdown Content from File", "output.md")
-
-        # Call main function
-        exit_code = main(["-f", "page.html", "-o", "output.md"])
-        assert exit_code == 0
-
-        # Verify function was called with correct args
-        assert mock_convert.call_count == 1
-        args = mock_convert.call_args[0][0]
-        assert args.url is None
-        assert args.file == "page.html"
-        assert args.output == "output.md"
-
-        # Verify write_output was called with correct content and output path
-        mock_write.assert_called_once_with("# Markdown Content from File", "output.md")
-
-    @patch("webdown.cli._convert_to_selected_format")
-    @patch("webdown.cli.write_output")
-    def test_claude_xml_conversion(
-        self, mock_write: MagicMock, mock_convert: MagicMock
-    ) -> None:
-        """Test converting to Claude XML."""
-        # Setup mocks
-        mock_convert.return_value = (
-            "<claude_documentation>content</claude_documentation>",
-            None,
-        )
-
-        # Call main function with URL
-        exit_code = main(["-u", "https://example.com", "--claude-xml"])
-        assert exit_code == 0
-
-        # Verify _convert_to_selected_format was called with correct arguments
-        assert mock_convert.call_count == 1
-        args = mock_convert.call_args[0][0]
-        assert args.url == "https://example.com"
-        assert args.claude_xml is True
-
-        # Verify write_output was called with correct content
-        mock_write.assert_called_once_with(
-            "<claude_documentation>content</claude_documentation>", None
-        )
-
-        # Reset mocks
-        mock_convert.reset_mock()
-        mock_write.reset_mock()
-
-        # Test with file output and URL source
-        mock_convert.return_value = (
-            "<claude_documentation>content</claude_documentation>",
-            "output.xml",
-        )
-
-        exit_code = main(
-            ["-u", "https://example.com", "--claude-xml", "-o", "output.xml"]
-        )
-        assert exit_code == 0
-
-        # Verify _convert_to_selected_format was called with correct arguments
-        assert mock_convert.call_count == 1
-        args = mock_convert.call_args[0][0]
-        assert args.url == "https://example.com"
-        assert args.claude_xml is True
-        assert args.output == "output.xml"
-
-        # Verify write_output was called with correct content and output path
-        mock_write.assert_called_once_with(
-            "<claude_documentation>content</claude_documentation>", "output.xml"
-        )
-
-        # Reset mocks
-        mock_convert.reset_mock()
-        mock_write.reset_mock()
-
-        # Test with file source
-        mock_convert.return_value = (
-            "<claude_documentation>file content</claude_documentation>",
-            None,
-        )
-
-        exit_code = main(["-f", "page.html", "--claude-xml"])
-        assert exit_code == 0
-
-        # Verify _convert_to_selected_format was called with correct arguments
-        assert mock_convert.call_count == 1
-        args = mock_convert.call_args[0][0]
-        assert args.file == "page.html"
-        assert args.url is None
-        assert args.claude_xml is True
-
-    def test_error_handling(self) -> None:
-        """Test error handling."""
-        # Test with different types of exceptions
-        exceptions = [
+    @pytest.mark.parametrize(
+        "exception",
+        [
             WebdownError("Invalid URL: not_a_url"),
             WebdownError("Connection error"),
             Exception("Unexpected error"),
-        ]
-
-        # Create a mock that will raise exceptions
-        for exception in exceptions:
-            with patch("webdown.cli._convert_to_selected_format") as mock_convert:
-                mock_convert.side_effect = exception
-
-                # Capture stderr
-                with patch("sys.stderr", new=io.StringIO()) as fake_stderr:
-                    exit_code = main(["-u", "https://example.com"])
-                    assert exit_code == 1
-                    assert str(exception) in fake_stderr.getvalue()
-
-    @patch("sys.exit")
-    def test_main_module(self, mock_exit: MagicMock) -> None:
-        """Test __main__ functionality."""
-        # First verify the file has the expected __main__ block
-        import os
-
-        cli_path = os.path.join(os.path.dirname(__file__), "..", "cli.py")
-        with open(cli_path, "r") as f:
-            content = f.read()
-
-        assert 'if __name__ == "__main__":' in content
-        assert "sys.exit(main())" in content
-
-        # Now actually execute the __main__ block to get coverage
-        # We need to:
-        # 1. Import the module
-        # 2. Set __name__ to "__main__"
-        # 3. Create a fake "main" function that's already mocked
-        # 4. Execute the if-block directly
-
-        # Import the module code as a string
-        module_code = """
-if __name__ == "__main__":
-    sys.exit(main())
-"""
-        # Set up a namespace with mocked functions
-        namespace = {
-            "__name__": "__main__",
-            "sys": sys,
-            "main": lambda: 0,  # Mock main to return 0
-        }
-
-        # Execute the code in this namespace
-        exec(module_code, namespace)
-
-        # Verify sys.exit was called with the return value from main (0)
-        mock_exit.assert_called_once_with(0)
+        ],
+        ids=["invalid", "network", "generic"],
+    )
+    def test_error_handling(
+        self, exception: Exception, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test errors are reported on stderr with a non-zero exit code."""
+        with patch("webdown.cli._convert_to_selected_format") as mock_convert:
+            mock_convert.side_effect = exception
+            exit_code = main(["-u", "https://example.com"])
+
+        assert exit_code == 1
+        assert str(exception) in capsys.readouterr().err
+
+    @pytest.mark.filterwarnings("ignore:'webdown.cli' found in sys.modules")
+    def test_main_module(self, tmp_path: Path) -> None:
+        """Test running the module exits with main's return code."""
+        missing = str(tmp_path / "missing.html")
+        with (
+            patch("sys.argv", ["webdown", "-f", missing]),
+            patch("sys.exit") as mock_exit,
+        ):
+            runpy.run_module("webdown.cli", run_name="__main__")
+
+        mock_exit.assert_called_once_with(1)
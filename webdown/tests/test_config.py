@@ -62,7 +62,6 @@ class TestWebdownConfig:
         with requests_mock.Mocker() as m:
             # Use our sample HTML
             m.get("https://example.com", text=SAMPLE_HTML)
-            m.head("https://example.com", headers={"content-length": "500"})
 
             # Create doc options
             doc_options = DocumentOptions(
@@ -93,10 +92,10 @@ class TestWebdownConfig:
 
             # Use mock to verify converter functions use the config as expected
             with unittest.mock.patch(
-                "webdown.converter.html_to_markdown"
+                "webdown.converter.html_chunks_to_markdown"
             ) as mock_html_to_md:
                 convert_url(config)
-                # Verify html_to_markdown was called with our config object
+                # Verify html_chunks_to_markdown was called with our config object
                 args, kwargs = mock_html_to_md.call_args
                 # Config should be passed as 2nd positional arg
                 assert len(args) >= 2
@@ -5,7 +5,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from webdown.config import DocumentOptions, OutputFormat, WebdownConfig, WebdownError
-from webdown.converter import convert_url
+from webdown.converter import convert_url, convert_urls
 from webdown.error_utils import ErrorCode
 from webdown.html_parser import fetch_url
 from webdown.markdown_converter import html_to_markdown
@@ -121,8 +121,9 @@ class TestFetchUrl:
         mock_tqdm.assert_called_once()
         assert mock_tqdm.call_args[1]["total"] == 1000
 
-        # Verify progress bar was updated for each chunk
-        assert mock_progress.update.call_count == 3
+        # Verify progress bar updates are batched but cover every chunk
+        assert mock_progress.update.call_count <= 3
+        assert sum(c.args[0] for c in mock_progress.update.call_args_list) == 18
 
 
 class TestHtmlToMarkdown:
@@ -136,6 +137,13 @@ class TestHtmlToMarkdown:
         assert "# Title" in result
         assert "Paragraph" in result
 
+    def test_conversions_do_not_share_state(self) -> None:
+        """Test that unclosed tags in one document don't affect the next."""
+        config = WebdownConfig()
+        html_to_markdown("<p>Broken<style>body { color: red }", config)
+        result = html_to_markdown("<p>Next page</p>", config)
+        assert "Next page" in result
+
     @patch("webdown.markdown_converter.html2text.HTML2Text")
     def test_link_options(self, mock_html2text_class: MagicMock) -> None:
         """Test link inclusion/exclusion options."""
@@ -207,8 +215,9 @@ class TestHtmlToMarkdown:
         # Setup BeautifulSoup mock
         mock_soup = MagicMock()
         mock_beautiful_soup.return_value = mock_soup
-        # Instead of using __str__, directly use a string as the content
-        mock_soup.select.return_value = ["<div>Selected content</div>"]
+        mock_element = MagicMock()
+        mock_element.decode.return_value = "<div>Selected content</div>"
+        mock_soup.select.return_value = [mock_element]
 
         config = WebdownConfig(css_selector="main")
         html_to_markdown("<html><body>Test</body></html>", config)
@@ -300,14 +309,14 @@ class TestHtmlToMarkdown:
 class TestConvertUrlToMarkdown:
     """Tests for convert_url function."""
 
-    @patch("webdown.converter.fetch_url")
-    @patch("webdown.converter.html_to_markdown")
+    @patch("webdown.converter.fetch_url_chunks")
+    @patch("webdown.converter.html_chunks_to_markdown")
     def test_conversion_pipeline(
-        self, mock_html_to_markdown: MagicMock, mock_fetch_url: MagicMock
+        self, mock_html_chunks_to_markdown: MagicMock, mock_fetch_url: MagicMock
     ) -> None:
         """Test that conversion pipeline works correctly."""
-        mock_fetch_url.return_value = "<html><body>Test</body></html>"
-        mock_html_to_markdown.return_value = "# Test\n\nContent"
+        mock_fetch_url.return_value = ["<html><body>Test</body></html>"]
+        mock_html_chunks_to_markdown.return_value = "# Test\n\nContent"
 
         doc_options = DocumentOptions(include_toc=True)
         config = WebdownConfig(
@@ -319,14 +328,14 @@ class TestConvertUrlToMarkdown:
         )
         result = convert_url(config)
 
-        # Verify fetch_url was called correctly
+        # Verify fetch_url_chunks was called correctly
         mock_fetch_url.assert_called_once_with(
             "https://example.com", show_progress=False
         )
 
-        # Verify html_to_markdown was called with config object as positional arg
-        args, kwargs = mock_html_to_markdown.call_args
-        assert args[0] == "<html><body>Test</body></html>"  # First arg is HTML
+        # Verify html_chunks_to_markdown was called with config object as positional arg
+        args, kwargs = mock_html_chunks_to_markdown.call_args
+        assert args[0] == ["<html><body>Test</body></html>"]  # First arg is HTML
         assert len(args) >= 2  # Should have at least 2 args
         assert args[1].url == config.url
         assert args[1].include_links == config.include_links
@@ -336,17 +345,17 @@ class TestConvertUrlToMarkdown:
         )
         assert args[1].css_selector == config.css_selector
 
-        # Verify result is returned from html_to_markdown
+        # Verify result is returned from html_chunks_to_markdown
         assert result == "# Test\n\nContent"
 
-    @patch("webdown.converter.fetch_url")
-    @patch("webdown.converter.html_to_markdown")
+    @patch("webdown.converter.fetch_url_chunks")
+    @patch("webdown.converter.html_chunks_to_markdown")
     def test_conversion_with_progress_bar(
-        self, mock_html_to_markdown: MagicMock, mock_fetch_url: MagicMock
+        self, mock_html_chunks_to_markdown: MagicMock, mock_fetch_url: MagicMock
     ) -> None:
         """Test that conversion pipeline works correctly with progress bar."""
-        mock_fetch_url.return_value = "<html><body>Test</body></html>"
-        mock_html_to_markdown.return_value = "# Test\n\nContent"
+        mock_fetch_url.return_value = ["<html><body>Test</body></html>"]
+        mock_html_chunks_to_markdown.return_value = "# Test\n\nContent"
 
         config = WebdownConfig(
             url="https://example.com",
@@ -354,30 +363,30 @@ class TestConvertUrlToMarkdown:
         )
         result = convert_url(config)
 
-        # Verify fetch_url was called with show_progress=True
+        # Verify fetch_url_chunks was called with show_progress=True
         mock_fetch_url.assert_called_once_with(
             "https://example.com", show_progress=True
         )
 
-        # Verify html_to_markdown was called with config object as positional arg
-        args, kwargs = mock_html_to_markdown.call_args
-        assert args[0] == "<html><body>Test</body></html>"  # First arg is HTML
+        # Verify html_chunks_to_markdown was called with config object as positional arg
+        args, kwargs = mock_html_chunks_to_markdown.call_args
+        assert args[0] == ["<html><body>Test</body></html>"]  # First arg is HTML
         assert len(args) >= 2  # Should have at least 2 args
         assert args[1].url == config.url
         assert args[1].include_links == config.include_links
         assert args[1].include_images == config.include_images
 
-        # Verify result is returned from html_to_markdown
+        # Verify result is returned from html_chunks_to_markdown
         assert result == "# Test\n\nContent"
 
-    @patch("webdown.converter.fetch_url")
-    @patch("webdown.converter.html_to_markdown")
+    @patch("webdown.converter.fetch_url_chunks")
+    @patch("webdown.converter.html_chunks_to_markdown")
     def test_conversion_with_custom_body_width(
-        self, mock_html_to_markdown: MagicMock, mock_fetch_url: MagicMock
+        self, mock_html_chunks_to_markdown: MagicMock, mock_fetch_url: MagicMock
     ) -> None:
-        """Test that custom body_width is passed to html_to_markdown."""
-        mock_fetch_url.return_value = "<html><body>Test</body></html>"
-        mock_html_to_markdown.return_value = "# Test\n\nContent"
+        """Test that custom body_width is passed to html_chunks_to_markdown."""
+        mock_fetch_url.return_value = ["<html><body>Test</body></html>"]
+        mock_html_chunks_to_markdown.return_value = "# Test\n\nContent"
 
         doc_options = DocumentOptions(body_width=80)
         config = WebdownConfig(
@@ -386,24 +395,24 @@ class TestConvertUrlToMarkdown:
         )
         result = convert_url(config)
 
-        # Verify html_to_markdown was called with config object as positional arg
-        args, kwargs = mock_html_to_markdown.call_args
-        assert args[0] == "<html><body>Test</body></html>"  # First arg is HTML
+        # Verify html_chunks_to_markdown was called with config object as positional arg
+        args, kwargs = mock_html_chunks_to_markdown.call_args
+        assert args[0] == ["<html><body>Test</body></html>"]  # First arg is HTML
         assert len(args) >= 2  # Should have at least 2 args
         assert args[1].url == config.url
         assert args[1].document_options.body_width == 80
 
-        # Verify result is returned from html_to_markdown
+        # Verify result is returned from html_chunks_to_markdown
         assert result == "# Test\n\nContent"
 
-    @patch("webdown.converter.fetch_url")
-    @patch("webdown.converter.html_to_markdown")
+    @patch("webdown.converter.fetch_url_chunks")
+    @patch("webdown.converter.html_chunks_to_markdown")
     def test_conversion_with_config_object(
-        self, mock_html_to_markdown: MagicMock, mock_fetch_url: MagicMock
+        self, mock_html_chunks_to_markdown: MagicMock, mock_fetch_url: MagicMock
     ) -> None:
         """Test conversion using the WebdownConfig object."""
-        mock_fetch_url.return_value = "<html><body>Test</body></html>"
-        mock_html_to_markdown.return_value = "# Test\n\nContent"
+        mock_fetch_url.return_value = ["<html><body>Test</body></html>"]
+        mock_html_chunks_to_markdown.return_value = "# Test\n\nContent"
 
         # Create document options
         doc_options = DocumentOptions(
@@ -421,68 +430,63 @@ class TestConvertUrlToMarkdown:
 
         result = convert_url(config)
 
-        # Verify fetch_url was called with show_progress=True from config
+        # Verify fetch_url_chunks was called with show_progress=True from config
         mock_fetch_url.assert_called_once_with(
             "https://example.com", show_progress=True
         )
 
-        # Verify html_to_markdown was called with config object as positional arg
-        args, kwargs = mock_html_to_markdown.call_args
-        assert args[0] == "<html><body>Test</body></html>"
+        # Verify html_chunks_to_markdown was called with config object as positional arg
+        args, kwargs = mock_html_chunks_to_markdown.call_args
+        assert args[0] == ["<html><body>Test</body></html>"]
         assert args[1] == config
 
-        # Verify result is returned from html_to_markdown
+        # Verify result is returned from html_chunks_to_markdown
         assert result == "# Test\n\nContent"
 
     @patch("webdown.html_parser.requests.head")
     @patch("webdown.html_parser.requests.get")
-    @patch("webdown.converter.html_to_markdown")
+    @patch("webdown.converter.fetch_url")
     def test_streaming_mode(
         self,
-        mock_html_to_markdown: MagicMock,
+        mock_fetch: MagicMock,
         mock_get: MagicMock,
         mock_head: MagicMock,
     ) -> None:
-        """Test streaming mode for large documents."""
-        # Setup mock HEAD response to trigger streaming (exceeds 10MB threshold)
-        mock_head_response = MagicMock()
-        mock_head_response.headers = {"content-length": "20000000"}  # 20MB
-        mock_head.return_value = mock_head_response
-
-        # Setup mock GET response for streaming
+        """Test that pages are converted from a single streamed GET request."""
+        # Setup mock GET response for streaming, splitting text and a
+        # multi-byte character across chunks
         mock_get_response = MagicMock()
         mock_get_response.headers = {"content-length": "20000000"}
+        mock_get_response.encoding = "utf-8"
         mock_get_response.iter_content.return_value = [
             b"<html><body>",
-            b"<h1>Test</h1>",
-            b"<p>Content</p>",
+            b"<h1>Te",
+            b"st</h1><p>Caf\xc3",
+            b"\xa9 <b>bo",
+            b"ld</b></p>",
             b"</body></html>",
         ]
         mock_get.return_value = mock_get_response
 
-        # Mock html_to_markdown
-        mock_html_to_markdown.return_value = "# Test\n\nContent"
-
-        # Create document options
-        doc_options = DocumentOptions(include_toc=True)
-
-        # Create a config for automated streaming (>10MB)
-        config = WebdownConfig(
-            url="https://example.com",
-            document_options=doc_options,
-        )
+        config = WebdownConfig(url="https://example.com")
 
         # Call the function
         result = convert_url(config)
 
-        # Verify the result
-        assert result == "# Test\n\nContent"
+        # Verify the chunks were converted exactly like the whole document
+        html = "<html><body><h1>Test</h1><p>Caf\u00e9 <b>bold</b></p></body></html>"
+        assert result == html_to_markdown(html, config)
+        assert "Caf\u00e9 **bold**" in result
 
-        # Verify HEAD request was made to check size
-        mock_head.assert_called_once_with("https://example.com", timeout=5)
+        # Verify the whole document was never fetched as a single string
+        mock_fetch.assert_not_called()
 
-        # Verify GET request was made with stream=True
+        # Verify no HEAD request was made to check the size first
+        mock_head.assert_not_called()
+
+        # Verify GET request was made with stream=True and the response closed
         mock_get.assert_called_once_with("https://example.com", timeout=10, stream=True)
+        mock_get_response.close.assert_called_once()
 
     def test_config_missing_url(self) -> None:
         """Test that WebdownConfig without URL raises an error."""
@@ -497,20 +501,18 @@ class TestConvertUrlToMarkdown:
 
         assert "URL must be provided" in str(exc_info.value)
 
-    @patch("webdown.converter._check_streaming_needed")
-    @patch("webdown.converter.fetch_url")
-    @patch("webdown.converter.html_to_markdown")
+    @patch("webdown.converter.fetch_url_chunks")
+    @patch("webdown.converter.html_chunks_to_markdown")
     @patch("webdown.converter.markdown_to_claude_xml")
     def test_claude_xml_format(
         self,
         mock_to_xml: MagicMock,
         mock_html_to_md: MagicMock,
         mock_fetch: MagicMock,
-        mock_check: MagicMock,
     ) -> None:
         """Test conversion with Claude XML format."""
         # Setup mocks
-        mock_fetch.return_value = "<html><body>Content</body></html>"
+        mock_fetch.return_value = ["<html><body>Content</body></html>"]
         mock_html_to_md.return_value = "# Test\n\nContent"
         mock_to_xml.return_value = (
             "<claude_documentation>XML content</claude_documentation>"
@@ -538,7 +540,7 @@ class TestConvertUrlToMarkdown:
         assert "Invalid URL" in str(exc_info.value)
         assert exc_info.value.code == "URL_INVALID"
 
-    @patch("webdown.converter.fetch_url")
+    @patch("webdown.converter.fetch_url_chunks")
     def test_unexpected_exception_handling(self, mock_fetch: MagicMock) -> None:
         """Test handling of unexpected exceptions in the converter."""
         mock_fetch.side_effect = RuntimeError("Unexpected error")
@@ -549,3 +551,30 @@ class TestConvertUrlToMarkdown:
         assert "Error fetching" in str(exc_info.value)
         assert "Unexpected error" in str(exc_info.value)
         assert exc_info.value.code == "UNEXPECTED_ERROR"
+
+
+class TestConvertUrls:
+    """Tests for convert_urls function."""
+
+    @patch("webdown.converter.fetch_url_chunks")
+    def test_converts_pages_in_input_order(self, mock_fetch: MagicMock) -> None:
+        """Test that every page is converted and results keep input order."""
+        mock_fetch.side_effect = lambda url, show_progress: [f"<h1>{url[-1]}</h1>"]
+        urls = [f"https://example.com/{name}" for name in "abc"]
+
+        results = convert_urls(urls, max_workers=3)
+
+        assert mock_fetch.call_count == 3
+        assert [result.strip() for result in results] == ["# a", "# b", "# c"]
+
+    @patch("webdown.converter.fetch_url_chunks")
+    def test_raises_first_failure(self, mock_fetch: MagicMock) -> None:
+        """Test that a failed page raises WebdownError."""
+        mock_fetch.side_effect = lambda url, show_progress: (
+            ["<p>ok</p>"] if url.endswith("good") else 1 / 0
+        )
+
+        with pytest.raises(WebdownError) as exc_info:
+            convert_urls(["https://example.com/good", "https://example.com/bad"])
+
+        assert "https://example.com/bad" in str(exc_info.value)
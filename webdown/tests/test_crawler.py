@@ -2,11 +2,18 @@
 
 import os
 import tempfile
+from unittest.mock import MagicMock, patch
 
+import pytest
+
+from webdown.config import WebdownConfig, WebdownError
 from webdown.crawler import (
     CrawlerConfig,
     _crawl_single_page,
     _extract_xml_title,
+    _HostThrottle,
+    _make_session,
+    _mark_visited,
     crawl,
     crawl_from_sitemap,
 )
@@ -29,6 +36,7 @@ class TestCrawlerConfig:
         assert config.path_prefix is None
         assert config.verbose is True
         assert config.max_pages == 0
+        assert config.max_concurrent == 1
 
     def test_custom_values(self) -> None:
         """Test custom configuration values."""
@@ -57,8 +65,6 @@ class TestCrawl:
         self, requests_mock
     ) -> None:
         """Test crawling a single page with no links."""
-        # Mock HEAD request for streaming check
-        requests_mock.head("https://example.com/", headers={"content-length": "100"})
         requests_mock.get(
             "https://example.com/",
             text="<html><body><h1>Test</h1><p>Content</p></body></html>",
@@ -86,18 +92,59 @@ class TestCrawl:
             manifest_path = os.path.join(tmpdir, "index.json")
             assert os.path.exists(manifest_path)
 
-    def test_crawl_with_links(  # type: ignore[no-untyped-def]
+    def test_crawl_decodes_undeclared_charset_as_utf8(  # type: ignore[no-untyped-def]
         self, requests_mock
     ) -> None:
-        """Test crawling pages with links."""
-        # Mock HEAD requests for streaming check
-        requests_mock.head("https://example.com/", headers={"content-length": "100"})
-        requests_mock.head(
-            "https://example.com/page1", headers={"content-length": "100"}
+        """Test that a page without a declared charset is decoded as UTF-8."""
+        body = "<html><body><p>café naïve</p></body></html>".encode("utf-8")
+        requests_mock.get(
+            "https://example.com/",
+            content=body,
+            headers={"Content-Type": "text/html", "Content-Length": str(len(body))},
         )
-        requests_mock.head(
-            "https://example.com/page2", headers={"content-length": "100"}
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config = CrawlerConfig(
+                seed_urls=["https://example.com/"],
+                output_dir=tmpdir,
+                max_depth=0,
+                delay_seconds=0,
+                verbose=False,
+            )
+            result = crawl(config)
+
+            assert result.successful_count == 1
+            output_path = os.path.join(tmpdir, "example.com", "index.md")
+            with open(output_path, encoding="utf-8") as f:
+                assert "café naïve" in f.read()
+
+    def test_crawl_skips_link_extraction_at_max_depth(  # type: ignore[no-untyped-def]
+        self, requests_mock
+    ) -> None:
+        """Test that pages at max_depth are not scanned for links."""
+        requests_mock.get(
+            "https://example.com/",
+            text='<html><body><a href="/page1">Page 1</a></body></html>',
         )
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config = CrawlerConfig(
+                seed_urls=["https://example.com/"],
+                output_dir=tmpdir,
+                max_depth=0,
+                delay_seconds=0,
+                verbose=False,
+            )
+            with patch("webdown.crawler._find_link_candidates") as mock_find:
+                result = crawl(config)
+
+            assert result.successful_count == 1
+            mock_find.assert_not_called()
+
+    def test_crawl_with_links(  # type: ignore[no-untyped-def]
+        self, requests_mock
+    ) -> None:
+        """Test crawling pages with links."""
         requests_mock.get(
             "https://example.com/",
             text="""<html><body>
@@ -132,14 +179,6 @@ class TestCrawl:
         self, requests_mock
     ) -> None:
         """Test that crawl respects max_depth setting."""
-        # Mock HEAD requests
-        requests_mock.head("https://example.com/", headers={"content-length": "100"})
-        requests_mock.head(
-            "https://example.com/level1", headers={"content-length": "100"}
-        )
-        requests_mock.head(
-            "https://example.com/level2", headers={"content-length": "100"}
-        )
         requests_mock.get(
             "https://example.com/",
             text='<html><body><a href="/level1">L1</a></body></html>',
@@ -173,12 +212,6 @@ class TestCrawl:
         self, requests_mock
     ) -> None:
         """Test that crawl respects max_pages setting."""
-        # Mock HEAD requests
-        requests_mock.head("https://example.com/", headers={"content-length": "100"})
-        for i in range(1, 4):
-            requests_mock.head(
-                f"https://example.com/page{i}", headers={"content-length": "100"}
-            )
         requests_mock.get(
             "https://example.com/",
             text="""<html><body>
@@ -206,15 +239,187 @@ class TestCrawl:
 
             assert len(result.pages) == 2
 
+    def test_crawl_fetches_each_page_once(  # type: ignore[no-untyped-def]
+        self, requests_mock
+    ) -> None:
+        """Test that links are found in the download used for conversion."""
+        requests_mock.get(
+            "https://example.com/",
+            text='<html><body><a href="/page1">P1</a></body></html>',
+        )
+        requests_mock.get(
+            "https://example.com/page1",
+            text='<html><body><a href="/page2">P2</a></body></html>',
+        )
+        requests_mock.get(
+            "https://example.com/page2",
+            text="<html><body>Page 2</body></html>",
+        )
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config = CrawlerConfig(
+                seed_urls=["https://example.com/"],
+                output_dir=tmpdir,
+                max_depth=2,
+                delay_seconds=0,
+                verbose=False,
+            )
+            result = crawl(config)
+
+            assert result.successful_count == 3
+            assert [request.url for request in requests_mock.request_history] == [
+                "https://example.com/",
+                "https://example.com/page1",
+                "https://example.com/page2",
+            ]
+
+    def test_concurrent_crawl_keeps_order(  # type: ignore[no-untyped-def]
+        self, requests_mock
+    ) -> None:
+        """Test that concurrent crawls record pages in breadth-first order."""
+        requests_mock.get(
+            "https://example.com/",
+            text="".join(f'<a href="/page{i}">P{i}</a>' for i in range(1, 6)),
+        )
+        for i in range(1, 6):
+            requests_mock.get(
+                f"https://example.com/page{i}",
+                text=f'<html><body>Page {i} <a href="/page{i}/sub">S</a></body></html>',
+            )
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config = CrawlerConfig(
+                seed_urls=["https://example.com/"],
+                output_dir=tmpdir,
+                max_depth=1,
+                delay_seconds=0,
+                verbose=False,
+                max_pages=5,
+                max_concurrent=3,
+            )
+            result = crawl(config)
+
+            assert [page.url for page in result.pages] == [
+                "https://example.com/",
+            ] + [f"https://example.com/page{i}" for i in range(1, 5)]
+            assert result.successful_count == 5
+
+    def test_crawl_resumes_from_checkpoint(  # type: ignore[no-untyped-def]
+        self, requests_mock
+    ) -> None:
+        """Test that a resumed crawl replays checkpointed pages unfetched."""
+        requests_mock.get(
+            "https://example.com/",
+            text='<a href="/page1">P1</a><a href="/page2">P2</a>',
+        )
+        requests_mock.get(
+            "https://example.com/page1",
+            text='<html><body><a href="/page3">P3</a></body></html>',
+        )
+        for i in (2, 3):
+            requests_mock.get(
+                f"https://example.com/page{i}",
+                text=f"<html><body>Page {i}</body></html>",
+            )
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config = CrawlerConfig(
+                seed_urls=["https://example.com/"],
+                output_dir=tmpdir,
+                max_depth=2,
+                delay_seconds=0,
+                verbose=False,
+                max_pages=2,
+                checkpoint_path=os.path.join(tmpdir, "checkpoint.jsonl"),
+            )
+            crawl(config)
+            requests_mock.reset_mock()
+
+            config.max_pages = 0
+            result = crawl(config)
+
+            assert [page.url for page in result.pages] == [
+                "https://example.com/",
+                "https://example.com/page1",
+                "https://example.com/page2",
+                "https://example.com/page3",
+            ]
+            assert result.successful_count == 4
+            assert [request.url for request in requests_mock.request_history] == [
+                "https://example.com/page2",
+                "https://example.com/page3",
+            ]
+
+    def test_crawl_resume_refetches_failed_write(  # type: ignore[no-untyped-def]
+        self, requests_mock
+    ) -> None:
+        """Test that a page is only checkpointed once its file is written."""
+        requests_mock.get(
+            "https://example.com/",
+            text="<html><body><h1>Home</h1></body></html>",
+        )
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config = CrawlerConfig(
+                seed_urls=["https://example.com/"],
+                output_dir=tmpdir,
+                max_depth=0,
+                delay_seconds=0,
+                verbose=False,
+                checkpoint_path=os.path.join(tmpdir, "checkpoint.jsonl"),
+            )
+            with patch(
+                "webdown.output_manager.write_output_file",
+                side_effect=OSError("disk full"),
+            ):
+                first = crawl(config)
+            assert first.pages[0].status == "error"
+
+            requests_mock.reset_mock()
+            result = crawl(config)
+
+            assert result.successful_count == 1
+            assert requests_mock.call_count == 1
+            assert os.path.exists(os.path.join(tmpdir, "example.com", "index.md"))
+
+    def test_crawl_reports_checkpoint_error(  # type: ignore[no-untyped-def]
+        self, requests_mock
+    ) -> None:
+        """Test that a failing checkpoint callback is reported, not hung on."""
+        requests_mock.get(
+            "https://example.com/",
+            text='<html><body><a href="/page1">Page 1</a></body></html>',
+        )
+        requests_mock.get(
+            "https://example.com/page1",
+            text="<html><body><h1>Page 1</h1></body></html>",
+        )
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config = CrawlerConfig(
+                seed_urls=["https://example.com/"],
+                output_dir=tmpdir,
+                max_depth=1,
+                delay_seconds=0,
+                verbose=False,
+                checkpoint_path=os.path.join(tmpdir, "checkpoint.jsonl"),
+            )
+            with patch(
+                "webdown.crawler.CrawlCheckpoint.record",
+                side_effect=ValueError("cannot serialize"),
+            ):
+                result = crawl(config)
+
+            assert [page.status for page in result.pages] == ["error", "error"]
+            assert all(
+                "cannot serialize" in (page.error_message or "")
+                for page in result.pages
+            )
+
     def test_crawl_deduplicates_urls(  # type: ignore[no-untyped-def]
         self, requests_mock
     ) -> None:
         """Test that crawl doesn't visit the same URL twice."""
-        # Mock HEAD requests
-        requests_mock.head("https://example.com/", headers={"content-length": "100"})
-        requests_mock.head(
-            "https://example.com/page", headers={"content-length": "100"}
-        )
         requests_mock.get(
             "https://example.com/",
             text="""<html><body>
@@ -245,11 +450,6 @@ class TestCrawl:
         self, requests_mock
     ) -> None:
         """Test that crawl handles page errors gracefully."""
-        # Mock HEAD requests
-        requests_mock.head("https://example.com/", headers={"content-length": "100"})
-        requests_mock.head(
-            "https://example.com/error", headers={"content-length": "100"}
-        )
         requests_mock.get(
             "https://example.com/",
             text='<html><body><a href="/error">Error</a></body></html>',
@@ -272,6 +472,52 @@ class TestCrawl:
             assert result.successful_count == 1
             assert result.error_count == 1
 
+    def test_crawl_rejects_invalid_selector(self) -> None:
+        """Test that invalid conversion options fail before any page is fetched."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config = CrawlerConfig(
+                seed_urls=["https://example.com/"],
+                output_dir=tmpdir,
+                verbose=False,
+                conversion_config=WebdownConfig(css_selector="[[invalid"),
+            )
+            with (
+                patch("webdown.crawler.requests.Session.close") as mock_close,
+                pytest.raises(WebdownError) as exc_info,
+            ):
+                crawl(config)
+            assert exc_info.value.code == "CSS_SELECTOR_INVALID"
+            mock_close.assert_called_once()
+
+    def test_crawl_reports_write_errors(  # type: ignore[no-untyped-def]
+        self, requests_mock
+    ) -> None:
+        """Test that a failed background write marks the page as an error."""
+        requests_mock.get(
+            "https://example.com/",
+            text="<html><body><h1>Test</h1></body></html>",
+        )
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            # A file where the domain directory should be blocks the write
+            with open(os.path.join(tmpdir, "example.com"), "w") as f:
+                f.write("")
+
+            config = CrawlerConfig(
+                seed_urls=["https://example.com/"],
+                output_dir=tmpdir,
+                max_depth=0,
+                delay_seconds=0,
+                verbose=False,
+            )
+            result = crawl(config)
+
+            assert result.successful_count == 0
+            assert result.error_count == 1
+            error_message = result.pages[0].error_message
+            assert error_message is not None
+            assert error_message.startswith("Failed to write output")
+
 
 class TestCrawlFromSitemap:
     """Tests for crawl_from_sitemap function."""
@@ -287,13 +533,6 @@ class TestCrawlFromSitemap:
         </urlset>
         """
         requests_mock.get("https://example.com/sitemap.xml", text=sitemap)
-        # Mock HEAD requests
-        requests_mock.head(
-            "https://example.com/page1", headers={"content-length": "100"}
-        )
-        requests_mock.head(
-            "https://example.com/page2", headers={"content-length": "100"}
-        )
         requests_mock.get(
             "https://example.com/page1",
             text="<html><body><h1>Page 1</h1></body></html>",
@@ -315,6 +554,103 @@ class TestCrawlFromSitemap:
             assert result.successful_count == 2
             assert len(result.pages) == 2
 
+    def test_concurrent_crawl_from_sitemap(  # type: ignore[no-untyped-def]
+        self, requests_mock
+    ) -> None:
+        """Test that concurrent sitemap crawls keep order and the page limit."""
+        urls = [f"https://example.com/page{i}" for i in range(1, 6)]
+        requests_mock.get(
+            "https://example.com/sitemap.xml",
+            text='<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+            + "".join(f"<url><loc>{url}</loc></url>" for url in urls)
+            + "</urlset>",
+        )
+        for url in urls:
+            requests_mock.get(url, text=f"<html><body>{url}</body></html>")
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config = CrawlerConfig(
+                seed_urls=[],
+                output_dir=tmpdir,
+                delay_seconds=0,
+                verbose=False,
+                max_pages=4,
+                max_concurrent=3,
+            )
+            result = crawl_from_sitemap("https://example.com/sitemap.xml", config)
+
+            assert [page.url for page in result.pages] == urls[:4]
+            assert result.successful_count == 4
+
+
+class TestMakeSession:
+    """Tests for _make_session function."""
+
+    def test_pool_fits_concurrent_fetches(self) -> None:
+        """Test that the connection pool grows with max_concurrent."""
+        config = CrawlerConfig(
+            seed_urls=["https://example.com/"],
+            output_dir="/output",
+            max_concurrent=32,
+        )
+        with _make_session(config) as session:
+            adapter = session.get_adapter("https://example.com/")
+            assert adapter._pool_maxsize == 32  # type: ignore[attr-defined]
+
+    def test_retries_transient_errors(self) -> None:
+        """Test that server errors and rate limiting responses are retried."""
+        config = CrawlerConfig(seed_urls=[], output_dir="/output")
+        with _make_session(config) as session:
+            adapter = session.get_adapter("http://example.com/")
+            retries = adapter.max_retries  # type: ignore[attr-defined]
+            assert retries.total == 5
+            assert 429 in retries.status_forcelist
+            assert 503 in retries.status_forcelist
+
+    def test_retry_after_is_capped(self) -> None:
+        """Test that a long Retry-After wait is cut to the retry cap."""
+        config = CrawlerConfig(seed_urls=[], output_dir="/output")
+        with _make_session(config) as session:
+            adapter = session.get_adapter("https://example.com/")
+            retries = adapter.max_retries  # type: ignore[attr-defined]
+            response = MagicMock()
+            response.headers = {"Retry-After": "86400"}
+            assert retries.get_retry_after(response) == 30.0
+            response.headers = {"Retry-After": "2"}
+            assert retries.get_retry_after(response) == 2.0
+            response.headers = {}
+            assert retries.get_retry_after(response) is None
+            assert type(retries.new()) is type(retries)
+            assert retries.backoff_max == 30.0
+
+
+class TestHostThrottle:
+    """Tests for _HostThrottle class."""
+
+    @patch("webdown.crawler.time.sleep")
+    @patch("webdown.crawler.time.monotonic", return_value=100.0)
+    def test_delays_same_host_only(
+        self, mock_monotonic: MagicMock, mock_sleep: MagicMock
+    ) -> None:
+        """Test that only repeated requests to one host are delayed."""
+        throttle = _HostThrottle(2.0)
+
+        throttle.wait("https://a.example.com/1")
+        throttle.wait("https://b.example.com/1")
+        mock_sleep.assert_not_called()
+
+        throttle.wait("https://a.example.com/2")
+        throttle.wait("https://a.example.com/3")
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [2.0, 4.0]
+
+    @patch("webdown.crawler.time.sleep")
+    def test_no_delay(self, mock_sleep: MagicMock) -> None:
+        """Test that a zero delay never sleeps."""
+        throttle = _HostThrottle(0)
+        for _ in range(3):
+            throttle.wait("https://example.com/")
+        mock_sleep.assert_not_called()
+
 
 class TestExtractXmlTitle:
     """Tests for _extract_xml_title function."""
@@ -329,6 +665,28 @@ class TestExtractXmlTitle:
         content = "<document><content>No title here</content></document>"
         assert _extract_xml_title(content) is None
 
+    def test_skips_empty_and_nested_titles(self) -> None:
+        """Test that only a title with plain, non-empty text is returned."""
+        assert _extract_xml_title("<title></title><title>Second</title>") == "Second"
+        assert _extract_xml_title("<title>a <b>b</b></title>") is None
+
+
+class TestMarkVisited:
+    """Tests for _mark_visited function."""
+
+    def test_new_url_is_recorded(self) -> None:
+        """Test that an unseen URL is reported as new and recorded."""
+        visited: set[int] = set()
+        assert _mark_visited("https://example.com/page", visited) is True
+        assert len(visited) == 1
+
+    def test_seen_url_is_rejected(self) -> None:
+        """Test that a URL already recorded is reported as seen."""
+        visited: set[int] = set()
+        assert _mark_visited("https://example.com/page", visited) is True
+        assert _mark_visited("https://example.com/page", visited) is False
+        assert len(visited) == 1
+
 
 class TestCrawlSinglePage:
     """Tests for _crawl_single_page function."""
@@ -337,10 +695,6 @@ class TestCrawlSinglePage:
         self, requests_mock
     ) -> None:
         """Test successful single page crawl."""
-        # Mock HEAD request
-        requests_mock.head(
-            "https://example.com/page", headers={"content-length": "100"}
-        )
         requests_mock.get(
             "https://example.com/page",
             text="<html><body><h1>Test</h1></body></html>",
@@ -367,10 +721,6 @@ class TestCrawlSinglePage:
 
     def test_failed_crawl(self, requests_mock) -> None:  # type: ignore[no-untyped-def]
         """Test failed single page crawl."""
-        # Mock HEAD request
-        requests_mock.head(
-            "https://example.com/error", headers={"content-length": "100"}
-        )
         requests_mock.get(
             "https://example.com/error",
             status_code=500,
@@ -1,5 +1,7 @@
 """Tests for HTML parser functionality."""
 
+import threading
+from typing import Iterator
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -10,12 +12,13 @@ from tqdm import tqdm
 from webdown.config import WebdownError
 from webdown.error_utils import ErrorCode, handle_request_exception
 from webdown.html_parser import (
-    _check_streaming_needed,
     _create_progress_bar,
+    _get_content_length,
     _handle_small_response,
     _process_response_chunks,
     extract_content_with_css,
     fetch_url,
+    fetch_url_chunks,
     fetch_url_with_progress,
     is_valid_url,
 )
@@ -76,7 +79,7 @@ class TestResponseProcessing:
 
         # Verify results
         assert result == "chunk1chunk2"
-        assert mock_bar.update.call_count == 2
+        assert sum(c.args[0] for c in mock_bar.update.call_args_list) == 12
 
     def test_process_response_chunks_text(self) -> None:
         """Test processing response chunks with text content."""
@@ -92,30 +95,50 @@ class TestResponseProcessing:
 
         # Verify results
         assert result == "text1text2"
-        assert mock_bar.update.call_count == 2
+        assert sum(c.args[0] for c in mock_bar.update.call_args_list) == 10
+
+    def test_process_response_chunks_batches_updates(self) -> None:
+        """Test that small chunks are reported to the progress bar in batches."""
+        mock_response = MagicMock()
+        mock_response.iter_content.return_value = [b"x" * 1024] * 200
+        mock_bar = MagicMock()
+
+        with patch("webdown.html_parser.time.monotonic", return_value=0.0):
+            _process_response_chunks(mock_response, mock_bar, 1024)
+
+        assert mock_bar.update.call_count == 4
+        assert sum(c.args[0] for c in mock_bar.update.call_args_list) == 200 * 1024
 
     def test_handle_small_response(self) -> None:
         """Test handling small response optimization."""
         # Small response with progress off should return text directly
         mock_small = MagicMock()
-        mock_small.headers = {"content-length": "500"}
         mock_small.text = "small content"
-        assert _handle_small_response(mock_small, False) == "small content"
+        assert _handle_small_response(mock_small, False, 500) == "small content"
 
         # Small response with progress on should return None (use streaming)
         mock_small_progress = MagicMock()
-        mock_small_progress.headers = {"content-length": "500"}
-        assert _handle_small_response(mock_small_progress, True) is None
+        assert _handle_small_response(mock_small_progress, True, 500) is None
 
         # Large response should return None (use streaming)
         mock_large = MagicMock()
-        mock_large.headers = {"content-length": "2000000"}  # 2MB
-        assert _handle_small_response(mock_large, False) is None
+        assert _handle_small_response(mock_large, False, 2000000) is None  # 2MB
 
         # No content-length should return None (use streaming)
         mock_no_length = MagicMock()
-        mock_no_length.headers = {}
-        assert _handle_small_response(mock_no_length, False) is None
+        assert _handle_small_response(mock_no_length, False, None) is None
+
+    def test_get_content_length(self) -> None:
+        """Test reading the Content-Length header."""
+        mock_response = MagicMock()
+        mock_response.headers = {"content-length": "500"}
+        assert _get_content_length(mock_response) == 500
+
+        # Missing or malformed headers are treated as unknown
+        mock_response.headers = {}
+        assert _get_content_length(mock_response) is None
+        mock_response.headers = {"content-length": "unknown"}
+        assert _get_content_length(mock_response) is None
 
 
 class TestRequestExceptionHandling:
@@ -189,6 +212,103 @@ class TestFetching:
         assert exc_info.value.code == ErrorCode.NETWORK_TIMEOUT
         assert "Timeout error" in str(exc_info.value)
 
+    @patch("webdown.html_parser.requests.get")
+    def test_fetch_url_with_session(self, mock_get: MagicMock) -> None:
+        """Test that a provided session is used instead of a one-off request."""
+        session = MagicMock()
+        session.get.return_value.headers = {"content-length": "500"}
+        session.get.return_value.text = "pooled content"
+
+        result = fetch_url_with_progress("https://example.com", session=session)
+
+        assert result == "pooled content"
+        session.get.assert_called_once_with(
+            "https://example.com", timeout=10, stream=True
+        )
+        mock_get.assert_not_called()
+
+    @patch("webdown.html_parser.requests.get")
+    def test_fetch_url_max_bytes(self, mock_get: MagicMock) -> None:
+        """Test that a response growing past max_bytes is rejected."""
+        mock_get.return_value.headers = {}
+        mock_get.return_value.iter_content.return_value = [b"x" * 100 * 1024] * 3
+
+        with pytest.raises(WebdownError) as exc_info:
+            fetch_url("https://example.com", max_bytes=50 * 1024)
+        assert exc_info.value.code == ErrorCode.RESPONSE_TOO_LARGE
+
+    @patch("webdown.html_parser.requests.get")
+    def test_fetch_url_max_bytes_from_content_length(self, mock_get: MagicMock) -> None:
+        """Test that an announced oversized response is rejected unread."""
+        mock_get.return_value.headers = {"content-length": "2000000"}
+
+        with pytest.raises(WebdownError) as exc_info:
+            fetch_url("https://example.com", max_bytes=1024)
+        assert exc_info.value.code == ErrorCode.RESPONSE_TOO_LARGE
+        mock_get.return_value.iter_content.assert_not_called()
+        mock_get.return_value.close.assert_called_once()
+
+    @patch("webdown.html_parser.requests.get")
+    def test_fetch_url_cancel(self, mock_get: MagicMock) -> None:
+        """Test that setting the cancel event stops the download early."""
+        cancel = threading.Event()
+        read_chunks = []
+
+        def iter_content(chunk_size: int) -> Iterator[bytes]:
+            for i in range(10):
+                read_chunks.append(i)
+                if i == 2:
+                    cancel.set()
+                yield b"chunk"
+
+        mock_get.return_value.headers = {}
+        mock_get.return_value.iter_content.side_effect = iter_content
+
+        with pytest.raises(WebdownError) as exc_info:
+            fetch_url("https://example.com", cancel=cancel)
+        assert exc_info.value.code == ErrorCode.REQUEST_CANCELLED
+        assert read_chunks == [0, 1, 2]
+
+    @patch("webdown.html_parser.requests.get")
+    def test_fetch_url_chunks_max_bytes(self, mock_get: MagicMock) -> None:
+        """Test that streamed responses are limited by max_bytes too."""
+        mock_get.return_value.headers = {}
+        mock_get.return_value.encoding = "utf-8"
+        mock_get.return_value.iter_content.return_value = [b"<p>x</p>"] * 4
+
+        chunks = fetch_url_chunks("https://example.com", max_bytes=20)
+
+        with pytest.raises(WebdownError) as exc_info:
+            list(chunks)
+        assert exc_info.value.code == ErrorCode.RESPONSE_TOO_LARGE
+        mock_get.return_value.close.assert_called_once()
+
+    def test_fetch_url_chunks_without_charset(  # type: ignore[no-untyped-def]
+        self, requests_mock
+    ) -> None:
+        """Test that a text/html response without a charset is read as UTF-8."""
+        requests_mock.get(
+            "https://example.com",
+            content="<h1>Café — naïve</h1>".encode("utf-8"),
+            headers={"Content-Type": "text/html"},
+        )
+
+        assert "".join(fetch_url_chunks("https://example.com")) == (
+            "<h1>Café — naïve</h1>"
+        )
+
+    def test_fetch_url_chunks_with_declared_charset(  # type: ignore[no-untyped-def]
+        self, requests_mock
+    ) -> None:
+        """Test that a charset declared in Content-Type is used for decoding."""
+        requests_mock.get(
+            "https://example.com",
+            content="<p>Café</p>".encode("latin-1"),
+            headers={"Content-Type": 'text/html; charset="ISO-8859-1"'},
+        )
+
+        assert "".join(fetch_url_chunks("https://example.com")) == "<p>Café</p>"
+
     @patch("webdown.html_parser.fetch_url_with_progress")
     def test_fetch_url(self, mock_fetch: MagicMock) -> None:
         """Test the simplified fetch_url wrapper."""
@@ -244,48 +364,15 @@ class TestCssSelectors:
         assert exc_info.value.code == ErrorCode.CSS_SELECTOR_INVALID
         assert "Error applying CSS selector" in str(exc_info.value)
 
+    def test_extract_content_matches_str_serialization(self) -> None:
+        """Test selected elements serialize exactly like str(element)."""
+        html = (
+            '<main><p title="a &quot;b&quot; &amp; c">1 &lt;b&gt; 2 &amp; 3</p>'
+            "<br/><script>if (a < b && c) run();</script></main><main>x</main>"
+        )
 
-class TestStreaming:
-    """Tests for streaming-related functions."""
-
-    @patch("webdown.html_parser.requests.head")
-    def test_check_streaming_needed_small(self, mock_head: MagicMock) -> None:
-        """Test checking if streaming is needed for small content."""
-        # Setup mock for small content
-        mock_response = MagicMock()
-        mock_response.headers = {"content-length": "5000000"}  # 5MB
-        mock_head.return_value = mock_response
-
-        # Should return False for content under threshold
-        assert _check_streaming_needed("https://example.com") is False
-
-    @patch("webdown.html_parser.requests.head")
-    def test_check_streaming_needed_large(self, mock_head: MagicMock) -> None:
-        """Test checking if streaming is needed for large content."""
-        # Setup mock for large content
-        mock_response = MagicMock()
-        mock_response.headers = {"content-length": "15000000"}  # 15MB
-        mock_head.return_value = mock_response
-
-        # Should return True for content over threshold
-        assert _check_streaming_needed("https://example.com") is True
-
-    @patch("webdown.html_parser.requests.head")
-    def test_check_streaming_needed_no_length(self, mock_head: MagicMock) -> None:
-        """Test checking if streaming is needed when content-length is missing."""
-        # Setup mock for response without content-length
-        mock_response = MagicMock()
-        mock_response.headers = {}
-        mock_head.return_value = mock_response
-
-        # Should default to False when content-length is missing
-        assert _check_streaming_needed("https://example.com") is False
-
-    @patch("webdown.html_parser.requests.head")
-    def test_check_streaming_needed_exception(self, mock_head: MagicMock) -> None:
-        """Test checking if streaming is needed when request fails."""
-        # Setup mock to raise exception
-        mock_head.side_effect = requests.exceptions.RequestException("Error")
+        result = extract_content_with_css(html, "main")
 
-        # Should default to False on error
-        assert _check_streaming_needed("https://example.com") is False
+        soup = BeautifulSoup(html, "html.parser")
+        assert result == "".join(str(element) for element in soup.select("main"))
+        assert "&lt;b&gt;" in result
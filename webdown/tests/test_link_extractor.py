@@ -1,11 +1,15 @@
 """Tests for the link_extractor module."""
 
+from urllib.parse import urlparse, urlunparse
+
 import pytest
 
 from webdown.config import WebdownError
 from webdown.link_extractor import (
     ScopeType,
     _get_base_domain,
+    cached_urlparse,
+    extract_and_filter_links,
     extract_links,
     filter_links_by_scope,
     get_url_depth,
@@ -78,6 +82,18 @@ class TestExtractLinks:
         links = extract_links(html, "https://example.com/")
         assert len(links) == 0
 
+    def test_skip_data_links(self) -> None:
+        """Test that data: links are skipped."""
+        html = '<a href="data:text/html,hello">Inline</a>'
+        links = extract_links(html, "https://example.com/")
+        assert len(links) == 0
+
+    def test_relative_links_need_web_base(self) -> None:
+        """Test that relative links only resolve against an http(s) base URL."""
+        html = '<a href="/page">Page</a><a href="https://example.com/abs">Abs</a>'
+        links = extract_links(html, "ftp://example.com/")
+        assert links == ["https://example.com/abs"]
+
     def test_only_http_https(self) -> None:
         """Test that only http/https links are extracted."""
         html = """
@@ -91,6 +107,57 @@ class TestExtractLinks:
         assert "ftp://example.com/file" not in links
 
 
+class TestExtractAndFilterLinks:
+    """Tests for extract_and_filter_links function."""
+
+    def test_dedupes_by_normalized_url(self) -> None:
+        """Test that links are keyed by normalized URL, keeping the first."""
+        html = """
+            <a href="/page/">Page</a>
+            <a href="/page#top">Page again</a>
+            <a href="https://EXAMPLE.com/page">Page once more</a>
+            <a href="/other">Other</a>
+        """
+        links = extract_and_filter_links(
+            html,
+            "https://example.com/",
+            "https://example.com/",
+            ScopeType.SAME_SUBDOMAIN,
+        )
+        assert links == {
+            "https://example.com/page": "https://example.com/page/",
+            "https://example.com/other": "https://example.com/other",
+        }
+
+    def test_applies_scope(self) -> None:
+        """Test that out-of-scope links are dropped."""
+        html = '<a href="/docs/a">A</a><a href="https://other.com/b">B</a>'
+        links = extract_and_filter_links(
+            html,
+            "https://example.com/",
+            "https://example.com/",
+            ScopeType.SAME_DOMAIN,
+        )
+        assert list(links.values()) == ["https://example.com/docs/a"]
+
+
+class TestCachedUrlparse:
+    """Tests for cached_urlparse function."""
+
+    def test_matches_urlparse(self) -> None:
+        """Test that cached parsing gives the same result as urlparse."""
+        url = "https://Example.com:8080/docs/page?q=1#frag"
+        assert cached_urlparse(url) == urlparse(url)
+
+    def test_repeated_urls_hit_cache(self) -> None:
+        """Test that parsing the same URL twice is served from the cache."""
+        url = "https://example.com/cached-page"
+        cached_urlparse(url)
+        hits = cached_urlparse.cache_info().hits
+        cached_urlparse(url)
+        assert cached_urlparse.cache_info().hits == hits + 1
+
+
 class TestNormalizeUrl:
     """Tests for normalize_url function."""
 
@@ -104,6 +171,14 @@ class TestNormalizeUrl:
         url = normalize_url("https://example.com/page#section")
         assert url == "https://example.com/page"
 
+    def test_repeated_url_is_cached(self) -> None:
+        """Test that normalizing the same URL again is served from the cache."""
+        url = "https://example.com/cached/nav/"
+        first = normalize_url(url)
+        hits = normalize_url.cache_info().hits
+        assert normalize_url(url) == first
+        assert normalize_url.cache_info().hits == hits + 1
+
     def test_remove_trailing_slash(self) -> None:
         """Test that trailing slashes are removed (except root)."""
         url = normalize_url("https://example.com/page/")
@@ -124,6 +199,35 @@ class TestNormalizeUrl:
         url = normalize_url("https://example.com/page?foo=bar")
         assert url == "https://example.com/page?foo=bar"
 
+    @pytest.mark.parametrize(
+        "url",
+        [
+            "https://Example.com:8080/a/b/?q=1#frag",
+            "http://example.com?#",
+            "https://example.com//double//",
+            "https://user:pw@Example.com/p?x=/y#z?w",
+            "https://example.com/p;params?q=1",
+            "http://[::1]:8000/path/",
+            "https://exämple.com/päge/",
+            "HTTP://EXAMPLE.COM/Page/",
+        ],
+    )
+    def test_matches_urlparse_normalization(self, url: str) -> None:
+        """Test that the fast path agrees with urlparse-based normalization."""
+        parsed = urlparse(url)
+        path = parsed.path.rstrip("/") if parsed.path != "/" else parsed.path
+        expected = urlunparse(
+            (
+                parsed.scheme.lower(),
+                parsed.netloc.lower(),
+                path or "/",
+                parsed.params,
+                parsed.query,
+                "",
+            )
+        )
+        assert normalize_url(url) == expected
+
 
 class TestFilterLinksByScope:
     """Tests for filter_links_by_scope function."""
@@ -189,6 +293,22 @@ class TestFilterLinksByScope:
         )
         assert len(filtered) == 2
 
+    def test_path_prefix_without_literal_match(self) -> None:
+        """Test links that only match after parsing are still kept."""
+        links = [
+            "http://example.com/docs/page1",
+            "https://EXAMPLE.com/docs/page2",
+            "https://example.com/docs",
+            "https://example.com/docsearch",
+            "https://other.com/docs/page3",
+        ]
+        filtered = filter_links_by_scope(
+            links,
+            "https://example.com/docs/",
+            ScopeType.PATH_PREFIX,
+        )
+        assert filtered == links[:3]
+
 
 class TestGetBaseDomain:
     """Tests for _get_base_domain function."""
@@ -246,6 +366,20 @@ class TestGetUrlDepth:
         depth = get_url_depth("https://example.com/docs/page", "https://example.com/")
         assert depth == 2
 
+    def test_ignores_empty_segments(self) -> None:
+        """Test doubled slashes do not add depth."""
+        depth = get_url_depth(
+            "https://example.com/docs//guide/intro", "https://example.com//docs/"
+        )
+        assert depth == 2
+
+    def test_diverging_paths(self) -> None:
+        """Test depth counts from the last shared segment."""
+        depth = get_url_depth(
+            "https://example.com/blog/post", "https://example.com/docs/guide"
+        )
+        assert depth == 2
+
 
 class TestParseSitemap:
     """Tests for parse_sitemap function."""
@@ -294,3 +428,59 @@ class TestParseSitemap:
         )
         with pytest.raises(WebdownError):
             parse_sitemap("https://example.com/sitemap.xml")
+
+    def test_parse_sitemap_index(  # type: ignore[no-untyped-def]
+        self, requests_mock
+    ) -> None:
+        """Test that sitemap indexes are followed to their child sitemaps."""
+        ns = "http://www.sitemaps.org/schemas/sitemap/0.9"
+        requests_mock.get(
+            "https://example.com/sitemap.xml",
+            text=f"""<sitemapindex xmlns="{ns}">
+                <sitemap><loc>https://example.com/sitemap1.xml</loc></sitemap>
+                <sitemap><loc>https://example.com/sitemap2.xml</loc></sitemap>
+            </sitemapindex>""",
+        )
+        for i in (1, 2):
+            requests_mock.get(
+                f"https://example.com/sitemap{i}.xml",
+                text=f"""<urlset xmlns="{ns}">
+                    <url><loc>https://example.com/page{i}</loc></url>
+                </urlset>""",
+            )
+
+        urls = parse_sitemap("https://example.com/sitemap.xml")
+        assert urls == ["https://example.com/page1", "https://example.com/page2"]
+
+    def test_parse_sitemap_without_namespace(  # type: ignore[no-untyped-def]
+        self, requests_mock
+    ) -> None:
+        """Test that un-namespaced <loc> elements are used as a fallback."""
+        requests_mock.get(
+            "https://example.com/sitemap.xml",
+            text="<pages><loc>https://example.com/a</loc><loc>/b</loc></pages>",
+        )
+        urls = parse_sitemap("https://example.com/sitemap.xml")
+        assert urls == ["https://example.com/a"]
+
+    def test_parse_sitemap_index_child_error(  # type: ignore[no-untyped-def]
+        self, requests_mock
+    ) -> None:
+        """Test that a failing child sitemap raises a WebdownError."""
+        ns = "http://www.sitemaps.org/schemas/sitemap/0.9"
+        requests_mock.get(
+            "https://example.com/sitemap.xml",
+            text=f"""<sitemapindex xmlns="{ns}">
+                <sitemap><loc>https://example.com/good.xml</loc></sitemap>
+                <sitemap><loc>https://example.com/missing.xml</loc></sitemap>
+            </sitemapindex>""",
+        )
+        requests_mock.get(
+            "https://example.com/good.xml",
+            text=f'<urlset xmlns="{ns}"><url><loc>https://example.com/a</loc>'
+            "</url></urlset>",
+        )
+        requests_mock.get("https://example.com/missing.xml", status_code=404)
+
+        with pytest.raises(WebdownError):
+            parse_sitemap("https://example.com/sitemap.xml")
@@ -3,13 +3,16 @@
 # mypy: disable-error-code="no-untyped-def,arg-type"
 import pytest
 
-from webdown.config import WebdownError
+from webdown.config import DocumentOptions, WebdownConfig, WebdownError
 from webdown.markdown_converter import (
     _create_toc_link,
     _extract_headings,
     _find_code_blocks,
     _validate_body_width,
     generate_table_of_contents,
+    html_chunks_to_markdown,
+    html_to_markdown,
+    make_converter,
 )
 
 
@@ -80,6 +83,11 @@ class TestTableOfContents:
         assert link == "heading-2"
         assert used_links["heading"] == 2
 
+    def test_toc_link_strips_punctuation(self):
+        """Test that TOC links drop punctuation but keep word characters."""
+        assert _create_toc_link("What's New? (v2.0)", {}) == "whats-new-v20"
+        assert _create_toc_link("Café — Menu", {}) == "café--menu"
+
     def test_empty_headings(self):
         """Test TOC generation with no headings."""
         markdown = "This is text without any headings."
@@ -102,3 +110,50 @@ class TestBodyWidth:
         with pytest.raises(WebdownError) as exc_info:
             _validate_body_width(-10)
         assert "must be a non-negative integer" in str(exc_info.value)
+
+
+class TestMakeConverter:
+    """Tests for make_converter function."""
+
+    def test_matches_html_to_markdown(self):
+        """Test that a specialized converter gives the same output."""
+        config = WebdownConfig(
+            include_links=False,
+            document_options=DocumentOptions(include_toc=True, compact_output=True),
+        )
+        convert = make_converter(config)
+        for html in ["<h1>One</h1><p><a href='/x'>link</a></p>", "<h2>Two</h2>"]:
+            assert convert(html) == html_to_markdown(html, config)
+
+    def test_validates_once_up_front(self):
+        """Test that invalid options are rejected when the converter is built."""
+        config = WebdownConfig(document_options=DocumentOptions(body_width=-1))
+        with pytest.raises(WebdownError):
+            make_converter(config)
+
+
+class TestHtmlChunksToMarkdown:
+    """Tests for html_chunks_to_markdown function."""
+
+    HTML = (
+        "<h1>Title &amp; more</h1><p>Some <b>bold</b> and <em>emphasis</em> with "
+        "<a href='/x'>a link</a>.</p><pre>code\n  block</pre>"
+        "<ul><li>one</li><li>two</li></ul><main><p>Main text</p></main>"
+    )
+
+    @pytest.mark.parametrize("size", [1, 3, 7, 50, 10_000])
+    def test_matches_html_to_markdown(self, size):
+        """Test that any chunking gives the same output as the whole document."""
+        config = WebdownConfig(document_options=DocumentOptions(include_toc=True))
+        chunks = [self.HTML[i : i + size] for i in range(0, len(self.HTML), size)]
+        assert html_chunks_to_markdown(chunks, config) == html_to_markdown(
+            self.HTML, config
+        )
+
+    def test_css_selector(self):
+        """Test that a CSS selector is applied to the joined document."""
+        config = WebdownConfig(css_selector="main")
+        chunks = [self.HTML[i : i + 5] for i in range(0, len(self.HTML), 5)]
+        result = html_chunks_to_markdown(chunks, config)
+        assert result == html_to_markdown(self.HTML, config)
+        assert "Title" not in result
@@ -2,13 +2,20 @@
 
 import json
 import os
+import shutil
 import tempfile
+from dataclasses import asdict
 from datetime import datetime
 
+import pytest
+
 from webdown.config import OutputFormat
 from webdown.output_manager import (
+    BackgroundWriter,
+    CrawlCheckpoint,
     CrawledPage,
     CrawlResult,
+    _page_to_dict,
     _sanitize_path,
     ensure_output_directory,
     get_relative_path,
@@ -48,6 +55,12 @@ class TestUrlToFilepath:
         )
         assert path == "/output/example.com/index.md"
 
+    def test_matches_os_path_join(self) -> None:
+        """Test output directory forms are joined like os.path.join."""
+        for output_dir in ["/output", "/output/", "output", "."]:
+            path = url_to_filepath("https://example.com/docs/page", output_dir)
+            assert path == os.path.join(output_dir, "example.com", "docs/page.md")
+
     def test_url_without_path(self) -> None:
         """Test URL without path becomes index."""
         path = url_to_filepath(
@@ -117,6 +130,10 @@ class TestSanitizePath:
         assert ">" not in result
         assert ":" not in result
 
+    def test_control_characters(self) -> None:
+        """Test control characters are replaced."""
+        assert _sanitize_path("docs/a\x00b/c\x1fd\x7f") == "docs/a_b/c_d_"
+
     def test_empty_path(self) -> None:
         """Test empty path returns index."""
         assert _sanitize_path("") == "index"
@@ -173,6 +190,26 @@ class TestCrawlResult:
         assert result.error_count == 0
         assert result.skipped_count == 0
 
+    def test_status_counts(self) -> None:
+        """Test counting all statuses in one pass."""
+        result = CrawlResult(
+            pages=[
+                CrawledPage(
+                    url=f"https://example.com/{i}",
+                    output_path=f"{i}.md",
+                    title=None,
+                    crawled_at=datetime.now(),
+                    depth=0,
+                    status=status,
+                )
+                for i, status in enumerate(["success", "skipped", "success", "error"])
+            ]
+        )
+        counts = result.status_counts()
+        assert counts["success"] == 2
+        assert counts["error"] == 1
+        assert counts["skipped"] == 1
+
 
 class TestWriteManifest:
     """Tests for write_manifest function."""
@@ -210,6 +247,49 @@ class TestWriteManifest:
             assert len(manifest["pages"]) == 1
             assert manifest["pages"][0]["url"] == "https://example.com/page"
 
+    def test_page_entries_match_dataclass(self) -> None:
+        """Test page entries contain every CrawledPage field."""
+        page = CrawledPage(
+            url="https://example.com/page",
+            output_path="example.com/page.md",
+            title=None,
+            crawled_at=datetime(2025, 1, 15, 10, 30, 0),
+            depth=2,
+            status="error",
+            error_message="Failed",
+        )
+        expected = asdict(page)
+        expected["crawled_at"] = "2025-01-15T10:30:00"
+
+        assert _page_to_dict(page) == expected
+
+    def test_large_manifest_is_compact(self) -> None:
+        """Test manifests with many pages are written without indentation."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            result = CrawlResult(
+                pages=[
+                    CrawledPage(
+                        url=f"https://example.com/{i}",
+                        output_path=f"example.com/{i}.md",
+                        title=None,
+                        crawled_at=datetime(2025, 1, 15, 10, 30, 0),
+                        depth=1,
+                        status="success",
+                    )
+                    for i in range(501)
+                ],
+            )
+
+            manifest_path = write_manifest(result, tmpdir)
+
+            with open(manifest_path) as f:
+                data = f.read()
+
+            assert "\n" not in data
+            manifest = json.loads(data)
+            assert manifest["crawl_info"]["total_pages"] == 501
+            assert manifest["pages"][500]["url"] == "https://example.com/500"
+
 
 class TestWriteOutputFile:
     """Tests for write_output_file function."""
@@ -224,6 +304,145 @@ class TestWriteOutputFile:
             with open(filepath) as f:
                 assert f.read() == "test content"
 
+    def test_recreates_removed_directory(self) -> None:
+        """Test that a cached directory removed later is created again."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            directory = os.path.join(tmpdir, "docs")
+            write_output_file(os.path.join(directory, "first.md"), "first")
+            shutil.rmtree(directory)
+
+            filepath = os.path.join(directory, "second.md")
+            write_output_file(filepath, "second")
+
+            with open(filepath) as f:
+                assert f.read() == "second"
+
+    def test_replaces_existing_file_without_leftovers(self) -> None:
+        """Test that rewriting a file replaces it and leaves no temporary file."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filepath = os.path.join(tmpdir, "page.md")
+            write_output_file(filepath, "first")
+            write_output_file(filepath, "second")
+
+            with open(filepath) as f:
+                assert f.read() == "second"
+            assert os.listdir(tmpdir) == ["page.md"]
+
+    def test_failed_write_keeps_previous_content(self) -> None:
+        """Test that a write failing midway leaves the existing file intact."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filepath = os.path.join(tmpdir, "page.md")
+            write_output_file(filepath, "original")
+
+            with pytest.raises(UnicodeEncodeError):
+                write_output_file(filepath, "partial \ud800")
+
+            with open(filepath) as f:
+                assert f.read() == "original"
+            assert os.listdir(tmpdir) == ["page.md"]
+
+
+class TestBackgroundWriter:
+    """Tests for BackgroundWriter class."""
+
+    def test_writes_all_files_on_close(self) -> None:
+        """Test that all submitted files are written once the writer closes."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            paths = [os.path.join(tmpdir, "docs", f"page{i}.md") for i in range(5)]
+            with BackgroundWriter() as writer:
+                for i, path in enumerate(paths):
+                    writer.submit(path, f"content {i}")
+
+            for i, path in enumerate(paths):
+                with open(path) as f:
+                    assert f.read() == f"content {i}"
+            assert writer.failures == {}
+
+    def test_collects_write_failures(self) -> None:
+        """Test that write errors are recorded instead of raised."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            blocker = os.path.join(tmpdir, "blocker")
+            write_output_file(blocker, "not a directory")
+            bad_path = os.path.join(blocker, "page.md")
+
+            with BackgroundWriter() as writer:
+                writer.submit(bad_path, "content")
+
+            assert bad_path in writer.failures
+
+    def test_keeps_writing_after_callback_error(self) -> None:
+        """Test that a failing callback is recorded and later writes still run."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            first = os.path.join(tmpdir, "first.md")
+            second = os.path.join(tmpdir, "second.md")
+
+            def fail() -> None:
+                raise ValueError("callback failed")
+
+            with BackgroundWriter() as writer:
+                writer.submit(first, "first", fail)
+                writer.submit(second, "second")
+
+            assert writer.failures == {first: "callback failed"}
+            assert os.path.exists(second)
+
+
+class TestCrawlCheckpoint:
+    """Tests for CrawlCheckpoint class."""
+
+    def test_records_are_restored(self) -> None:
+        """Test that recorded pages are restored by a new checkpoint."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "checkpoint.jsonl")
+            page = CrawledPage(
+                url="https://example.com/page",
+                output_path="example.com/page.md",
+                title="Page",
+                crawled_at=datetime(2025, 1, 15, 10, 30, 0),
+                depth=1,
+                status="success",
+            )
+            with CrawlCheckpoint(path) as checkpoint:
+                checkpoint.record(page, ["https://example.com/next"])
+
+            # Simulate an interruption in the middle of writing an entry
+            with open(path, "a", encoding="utf-8") as f:
+                f.write('{"page": {"url": "https://exa')
+
+            with CrawlCheckpoint(path) as checkpoint:
+                assert checkpoint.restore("https://example.com/page") == (
+                    page,
+                    ["https://example.com/next"],
+                )
+                assert checkpoint.restore("https://example.com/other") is None
+
+    def test_skips_foreign_entries(self) -> None:
+        """Test that JSON lines that are not checkpoint entries are ignored."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "other.jsonl")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write('{"event": "start"}\n')
+                f.write('{"page": {"url": "https://example.com/"}, "links": []}\n')
+                f.write("[1, 2, 3]\n")
+
+            with CrawlCheckpoint(path) as checkpoint:
+                assert checkpoint.restore("https://example.com/") is None
+
+    def test_disabled_without_path(self) -> None:
+        """Test that a checkpoint without a path records nothing."""
+        checkpoint = CrawlCheckpoint(None)
+        page = CrawledPage(
+            url="https://example.com/",
+            output_path="example.com/index.md",
+            title=None,
+            crawled_at=datetime.now(),
+            depth=0,
+            status="success",
+        )
+        checkpoint.record(page, [])
+        assert checkpoint.restore("https://example.com/") is None
+        checkpoint.close()
+
 
 class TestGetRelativePath:
     """Tests for get_relative_path function."""
@@ -243,3 +462,26 @@ class TestEnsureOutputDirectory:
             filepath = os.path.join(tmpdir, "a", "b", "c", "file.md")
             ensure_output_directory(filepath)
             assert os.path.isdir(os.path.dirname(filepath))
+
+    def test_manifest_after_output_directory_removed(self) -> None:
+        """Test that the manifest is written after its directory was removed."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_dir = os.path.join(tmpdir, "out")
+            write_manifest(CrawlResult(), output_dir)
+            shutil.rmtree(output_dir)
+
+            manifest_path = write_manifest(CrawlResult(), output_dir)
+
+            assert os.path.exists(manifest_path)
+
+    def test_checkpoint_after_directory_removed(self) -> None:
+        """Test that a checkpoint can be opened after its directory was removed."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "out", "checkpoint.jsonl")
+            ensure_output_directory(path)
+            shutil.rmtree(os.path.dirname(path))
+
+            with CrawlCheckpoint(path):
+                pass
+
+            assert os.path.exists(path)
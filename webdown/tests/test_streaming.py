@@ -6,28 +6,25 @@ import requests_mock
 
 from webdown.config import OutputFormat, WebdownConfig
 from webdown.converter import convert_url
-from webdown.html_parser import _check_streaming_needed, fetch_url
+from webdown.html_parser import fetch_url
 
 
 class TestStreamingFunctionality:
     """Tests for streaming functionality."""
 
-    def test_check_streaming_needed(self) -> None:
-        """Test that _check_streaming_needed detects large documents."""
+    def test_convert_url_sends_single_request(self) -> None:
+        """Test that a page is converted from one GET without a size probe."""
         with requests_mock.Mocker() as m:
-            # Mock head request for small document
-            m.head("https://example.com/small", headers={"content-length": "100000"})
-
-            # Mock head request for large document
-            m.head("https://example.com/large", headers={"content-length": "15000000"})
+            m.get(
+                "https://example.com/large",
+                text="<html><body><h1>Large Document</h1></body></html>",
+                headers={"content-length": "15000000"},
+            )
 
-            # Document below 10MB threshold should not trigger streaming
-            result_small = _check_streaming_needed("https://example.com/small")
-            assert result_small is False
+            result = convert_url("https://example.com/large")
 
-            # Document above 10MB threshold should trigger streaming
-            result_large = _check_streaming_needed("https://example.com/large")
-            assert result_large is True
+            assert "# Large Document" in result
+            assert [request.method for request in m.request_history] == ["GET"]
 
     @patch("requests.get")
     def test_streaming_for_large_documents(self, mock_get: MagicMock) -> None:
@@ -41,17 +38,13 @@ class TestStreamingFunctionality:
         mock_response.iter_content.return_value = [html_content.encode("utf-8")]
         mock_get.return_value = mock_response
 
-        # Patch the _check_streaming_needed function to return True
-        with patch("webdown.html_parser._check_streaming_needed") as mock_check:
-            mock_check.return_value = True
+        # Test fetch_url
+        result = fetch_url("https://example.com/large")
 
-            # Test fetch_url
-            result = fetch_url("https://example.com/large")
-
-            # Verify streaming was used
-            mock_get.assert_called_once()
-            assert mock_get.call_args[1].get("stream") is True
-            assert html_content in result
+        # Verify streaming was used
+        mock_get.assert_called_once()
+        assert mock_get.call_args[1].get("stream") is True
+        assert html_content in result
 
     @patch("requests.get")
     def test_streaming_progress_bar(self, mock_get: MagicMock) -> None:
@@ -92,10 +85,11 @@ class TestStreamingFunctionality:
 
         with (
             patch(
-                "webdown.converter.fetch_url", return_value=html_content
+                "webdown.converter.fetch_url_chunks", return_value=[html_content]
             ) as mock_fetch,
             patch(
-                "webdown.converter.html_to_markdown", return_value=markdown_content
+                "webdown.converter.html_chunks_to_markdown",
+                return_value=markdown_content,
             ) as mock_html_to_md,
         ):
 
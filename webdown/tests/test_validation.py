@@ -52,6 +52,14 @@ class TestURLValidation:
         with pytest.raises(ValueError, match="Invalid URL scheme"):
             validate_url("ftp://example.com")
 
+    def test_urls_outside_fast_path(self) -> None:
+        """Test URLs the prefix check cannot decide alone."""
+        assert validate_url("http://[::1]/docs") == "http://[::1]/docs"
+        with pytest.raises(ValueError, match="Invalid URL"):
+            validate_url("http:///path")
+        with pytest.raises(ValueError, match="Invalid URL"):
+            validate_url("http://?q=1")
+
 
 class TestCSSSelector:
     """Tests for CSS selector validation."""
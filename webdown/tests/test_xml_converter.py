@@ -29,6 +29,12 @@ class TestEscapeXML:
         )  # Double quotes may not be escaped by saxutils.escape
         assert escape_xml("<tag>content</tag>") == "&lt;tag&gt;content&lt;/tag&gt;"
 
+    def test_text_without_special_characters(self) -> None:
+        """Test that text with nothing to escape is returned unchanged."""
+        text = "Plain text with 'quotes' and \"double quotes\""
+        assert escape_xml(text) is text
+        assert escape_xml("") == ""
+
 
 class TestIndentXML:
     """Tests for XML indentation function."""
@@ -40,6 +46,11 @@ class TestIndentXML:
         assert indent_xml("text", level=2) == "    text"
         assert indent_xml("<tag>", level=3) == "      <tag>"
 
+    def test_indent_xml_outside_precomputed_levels(self) -> None:
+        """Test indentation beyond the precomputed levels and below zero."""
+        assert indent_xml("text", level=10) == " " * 20 + "text"
+        assert indent_xml("text", level=-1) == "text"
+
 
 class TestExtractMarkdownTitle:
     """Tests for Markdown title extraction."""
@@ -176,6 +187,21 @@ class TestProcessCodeBlock:
         assert "    &lt;div&gt;Hello &amp; World&lt;/div&gt;" in result
         assert result[-1] == "  </code>"
 
+    def test_lines_are_listed_separately(self) -> None:
+        """Test that each line of code is a separate, indented entry."""
+        code = "```\nif a < b:\n\n    pass\n```"
+        match = re.match(r"```(\w*)\n(.*?)```", code, re.DOTALL)
+        assert match is not None
+        result = process_code_block(match, 0)
+        assert result == [
+            "<code>",
+            "  if a &lt; b:",
+            "  ",
+            "      pass",
+            "  ",
+            "</code>",
+        ]
+
 
 class TestProcessParagraph:
     """Tests for paragraph processing."""
@@ -240,6 +266,27 @@ class TestProcessSection:
         assert result[2] == "    <text>Para 1</text>"
         assert result[3] == "  </section>"
 
+    def test_section_keeps_multiline_paragraph_whole(self) -> None:
+        """Test that only code lines, not text lines, are listed separately."""
+        match = re.match(
+            r"^(#+\s+)(.+?)$\n*(.*)",
+            "# Heading\nLine 1\nLine 2\n\n```\na\nb\n```",
+            re.DOTALL | re.MULTILINE,
+        )
+        assert match is not None
+        result = process_section(match, 0)
+        assert result == [
+            "<section>",
+            "  <heading>Heading</heading>",
+            "  <text>Line 1\nLine 2</text>",
+            "  <code>",
+            "    a",
+            "    b",
+            "    ",
+            "  </code>",
+            "</section>",
+        ]
+
     def test_section_with_empty_paragraphs(self) -> None:
         """Test processing a section with empty paragraphs."""
 
@@ -391,6 +438,16 @@ After heading."""
         assert "<heading>Title</heading>" in result
         assert "<text>After heading.</text>" in result
 
+    def test_content_before_first_heading_follows_metadata(self) -> None:
+        """Test that pre-heading content is placed inside the content element."""
+        markdown = "Before heading.\n\n# Title\nAfter heading."
+        result = markdown_to_claude_xml(markdown, source_url="https://example.com")
+        lines = result.split("\n")
+        content_index = lines.index("  <content>")
+        assert lines.index("  </metadata>") < content_index
+        assert lines[content_index + 1] == "    <text>Before heading.</text>"
+        assert lines[content_index + 2] == "    <section>"
+
     def test_with_empty_paragraphs_before_heading(self) -> None:
         """Test converting Markdown with empty paragraphs before the first heading."""
         markdown = """Content.
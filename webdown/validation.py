@@ -9,6 +9,8 @@ from typing import Optional
 
 from bs4 import BeautifulSoup
 
+_WEB_URL_PREFIXES = ("http://", "https://")
+
 
 def validate_url(url: str) -> str:
     """Validate a URL and return it if valid.
@@ -25,6 +27,19 @@ def validate_url(url: str) -> str:
     if not url:
         raise ValueError("URL cannot be empty")
 
+    # Plain http(s) URLs with a host are valid without a full parse. Anything
+    # urlparse might treat specially (whitespace, non-ASCII, IPv6 brackets)
+    # takes the general path below.
+    if (
+        url.startswith(_WEB_URL_PREFIXES)
+        and url.isascii()
+        and url.isprintable()
+        and "[" not in url
+        and "]" not in url
+        and _netloc_after_scheme(url)
+    ):
+        return url
+
     parsed = urllib.parse.urlparse(url)
 
     # Check if URL has a scheme and netloc
@@ -43,6 +58,21 @@ def validate_url(url: str) -> str:
     return url
 
 
+def _netloc_after_scheme(url: str) -> str:
+    """Return the network location of a URL known to start with http(s)://.
+
+    Args:
+        url: URL starting with http:// or https://
+
+    Returns:
+        The text between "//" and the first "/", "?" or "#"
+    """
+    rest = url[url.index("//") + 2 :]
+    for delimiter in "/?#":
+        rest = rest.partition(delimiter)[0]
+    return rest
+
+
 def validate_css_selector(selector: str) -> str:
     """Validate a CSS selector.
 
@@ -15,6 +15,15 @@ import re
 import xml.sax.saxutils as saxutils
 from typing import List, Match, Optional
 
+# Patterns used to split Markdown into titles, sections, paragraphs and code
+_TITLE_RE = re.compile(r"^#\s+(.+)$", re.MULTILINE)
+_SECTION_HEADING_RE = re.compile(r"^(#+\s+)(.+?)$", re.MULTILINE)
+_PARAGRAPH_SPLIT_RE = re.compile(r"\n\n+")
+_CODE_BLOCK_RE = re.compile(r"```(\w*)\n(.*?)```", re.DOTALL)
+
+# Indentation strings for the nesting levels of the generated document
+_INDENTS = tuple("  " * level for level in range(8))
+
 
 def escape_xml(text: str) -> str:
     """Escape XML special characters.
@@ -25,6 +34,10 @@ def escape_xml(text: str) -> str:
     Returns:
         Escaped text
     """
+    # Most text has nothing to escape; membership tests are cheaper than
+    # the three replacements saxutils.escape always performs
+    if "&" not in text and "<" not in text and ">" not in text:
+        return text
     return saxutils.escape(text)
 
 
@@ -38,8 +51,12 @@ def indent_xml(text: str, level: int = 0) -> str:
     Returns:
         Indented text
     """
-    indent_str = "  " * level
-    return f"{indent_str}{text}"
+    if level < 0:
+        return text
+    try:
+        return _INDENTS[level] + text
+    except IndexError:
+        return "  " * level + text
 
 
 def extract_markdown_title(markdown: str) -> Optional[str]:
@@ -51,7 +68,7 @@ def extract_markdown_title(markdown: str) -> Optional[str]:
     Returns:
         Title text or None if no title found
     """
-    title_match = re.search(r"^#\s+(.+)$", markdown, re.MULTILINE)
+    title_match = _TITLE_RE.search(markdown)
     if title_match:
         return title_match.group(1).strip()
     return None
@@ -76,8 +93,8 @@ def generate_metadata_xml(title: Optional[str], source_url: Optional[str]) -> Li
             indent_xml(f"<source>{escape_xml(source_url)}</source>", 1)
         )
 
-    # Always include date
-    today = datetime.datetime.now().strftime("%Y-%m-%d")
+    # Always include date (ISO format, YYYY-MM-DD)
+    today = datetime.date.today().isoformat()
     metadata_items.append(indent_xml(f"<date>{today}</date>", 1))
 
     result = [indent_xml("<metadata>", 1)]
@@ -97,24 +114,61 @@ def process_code_block(match: Match[str], level: int) -> List[str]:
     Returns:
         List of XML strings for the code block
     """
+    result: List[str] = []
+    _emit_code_block(result, match, level)
+    return _split_code_lines(result)
+
+
+def _emit_code_block(out: List[str], match: Match[str], level: int) -> None:
+    """Append the XML for a code block to out.
+
+    The indented code lines are appended as a single newline-joined string.
+
+    Args:
+        out: List the XML strings are appended to
+        match: Regex match object for the code block
+        level: Indentation level
+    """
     lang = match.group(1).strip()
     code = match.group(2)
 
-    result = []
-
     # Opening tag
     if lang:
-        result.append(indent_xml(f'<code language="{lang}">', level))
+        out.append(indent_xml(f'<code language="{lang}">', level))
     else:
-        result.append(indent_xml("<code>", level))
+        out.append(indent_xml("<code>", level))
 
-    # Code content - indent each line
-    for line in code.split("\n"):
-        result.append(indent_xml(escape_xml(line), level + 1))
+    # Code content - escape it once and indent every line in a single pass
+    prefix = indent_xml("", level + 1)
+    out.append(prefix + escape_xml(code).replace("\n", "\n" + prefix))
 
     # Closing tag
-    result.append(indent_xml("</code>", level))
+    out.append(indent_xml("</code>", level))
+
+
+def _split_code_lines(parts: List[str]) -> List[str]:
+    """Split the code bodies in emitted XML into one entry per line.
 
+    _emit_code_block appends a code body as a single newline-joined entry
+    right after its opening tag. Other entries, such as multi-line text
+    paragraphs, are kept whole. Text is escaped, so only a real code element
+    can start with "<code".
+
+    Args:
+        parts: XML strings as appended by the _emit_* helpers
+
+    Returns:
+        The same XML strings with every code body split into lines
+    """
+    result: List[str] = []
+    in_code = False
+    for part in parts:
+        if in_code:
+            result.extend(part.split("\n"))
+            in_code = False
+        else:
+            result.append(part)
+            in_code = part.lstrip().startswith("<code")
     return result
 
 
@@ -131,30 +185,38 @@ def process_paragraph(text: str, level: int) -> str:
     return indent_xml(f"<text>{escape_xml(text)}</text>", level)
 
 
-def _process_paragraphs(content: str, level: int) -> List[str]:
-    """Process content into paragraphs, handling empty paragraphs and code blocks.
+def _emit_paragraphs(out: List[str], content: str, level: int) -> None:
+    """Append content as paragraphs to out, skipping empty ones.
+
+    Paragraphs that start with a fenced code block become code elements.
 
     Args:
+        out: List the XML strings are appended to
         content: The text content to process
         level: The indentation level for XML elements
-
-    Returns:
-        List of XML strings representing the processed paragraphs
     """
-    result = []
-    paragraphs = re.split(r"\n\n+", content)
+    text_open = indent_xml("<text>", level)
+    paragraphs = _PARAGRAPH_SPLIT_RE.split(content)
+
+    # Without a fence anywhere, every non-empty paragraph is text
+    if "```" not in content:
+        out.extend(
+            f"{text_open}{escape_xml(para)}</text>"
+            for para in paragraphs
+            if para.strip()
+        )
+        return
+
     for para in paragraphs:
         if not para.strip():
             continue
 
-        # Check if it's a code block
-        code_match = re.match(r"```(\w*)\n(.*?)```", para, re.DOTALL)
+        # Check if it's a code block; only a fence can start one
+        code_match = _CODE_BLOCK_RE.match(para) if para.startswith("```") else None
         if code_match:
-            result.extend(process_code_block(code_match, level))
+            _emit_code_block(out, code_match, level)
         else:
-            result.append(process_paragraph(para, level))
-
-    return result
+            out.append(f"{text_open}{escape_xml(para)}</text>")
 
 
 def process_section(match: Match[str], level: int) -> List[str]:
@@ -169,25 +231,32 @@ def process_section(match: Match[str], level: int) -> List[str]:
     """
     heading_text = match.group(2).strip()
     content = match.group(3).strip() if match.group(3) else ""
+    result: List[str] = []
+    _emit_section(result, heading_text, content, level)
+    return _split_code_lines(result)
+
 
-    result = []
+def _emit_section(out: List[str], heading_text: str, content: str, level: int) -> None:
+    """Append the XML for a section to out.
 
+    Args:
+        out: List the XML strings are appended to
+        heading_text: Stripped heading text
+        content: Stripped section content
+        level: Indentation level
+    """
     # Open section
-    result.append(indent_xml("<section>", level))
+    out.append(indent_xml("<section>", level))
 
     # Add heading
-    result.append(
-        indent_xml(f"<heading>{escape_xml(heading_text)}</heading>", level + 1)
-    )
+    out.append(indent_xml(f"<heading>{escape_xml(heading_text)}</heading>", level + 1))
 
     # Process content
     if content:
-        result.extend(_process_paragraphs(content, level + 1))
+        _emit_paragraphs(out, content, level + 1)
 
     # Close section
-    result.append(indent_xml("</section>", level))
-
-    return result
+    out.append(indent_xml("</section>", level))
 
 
 def markdown_to_claude_xml(
@@ -210,71 +279,38 @@ def markdown_to_claude_xml(
     Returns:
         Claude XML formatted content
     """
-    xml_parts = []
-
     # Use a fixed document tag - simplifying configuration
     doc_tag = "claude_documentation"
 
     # Root element
-    xml_parts.append(f"<{doc_tag}>")
-
-    # Extract title
-    title = extract_markdown_title(markdown)
+    xml_parts = [f"<{doc_tag}>"]
 
-    # Add metadata if requested
+    # Add metadata if requested; the title is only needed there
     if include_metadata:
+        title = extract_markdown_title(markdown)
         xml_parts.extend(generate_metadata_xml(title, source_url))
 
     # Begin content section
     xml_parts.append(indent_xml("<content>", 1))
 
-    # Process all content by section
-
-    # Extract all section headings
-    section_matches = list(re.finditer(r"^(#+\s+)(.+?)$", markdown, re.MULTILINE))
-
-    if section_matches:
-        # Process each section including content following the heading
-        for i, match in enumerate(section_matches):
-            heading_start = match.start()
-            heading = match.group(0)
-            # If this is the last heading, content goes to the end
-            if i == len(section_matches) - 1:
-                content = markdown[heading_start + len(heading) :].strip()
-            else:
-                # Otherwise content goes until the next heading
-                next_heading_start = section_matches[i + 1].start()
-                content = markdown[
-                    heading_start + len(heading) : next_heading_start
-                ].strip()
-
-            # Create section with heading and content
-            section_xml = []
-            section_xml.append(indent_xml("<section>", 2))
-            section_xml.append(
-                indent_xml(
-                    f"<heading>{escape_xml(match.group(2).strip())}</heading>", 3
-                )
-            )
-
-            # Process content inside this section
-            if content:
-                section_xml.extend(_process_paragraphs(content, 3))
-
-            section_xml.append(indent_xml("</section>", 2))
-            xml_parts.extend(section_xml)
-
-        # Process content before the first heading (if any)
-        if section_matches[0].start() > 0:
-            pre_content = markdown[: section_matches[0].start()].strip()
-            if pre_content:
-                # Add pre-heading content at the beginning
-                pre_parts = _process_paragraphs(pre_content, 2)
-
-                xml_parts = xml_parts[:2] + pre_parts + xml_parts[2:]
-    else:
+    # Walk the headings once, emitting in document order: content before the
+    # first heading, then each section up to the start of the next heading
+    heading: Optional[str] = None
+    position = 0
+    for match in _SECTION_HEADING_RE.finditer(markdown):
+        content = markdown[position : match.start()].strip()
+        if heading is None:
+            _emit_paragraphs(xml_parts, content, 2)
+        else:
+            _emit_section(xml_parts, heading, content, 2)
+        heading = match.group(2).strip()
+        position = match.end()
+
+    if heading is None:
         # No headings - just process all content
-        xml_parts.extend(_process_paragraphs(markdown, 2))
+        _emit_paragraphs(xml_parts, markdown, 2)
+    else:
+        _emit_section(xml_parts, heading, markdown[position:].strip(), 2)
 
     # Close content and root
     xml_parts.append(indent_xml("</content>", 1))